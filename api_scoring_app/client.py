@@ -0,0 +1,140 @@
+"""
+Tiny client for a running scoring server (`run.py serve`), forwards a spec and prints the report.
+
+Only the standard library is imported here, so a client call costs interpreter startup only,
+`run.py client ...` doesn't import the scoring pipeline at all.
+"""
+
+import os
+import sys
+import json
+import socket
+import argparse
+import http.client
+
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_URL = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+
+# server address used when neither --url nor --socket is given
+SERVER_ENV_VAR = "API_SCORING_SERVER"
+
+
+class ScoringServerError(Exception):
+    """Server couldn't be reached, or it failed the request."""
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """
+    HTTP connection over unix socket.
+    """
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class ScoringClient:
+    """
+    Client for scoring server, `address` is `http://host:port` or `unix:/path/to/socket`.
+    """
+
+    def __init__(self, address: str = DEFAULT_URL, timeout: Optional[float] = 120.0):
+        self.address = address
+        self.timeout = timeout
+
+    def score(self, data: bytes, compressed: bool = False) -> tuple[int, dict[str, Any]]:
+        """
+        Send the spec (JSON or YAML bytes), returns HTTP status and JSON payload (report, or `{"error": ...}`).
+        """
+
+        headers = {"Content-Type": "application/octet-stream"}
+        if compressed:
+            headers["Content-Encoding"] = "gzip"
+
+        return self._request("POST", "/score", data, headers)
+
+    def health(self) -> dict[str, Any]:
+        return self._request("GET", "/health")[1]
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self.address.startswith("unix:"):
+            return UnixHTTPConnection(self.address[len("unix:"):], timeout=self.timeout)
+
+        url = urlsplit(self.address)
+        if url.scheme == "https":
+            return http.client.HTTPSConnection(url.netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(url.netloc, timeout=self.timeout)
+
+    def _request(self, method: str, path: str, body: Optional[bytes] = None, headers: Optional[dict[str, str]] = None) -> tuple[int, dict[str, Any]]:
+        connection = self._connection()
+        try:
+            connection.request(method, path, body=body, headers=headers or {})
+            response = connection.getresponse()
+            payload = response.read()
+        except OSError as e:
+            raise ScoringServerError(f"Scoring server is not reachable at {self.address}: {e}")
+        finally:
+            connection.close()
+
+        try:
+            return response.status, json.loads(payload)
+        except ValueError:
+            raise ScoringServerError(f"Unexpected response from scoring server ({response.status}): {payload[:200]!r}")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="run.py client",
+        description="Score a specification with a running scoring server (see `run.py serve`)."
+    )
+    parser.add_argument("spec_source", help='Spec file path ("-" for stdin)')
+    parser.add_argument("--url", help=f"Server URL (default: ${SERVER_ENV_VAR} or {DEFAULT_URL})")
+    parser.add_argument("--socket", help="Unix socket path of the server, instead of --url")
+    parser.add_argument("--output-file", "-o", help="Report output file path (default: stdout)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds to wait for the report (default: 120)")
+    args = parser.parse_args(argv)
+
+    if args.socket:
+        address = f"unix:{args.socket}"
+    else:
+        address = args.url or os.environ.get(SERVER_ENV_VAR) or DEFAULT_URL
+
+    if args.spec_source == "-":
+        data = sys.stdin.buffer.read()
+    else:
+        if not os.path.isfile(args.spec_source):
+            print(f"File not found: {args.spec_source}")
+            return 1
+        with open(args.spec_source, "rb") as file:
+            data = file.read()
+
+    try:
+        status, payload = ScoringClient(address, timeout=args.timeout).score(data, compressed=args.spec_source.endswith(".gz"))
+    except ScoringServerError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    if status != 200:
+        print(payload.get("error", payload))
+        return 1
+
+    # same formatting as `JsonReportGenerator.generate_report`
+    report = json.dumps(payload, indent=2)
+
+    if args.output_file:
+        with open(args.output_file, "w") as file:
+            file.write(report)
+    else:
+        print(report)
+
+    return 0
@@ -8,5 +8,6 @@ from api_scoring_app.core.subscorers import BaseScorer
 from api_scoring_app.core.validator import IValidator
 from api_scoring_app.core.parser import IParser
 from api_scoring_app.core.config import Config
+from api_scoring_app.core.cache import ISpecCache
 
-__all__ = ["ISpecLoader", "BaseScorer", "IValidator", "IParser", "Config"]
\ No newline at end of file
+__all__ = ["ISpecLoader", "BaseScorer", "IValidator", "IParser", "Config", "ISpecCache"]
\ No newline at end of file
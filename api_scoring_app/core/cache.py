@@ -0,0 +1,45 @@
+from typing import Optional, Protocol
+from dataclasses import dataclass, field
+
+from api_scoring_app.core.subscorers import ScoringReport
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters of the scoring cache.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def __str__(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses, {self.evictions} evictions"
+
+
+@dataclass
+class CacheEntry:
+    """
+    Cached reports of a specification, with the external files (`$ref`-ed documents) they depend on.
+    """
+
+    reports: list[ScoringReport]
+
+    # absolute path -> SHA-256 of the file contents at scoring time
+    dependencies: dict[str, str] = field(default_factory=dict)
+
+
+class ISpecCache(Protocol):
+    """
+    Interface for caching scoring reports, keyed by specification content (+ scoring setup) hash.
+    Entries whose dependencies changed since are misses.
+    """
+
+    stats: CacheStats
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        pass
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        pass
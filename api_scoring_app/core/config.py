@@ -1,6 +1,12 @@
 from dataclasses import dataclass, field
 from typing import Tuple, Type
-from openapi_pydantic import Operation, Parameter, RequestBody, Response
+
+
+def _description_types() -> Tuple[Type, ...]:
+    # openapi_pydantic is heavy to import, it's loaded once config is actually created
+    from openapi_pydantic import Operation, Parameter, RequestBody, Response
+
+    return (Operation, Parameter, RequestBody, Response)
 
 @dataclass
 class Config:
@@ -10,7 +16,7 @@ class Config:
 
     # description subscorer
     DESCRIPTION_SUBSCORER_NAME: str = "Descriptions & Documentation"
-    DESCRIPTION_TYPES_TO_CHECK: Tuple[Type, ...] = field(default_factory=lambda: (Operation, Parameter, RequestBody, Response))
+    DESCRIPTION_TYPES_TO_CHECK: Tuple[Type, ...] = field(default_factory=_description_types)
     DESCRIPTION_MIN_DESCRIPTION_LENGTH: int = 5
 
     # examples subscorer
@@ -46,3 +52,6 @@ class Config:
     MULT_SEVERITY_HIGH: float = 0.7
     MULT_SEVERITY_CRITICAL: float = 0.5
     MULT_SEVERITY_ZERO: float = 0.0
+
+    # issue aggregation, path histogram keeps the largest buckets, the rest are summed up under "other"
+    AGGREGATE_HISTOGRAM_MAX_BUCKETS: int = 20
@@ -0,0 +1,33 @@
+from typing import Any, Callable, Optional
+from dataclasses import dataclass, field
+
+
+@dataclass
+class StageTiming:
+    """
+    Measurements of single pipeline stage.
+
+    `name` of nested stage is prefixed with its parents (`validate/resolve`), `peak_memory`
+    is the largest amount of memory (bytes) allocated on top of what was there when stage started,
+    `None` if memory wasn't traced.
+    """
+
+    name: str
+    wall: float
+    cpu: float
+    peak_memory: Optional[int] = None
+
+    # perf_counter value when stage started, for ordering
+    start: float = field(default=0.0, repr=False, compare=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "stage": self.name,
+            "wall": round(self.wall, 6),
+            "cpu": round(self.cpu, 6),
+            "peak_memory": self.peak_memory,
+        }
+
+
+# called with every finished stage, e.g. to forward it to metrics system
+StageHook = Callable[[StageTiming], None]
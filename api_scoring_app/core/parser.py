@@ -1,105 +1,168 @@
-from typing import Protocol, Dict
-
-from openapi_pydantic import OpenAPI
+from __future__ import annotations
 
+from typing import TYPE_CHECKING, Protocol, Dict, Iterable, Optional, Sequence
 from dataclasses import dataclass, field
-from openapi_pydantic import OpenAPI, RequestBody, Response, Server, SecurityScheme
+
+if TYPE_CHECKING:
+    from openapi_pydantic import OpenAPI, OAuthFlow, SecurityScheme
 
 
+@dataclass(frozen=True, slots=True)
 class WrappedSecurityRequirement:
     """
-    Wrapper class for `schema` + `path`.
+    Wrapper class for `schema` + `path`. Equality and hash are by name only.
     """
 
-    def __init__(self, name: str, path: list[str]):
-        self.name = name
-        self.path = path
+    name: str
+    path: Sequence[str] = field(compare=False)
     
     def __str__(self) -> str:
-        return f"{self.name}: {self.path}"
-    
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, WrappedSecurityRequirement):
-            return False
-        
-        return self.name == other.name
+        return f"{self.name}: {list(self.path)}"
 
 
+@dataclass(frozen=True, slots=True)
 class WrappedTag:
     """
-    Wrapper class for tag `name` + `path`.
+    Wrapper class for tag `name` + `path`. Equality and hash are by name only.
     """
 
-    def __init__(self, name: str, path: list[str]):
-        self.name = name
-        self.path = path
-    
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, WrappedTag):
-            return False
-        
-        return self.name == other.name
+    name: str
+    path: Sequence[str] = field(compare=False)
     
     def __str__(self) -> str:
         path_as_str = ' -> '.join(self.path)
         return f"{path_as_str}: {self.name}"
 
 
+# Projections of the OpenAPI model nodes, holding only what subscorers read of them, so
+# `ParsedSpecification` doesn't keep the validated model alive once parsing is done.
+
+@dataclass(frozen=True, slots=True)
+class ContentProjection:
+    """
+    Request body or response: media types of `content` (None if not defined), whether any of them
+    has an example (`example`, `examples` or schema `example`), and `required` of request body.
+    """
+
+    content_types: Optional[tuple[str, ...]]
+    has_example: bool = False
+    required: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class OAuthFlowProjection:
+    """
+    OAuth flow, field names as in the model, `scopes` are scope names only.
+    """
+
+    authorizationUrl: Optional[str] = None
+    tokenUrl: Optional[str] = None
+    scopes: tuple[str, ...] = ()
+
+    @staticmethod
+    def from_model(flow: Optional[OAuthFlow]) -> Optional[OAuthFlowProjection]:
+        if flow is None:
+            return None
+        return OAuthFlowProjection(flow.authorizationUrl, flow.tokenUrl, tuple(flow.scopes or ()))
+
+
+@dataclass(frozen=True, slots=True)
+class OAuthFlowsProjection:
+    implicit: Optional[OAuthFlowProjection] = None
+    password: Optional[OAuthFlowProjection] = None
+    clientCredentials: Optional[OAuthFlowProjection] = None
+    authorizationCode: Optional[OAuthFlowProjection] = None
+
+
+@dataclass(frozen=True, slots=True)
+class SecuritySchemeProjection:
+    """
+    Security scheme, field names as in the model.
+    """
 
-@dataclass
+    type: str
+    name: Optional[str] = None
+    security_scheme_in: Optional[str] = None
+    scheme: Optional[str] = None
+    flows: Optional[OAuthFlowsProjection] = None
+    openIdConnectUrl: Optional[str] = None
+
+    @staticmethod
+    def from_model(scheme: SecurityScheme) -> SecuritySchemeProjection:
+        flows = None
+        if scheme.flows is not None:
+            flows = OAuthFlowsProjection(
+                implicit=OAuthFlowProjection.from_model(scheme.flows.implicit),
+                password=OAuthFlowProjection.from_model(scheme.flows.password),
+                clientCredentials=OAuthFlowProjection.from_model(scheme.flows.clientCredentials),
+                authorizationCode=OAuthFlowProjection.from_model(scheme.flows.authorizationCode),
+            )
+
+        return SecuritySchemeProjection(
+            type=scheme.type,
+            name=scheme.name,
+            security_scheme_in=scheme.security_scheme_in,
+            scheme=scheme.scheme,
+            flows=flows,
+            openIdConnectUrl=scheme.openIdConnectUrl,
+        )
+
+
+@dataclass(slots=True)
 class ParsedDescription:
     # paths
-    missing_descriptions: list[list[str]] = field(default_factory=list)
+    missing_descriptions: list[Sequence[str]] = field(default_factory=list)
 
     # paths
-    short_descriptions: list[list[str]] = field(default_factory=list)
+    short_descriptions: list[Sequence[str]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedExamples:
     # [(path, request_body)]
-    request_bodies: list[tuple[list[str], RequestBody]] = field(default_factory=list)
+    request_bodies: list[tuple[Sequence[str], ContentProjection]] = field(default_factory=list)
     
     # [(path, response)]
-    responses: list[tuple[list[str], Response]] = field(default_factory=list)
+    responses: list[tuple[Sequence[str], ContentProjection]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedMisc:
     paths_defined: list[str] = field(default_factory=list)
-    servers_defined: list[Server] = field(default_factory=list)
+    # server urls
+    servers_defined: list[str] = field(default_factory=list)
     tags_defined: list[WrappedTag] = field(default_factory=list)
     tags_from_operations: list[WrappedTag] = field(default_factory=list)
-    undefined_tags: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedPaths:
     path_to_operations: Dict[str, list[str]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedResponseCodes:
-    responses: list[tuple[list[str], Response]] = field(default_factory=list)
-    missing_responses: list[list[str]] = field(default_factory=list)
+    # [(path, response)], status code is the last path segment
+    responses: list[tuple[Sequence[str], ContentProjection]] = field(default_factory=list)
+    missing_responses: list[Sequence[str]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedSchema:
-    free_form_schemas: list[list[str]] = field(default_factory=list)
-    missing_schemas: list[list[str]] = field(default_factory=list)
+    free_form_schemas: list[Sequence[str]] = field(default_factory=list)
+    missing_schemas: list[Sequence[str]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedSecurity:
-    schemes: list[tuple[list[str], SecurityScheme]] = field(default_factory=list)
+    schemes: list[tuple[Sequence[str], SecuritySchemeProjection]] = field(default_factory=list)
 
     defined_schemes: list[WrappedSecurityRequirement] = field(default_factory=list)
     referenced_schemes: list[WrappedSecurityRequirement] = field(default_factory=list)
     operation_referenced_schemes: list[WrappedSecurityRequirement] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedSpecification:
     descriptions: ParsedDescription = field(default_factory=ParsedDescription)
     examples: ParsedExamples = field(default_factory=ParsedExamples)
@@ -112,5 +175,5 @@ class ParsedSpecification:
 
 
 class IParser(Protocol):
-    def parse(self, spec: OpenAPI) -> ParsedSpecification:
+    def parse(self, spec: OpenAPI, sections: Optional[Iterable[str]] = None) -> ParsedSpecification:
         pass
@@ -6,6 +6,10 @@ class ISpecLoader(Protocol):
     def load(self) -> dict[str, Any]:
         pass
 
+    def digest(self) -> str:
+        """Content hash (hex) of the raw specification bytes."""
+        pass
+
 class SpecLoaderException(Exception):
     """General exception class for spec loader errors."""
     pass
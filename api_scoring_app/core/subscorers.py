@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import FrozenInstanceError, dataclass, field
 
 from abc import ABC, abstractmethod
-from dataclasses import field
-from typing import Optional
+from typing import Any, ClassVar, Iterable, Optional, Sequence
 
 from api_scoring_app.core.parser import ParsedSpecification
 from api_scoring_app.core.config import Config
@@ -23,52 +22,286 @@ class IssueSeverity(Enum):
     ZERO = Config.MULT_SEVERITY_ZERO
 
 
-@dataclass
-class Issue:
+# severities by their code, issues store the code (small int) instead of the member
+_SEVERITIES: tuple[IssueSeverity, ...] = tuple(IssueSeverity)
+_SEVERITY_CODES: dict[IssueSeverity, int] = {severity: code for code, severity in enumerate(_SEVERITIES)}
+
+
+@dataclass(frozen=True, slots=True)
+class IssueTemplate:
     """
-    Issue emitted by each scorer.
+    Message, severity and suggestion shared by all issues of a rule. `message` is `str.format`
+    pattern, filled with issue's `path` (`{path}`) and `args` (`{0}`, `{1}`, ...) when read.
     """
 
     message: str
     severity: IssueSeverity
-    path: Optional[str] = field(default=None)
-    suggestion: Optional[str] = field(default=None)
+    suggestion: Optional[str] = None
+
+    def issue(self, path: Optional[str | Sequence[str]] = None, *args: Any) -> Issue:
+        return Issue(self, self.severity, path, None, args)
+
+    def render(self, path: Optional[str], args: tuple[Any, ...]) -> str:
+        return self.message.format(*args, path=path)
+
+
+class Issue:
+    """
+    Issue emitted by each scorer, immutable.
+
+    `message` is either plain text, or `IssueTemplate` rendered on access, so the text of
+    templated issues isn't stored per issue. `path` is either a string, or path segments (e.g.
+    parser's `PathNode`) joined on access, so issues that are only counted are never formatted.
+    """
+
+    __slots__ = ("_message", "_severity", "_path", "_suggestion", "args")
+
+    _message: str | IssueTemplate
+    _severity: int
+    _path: Optional[str | Sequence[str]]
+    _suggestion: Optional[str]
+    args: tuple[Any, ...]
+
+    def __init__(self, message: str | IssueTemplate, severity: IssueSeverity, path: Optional[str | Sequence[str]] = None,
+                 suggestion: Optional[str] = None, args: tuple[Any, ...] = ()) -> None:
+        # slot descriptors, `__setattr__` is frozen
+        _set_message(self, message)
+        _set_severity(self, _SEVERITY_CODES[severity])
+        _set_path(self, path)
+        _set_suggestion(self, suggestion)
+        _set_args(self, args)
+
+    @property
+    def message(self) -> str:
+        message = self._message
+        if type(message) is IssueTemplate:
+            return message.render(self.path, self.args)
+        return message
+
+    @property
+    def path(self) -> Optional[str]:
+        path = self._path
+        if path is None or type(path) is str:
+            return path
+        return " -> ".join(path)
+
+    def rendered(self) -> tuple[str, Optional[str]]:
+        """
+        Message and path, the path is joined once for both.
+        """
+        path = self.path
+        message = self._message
+        if type(message) is IssueTemplate:
+            return message.render(path, self.args), path
+        return message, path
+
+    @property
+    def severity(self) -> IssueSeverity:
+        return _SEVERITIES[self._severity]
+
+    @property
+    def suggestion(self) -> Optional[str]:
+        message = self._message
+        if self._suggestion is None and type(message) is IssueTemplate:
+            return message.suggestion
+        return self._suggestion
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # default slot state restore would go through the frozen `__setattr__`
+        return _restore_issue, (self._message, self._severity, self._path, self._suggestion, self.args)
+
+    def _key(self) -> tuple[Any, ...]:
+        return (self.message, self._severity, self.path, self.suggestion)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not Issue:
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"Issue(message={self.message!r}, severity={self.severity}, path={self.path!r}, suggestion={self.suggestion!r})"
+
+
+_set_message, _set_severity, _set_path, _set_suggestion, _set_args = (getattr(Issue, name).__set__ for name in Issue.__slots__)
+
+
+def _restore_issue(message: str | IssueTemplate, severity: int, path: Optional[str | Sequence[str]],
+                   suggestion: Optional[str], args: tuple[Any, ...]) -> Issue:
+    return Issue(message, _SEVERITIES[severity], path, suggestion, args)
+
+
+@dataclass(slots=True)
+class IssueAggregate:
+    """
+    Issues of a single rule in aggregation mode: exact count and histogram by top-level path,
+    only the first `kept` of them are kept in the report. Histogram is limited to the largest
+    `Config.AGGREGATE_HISTOGRAM_MAX_BUCKETS` buckets, the rest are summed up under `other`.
+    """
+
+    rule: str
+    count: int = 0
+    kept: int = 0
+
+    # e.g. "paths -> /pets" -> 12
+    path_histogram: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def omitted(self) -> int:
+        return self.count - self.kept
+
+
+def top_level_path(path: Optional[str | Sequence[str]]) -> str:
+    """
+    First two segments of the issue path (e.g. `paths -> /pets`, `components -> schemas`),
+    given as string or segments.
+    """
+
+    if not path:
+        return "N/A"
+    if type(path) is str:
+        path = path.split(" -> ", 2)
+    return " -> ".join(path[:2])
 
 
 class ScoringReport:
     """
     Scoring report of the OpenAPI specification.
+
+    With `issue_cap`, issues of every rule (`bulk_add_issues` call) are aggregated: only the first
+    `issue_cap` of them are kept, the rest are only counted. Scoring doesn't depend on it, a rule
+    costs the same points however many issues it has.
     """
 
-    def __init__(self, subscorer: str, points: float) -> None:
+    __slots__ = ("subscorer", "points", "issues", "max_points", "issue_cap", "aggregates", "counts_by_severity", "error")
+
+    def __init__(self, subscorer: str, points: float, issue_cap: Optional[int] = None) -> None:
         self.subscorer = subscorer
         self.points = points
         self.issues: list[Issue] = []
 
         self.max_points = points
 
+        self.issue_cap = issue_cap
+        self.aggregates: list[IssueAggregate] = []
+
+        # exact issue counts by severity code (`IssueSeverity` declaration order), issues left out
+        # by aggregation included
+        self.counts_by_severity: list[int] = [0] * len(_SEVERITIES)
+
+        # set when subscorer failed or timed out, report holds no real findings then
+        self.error: Optional[str] = None
+
+    @property
+    def severity_counts(self) -> dict[IssueSeverity, int]:
+        return dict(zip(_SEVERITIES, self.counts_by_severity))
+
+    @property
+    def issue_count(self) -> int:
+        return sum(self.counts_by_severity)
+
     def add_issue(self, issue: Issue) -> None:
         self.issues.append(issue)
+        self.counts_by_severity[issue._severity] += 1
         self._update_points(issue.severity.value)
 
-    def bulk_add_issues(self, issues: list[Issue], severity: IssueSeverity) -> None:
+    def bulk_add_issues(self, issues: Iterable[Issue], severity: IssueSeverity, rule: Optional[str] = None) -> None:
+        """
+        Add issues of a single rule, points are reduced once by `severity` if there is any.
+        """
+
+        if self.issue_cap is not None:
+            if self._aggregate_issues(issues, rule or severity.name):
+                self._update_points(severity.value)
+            return
+
+        issues = list(issues)
         if not issues:
             return
 
         self.issues.extend(issues)
+        counts = self.counts_by_severity
+        for issue in issues:
+            counts[issue._severity] += 1
         self._update_points(severity.value)
+
+    def _aggregate_issues(self, issues: Iterable[Issue], rule: str) -> bool:
+        """
+        Keep the first `issue_cap` issues, count all of them. Returns whether there was any.
+        """
+
+        aggregate = IssueAggregate(rule)
+        histogram = aggregate.path_histogram
+        counts = self.counts_by_severity
+
+        for issue in issues:
+            aggregate.count += 1
+            counts[issue._severity] += 1
+
+            key = top_level_path(issue._path)
+            histogram[key] = histogram.get(key, 0) + 1
+
+            if aggregate.kept < self.issue_cap:
+                self.issues.append(issue)
+                aggregate.kept += 1
+
+        if not aggregate.count:
+            return False
+
+        if len(histogram) > Config.AGGREGATE_HISTOGRAM_MAX_BUCKETS:
+            buckets = sorted(histogram.items(), key=lambda bucket: -bucket[1]) # stable, ties keep first-seen order
+            aggregate.path_histogram = dict(buckets[:Config.AGGREGATE_HISTOGRAM_MAX_BUCKETS])
+            aggregate.path_histogram["other"] = sum(count for _, count in buckets[Config.AGGREGATE_HISTOGRAM_MAX_BUCKETS:])
+
+        self.aggregates.append(aggregate)
+        return True
     
     def _update_points(self, multiplier: float) -> None:
         self.points *= multiplier
 
 
+@dataclass(frozen=True)
+class ScoringContext:
+    """
+    Settings of a single scoring run, passed along with the parsed specification, so that
+    scorers shared between runs (and threads) hold no per-run state.
+    """
+
+    # aggregation mode of the reports, see `ScoringReport`
+    issue_cap: Optional[int] = None
+
+
+DEFAULT_CONTEXT = ScoringContext()
+
+
 class BaseScorer(ABC):
     """Base class for all scorers."""
+
+    # name used for the report, when scorer couldn't produce one itself
+    name: ClassVar[str] = ""
+
+    # `ParsedSpecification` sections the scorer reads, parser collects only these (None for all of them)
+    sections: ClassVar[Optional[tuple[str, ...]]] = None
     
     def __init__(self, points: float) -> None:
         self.points = points
 
+    def required_sections(self) -> Optional[frozenset[str]]:
+        """
+        `ParsedSpecification` sections needed to score, None if all of them are.
+        """
+
+        return None if self.sections is None else frozenset(self.sections)
+
     @abstractmethod
-    def score_spec(self, parsed_specification: ParsedSpecification) -> list[ScoringReport]:
+    def score_spec(self, parsed_specification: ParsedSpecification, context: ScoringContext = DEFAULT_CONTEXT) -> list[ScoringReport]:
         pass
 
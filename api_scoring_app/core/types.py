@@ -1,5 +1,7 @@
+from collections.abc import Sequence, Iterable, Iterator
 from dataclasses import dataclass
 from enum import Enum
+from typing import Optional
 
 
 class NamingConvention(Enum):
@@ -9,6 +11,26 @@ class NamingConvention(Enum):
 
     KEBAB = "kebab-case"
     SNAKE = "snake_case"
+    CAMEL = "camelCase"
+
+
+class ExecutionMode(Enum):
+    """
+    How scoring engine runs its subscorers.
+    """
+
+    SEQUENTIAL = "sequential"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class ResultOrder(Enum):
+    """
+    Order of job runner result lines.
+    """
+
+    INPUT = "input"
+    COMPLETION = "completion"
 
 
 @dataclass
@@ -17,7 +39,7 @@ class MissingFieldError:
     Wrapper for security scheme error indicating missing fields for a given object
     """
 
-    path: list[str]
+    path: Sequence[str]
     parent: str
     missing_fields: list[str]
 
@@ -25,3 +47,88 @@ class MissingFieldError:
         return f"{self.parent} missing fields: {self.missing_fields}"
 
 
+
+
+class PathNode(Sequence[str]):
+    """
+    Persistent path inside the specification, node holds its own key and a pointer to its parent.
+
+    Siblings share their common prefix, so creating a child costs one small object instead of
+    a copy of the whole path. Behaves like read-only `Sequence[str]`, keys are materialized
+    only when path is iterated, e.g. rendered with `" -> ".join(path)`.
+    """
+
+    __slots__ = ("parent", "key", "depth")
+
+    def __init__(self, parent: Optional["PathNode"] = None, key: Optional[str] = None):
+        self.parent = parent
+        self.key = key
+        self.depth = 0 if parent is None else parent.depth + 1
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[str]) -> "PathNode":
+        node = ROOT_PATH
+        for key in keys:
+            node = cls(node, key)
+        return node
+
+    def child(self, key: str) -> "PathNode":
+        return PathNode(self, key)
+
+    def to_list(self) -> list[str]:
+        keys = []
+        node = self
+        while node.parent is not None:
+            keys.append(node.key)
+            node = node.parent
+        keys.reverse()
+        return keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_list())
+
+    def __len__(self) -> int:
+        return self.depth
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self.to_list()[index])
+
+        if index < 0:
+            index += self.depth
+        if not 0 <= index < self.depth:
+            raise IndexError("path index out of range")
+
+        # walk up from the end, cheap for the last few keys
+        node = self
+        for _ in range(self.depth - 1 - index):
+            node = node.parent
+        return node.key
+
+    def __add__(self, keys: Iterable[str]) -> "PathNode":
+        node = self
+        for key in keys:
+            node = PathNode(node, key)
+        return node
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PathNode):
+            if self is other:
+                return True
+            if self.depth != other.depth:
+                return False
+        elif not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return self.to_list() == list(other)
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.to_list()))
+
+    def __str__(self) -> str:
+        return " -> ".join(self.to_list())
+
+    def __repr__(self) -> str:
+        return f"PathNode({self.to_list()!r})"
+
+
+ROOT_PATH = PathNode()
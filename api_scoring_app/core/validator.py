@@ -1,8 +1,11 @@
-from typing import Protocol
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Protocol, Union
 from dataclasses import dataclass, field
 from typing import Optional
 
-from openapi_pydantic import OpenAPI
+if TYPE_CHECKING:
+    from openapi_pydantic import OpenAPI
 
 
 @dataclass
@@ -44,6 +47,9 @@ class ValidationResult:
     specification: Optional[OpenAPI] = field(default=None)
     errors: list[ValidationError] = field(default_factory=list)
 
+    # absolute paths of external files the specification references (`other.yaml#/...`)
+    documents: list[str] = field(default_factory=list)
+
     def set_specification(self, specification: OpenAPI) -> None:
         self.specification = specification
 
@@ -54,7 +60,11 @@ class ValidationResult:
         return len(self.errors) == 0
 
 
+# Already loaded specification object, or its raw (json/yaml) text/bytes.
+SpecInput = Union[dict[str, Any], str, bytes]
+
+
 class IValidator(Protocol):
 
-    def validate(self, spec_string: str) -> ValidationResult:
+    def validate(self, spec: SpecInput, source: Optional[str] = None) -> ValidationResult:
         pass
@@ -0,0 +1,4 @@
+from api_scoring_app.infra.cache.disk_cache import DiskSpecCache
+from api_scoring_app.infra.cache.fingerprint import cache_key, file_digest
+
+__all__ = ["DiskSpecCache", "cache_key", "file_digest"]
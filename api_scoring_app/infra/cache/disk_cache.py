@@ -0,0 +1,120 @@
+import os
+import pickle
+import logging
+import tempfile
+import threading
+
+from typing import Optional
+
+from api_scoring_app.core.cache import CacheEntry, CacheStats
+from api_scoring_app.infra.cache.fingerprint import file_digest
+
+logger = logging.getLogger(__name__)
+
+
+class DiskSpecCache:
+    """
+    Content-addressed on-disk cache of scoring reports.
+
+    Each entry is a single pickle file named after its key. Entries are evicted
+    in least-recently-used order (by modification time, refreshed on every hit)
+    once the total size of the cache directory exceeds `max_bytes`.
+
+    Key only covers the root document, so entries also record digests of the files
+    it references: an entry is stale (dropped, counted as a miss) once any of them
+    changed or is gone.
+    """
+
+    SUFFIX = ".pickle"
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self._entry_path(key)
+
+        try:
+            with open(path, 'rb') as file:
+                entry = pickle.load(file)
+            os.utime(path) # mark as recently used
+        except FileNotFoundError:
+            self._count_miss()
+            return None
+        except Exception as e:
+            # corrupted or incompatible entry, drop it
+            logger.debug("Dropping unreadable cache entry %s: %s", path, e)
+            self._remove(path)
+            self._count_miss()
+            return None
+
+        if any(file_digest(dependency) != digest for dependency, digest in entry.dependencies.items()):
+            logger.debug("Dropping stale cache entry %s, referenced files changed", path)
+            self._remove(path)
+            self._count_miss()
+            return None
+
+        with self._lock:
+            self.stats.hits += 1
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        # write to temporary file first, so readers never see partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._entry_path(key))
+        except Exception:
+            self._remove(tmp_path)
+            raise
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits into `max_bytes`.
+        """
+
+        with self._lock:
+            entries = []
+            total_size = 0
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(self.SUFFIX):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total_size += stat.st_size
+
+            if total_size <= self.max_bytes:
+                return
+
+            entries.sort()
+            for _, size, path in entries:
+                if total_size <= self.max_bytes:
+                    break
+                self._remove(path)
+                total_size -= size
+                self.stats.evictions += 1
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + self.SUFFIX)
+
+    def _count_miss(self) -> None:
+        with self._lock:
+            self.stats.misses += 1
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
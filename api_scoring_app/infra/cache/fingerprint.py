@@ -0,0 +1,100 @@
+import os
+import enum
+import hashlib
+import dataclasses
+
+from functools import lru_cache
+from typing import Any, Optional
+
+import api_scoring_app
+
+# bump when cached payload changes shape
+CACHE_FORMAT_VERSION = 2
+
+
+def cache_key(spec_digest: str, *components: Any) -> str:
+    """
+    Cache key for a specification: its content hash + scoring setup (config, subscorers, ...) + scorer code.
+    """
+
+    sha = hashlib.sha256()
+    sha.update(f"v{CACHE_FORMAT_VERSION}\n{spec_digest}\n{code_fingerprint()}\n".encode())
+    for component in components:
+        sha.update(stable_repr(component).encode())
+        sha.update(b"\n")
+    return sha.hexdigest()
+
+
+def file_digest(path: str) -> Optional[str]:
+    """
+    SHA-256 of the file contents, read in chunks, None if it can't be read.
+    """
+
+    sha = hashlib.sha256()
+    try:
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1 << 20), b''):
+                sha.update(chunk)
+    except OSError:
+        return None
+    return sha.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def code_fingerprint() -> str:
+    """
+    Hash of the application sources, so cached reports are not reused across code changes.
+    """
+
+    package_dir = os.path.dirname(api_scoring_app.__file__)
+
+    sha = hashlib.sha256()
+    for root, dirs, files in os.walk(package_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.endswith(".py"):
+                continue
+            path = os.path.join(root, name)
+            sha.update(os.path.relpath(path, package_dir).encode())
+            with open(path, 'rb') as file:
+                sha.update(file.read())
+    return sha.hexdigest()
+
+
+def stable_repr(obj: Any) -> str:
+    """
+    Deterministic textual representation of configuration-like objects (no ids, no set ordering).
+
+    - dataclasses are represented by their init fields and their UPPERCASE class constants (e.g. `Config`),
+      fields with `metadata={"fingerprint": False}` are skipped
+    - objects of other classes are represented by their type only
+    """
+
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+        return repr(obj)
+    if isinstance(obj, enum.Enum):
+        return f"{_qualified_name(type(obj))}.{obj.name}"
+    if isinstance(obj, type):
+        return _qualified_name(obj)
+    if isinstance(obj, (list, tuple)):
+        return "[" + ", ".join(stable_repr(item) for item in obj) + "]"
+    if isinstance(obj, (set, frozenset)):
+        return "{" + ", ".join(sorted(stable_repr(item) for item in obj)) + "}"
+    if isinstance(obj, dict):
+        items = sorted((stable_repr(key), stable_repr(value)) for key, value in obj.items())
+        return "{" + ", ".join(f"{key}: {value}" for key, value in items) + "}"
+    if dataclasses.is_dataclass(obj):
+        parts = {}
+        for name in dir(type(obj)):
+            if name.isupper():
+                parts[name] = getattr(obj, name)
+        for dataclass_field in dataclasses.fields(obj):
+            if dataclass_field.init and dataclass_field.metadata.get("fingerprint", True):
+                parts[dataclass_field.name] = getattr(obj, dataclass_field.name)
+        return f"{_qualified_name(type(obj))}{stable_repr(parts)}"
+
+    return _qualified_name(type(obj))
+
+
+def _qualified_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
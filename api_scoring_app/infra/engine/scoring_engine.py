@@ -1,30 +1,274 @@
+import time
+import logging
+import threading
+
+from typing import Any, Optional
+from contextlib import ExitStack
 from dataclasses import dataclass, field
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor, BrokenExecutor, TimeoutError as FutureTimeoutError
 
 from api_scoring_app.core import BaseScorer
-from api_scoring_app.core.subscorers import ScoringReport, ParsedSpecification
+from api_scoring_app.core.types import ExecutionMode
+from api_scoring_app.core.instrumentation import StageTiming
+from api_scoring_app.core.subscorers import ScoringReport, ScoringContext, ParsedSpecification, Issue, IssueSeverity
+from api_scoring_app.infra.instrumentation import Instrumentation, Tracer, stage, current_instrumentation, active_tracer
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ScoringEngine(BaseScorer):
     """
     Default scoring engine for OpenAPI specification.
+
+    Subscorers run one after another (`SEQUENTIAL`), or concurrently in a thread/process pool.
+    Reports always come in the order subscorers were added. Subscorer that raises, or doesn't
+    finish within `subscorer_timeout` seconds (pool modes only), gets a zero-score report with
+    the error, the rest of them are not affected.
+
+    The pool is created on first use and kept for the engine's lifetime, `close()` shuts it down.
+    A timeout doesn't stop the subscorer: it keeps running (and holding its worker) until it
+    finishes, the engine only stops waiting for it.
     """
 
     subscorers: list[BaseScorer] = field(default_factory=list)
 
-    def score_spec(self, parsed_specification: ParsedSpecification) -> list[ScoringReport]:
+    # aggregation mode: keep the first `issue_cap` issues of every rule, with exact counts (None keeps all)
+    issue_cap: Optional[int] = None
+
+    # execution settings don't change the outcome, so they're left out of cache keys
+    execution_mode: ExecutionMode = field(default=ExecutionMode.SEQUENTIAL, metadata={"fingerprint": False})
+    max_workers: Optional[int] = field(default=None, metadata={"fingerprint": False})
+    subscorer_timeout: Optional[float] = field(default=None, metadata={"fingerprint": False})
+
+    # pool of the engine, created on first use
+    _executor: Optional[Executor] = field(init=False, default=None, repr=False, compare=False)
+    _executor_lock: threading.Lock = field(init=False, default_factory=threading.Lock, repr=False, compare=False)
+
+    def score_spec(self, parsed_specification: ParsedSpecification, context: Optional[ScoringContext] = None) -> list[ScoringReport]:
         """
-        Score the specification using all subscorers.
+        Score the specification using all subscorers. Without `context`, engine's own settings are used.
         """
 
+        if context is None:
+            context = ScoringContext(issue_cap=self.issue_cap)
+
+        if self.execution_mode == ExecutionMode.SEQUENTIAL or len(self.subscorers) < 2:
+            results = [self._run_subscorer(subscorer, parsed_specification, context) for subscorer in self.subscorers]
+        else:
+            results = self._run_in_pool(parsed_specification, context)
+
         reports = []
-        for subscorer in self.subscorers:
-            reports.extend(subscorer.score_spec(parsed_specification))
+        for result in results:
+            reports.extend(result)
 
         return reports
-    
+
     def add_subscorer(self, subscorer: BaseScorer) -> None:
         """
         Add a subscorer to the engine.
         """
 
         self.subscorers.append(subscorer)
+
+    def close(self) -> None:
+        """
+        Shut the pool down, waiting for subscorers still running (e.g. timed-out ones).
+        """
+
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "ScoringEngine":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def required_sections(self) -> Optional[frozenset[str]]:
+        """
+        Sections needed by any of the subscorers, None if one of them needs all.
+        """
+
+        sections: set[str] = set()
+        for subscorer in self.subscorers:
+            subscorer_sections = subscorer.required_sections()
+            if subscorer_sections is None:
+                return None
+            sections |= subscorer_sections
+
+        return frozenset(sections)
+
+    def _run_subscorer(self, subscorer: BaseScorer, parsed_specification: ParsedSpecification, context: ScoringContext) -> list[ScoringReport]:
+        try:
+            with stage(_stage_name(subscorer)):
+                return subscorer.score_spec(parsed_specification, context)
+        except Exception as e:
+            return [self._failure_report(subscorer, f"{type(e).__name__}: {e}")]
+
+    def _run_in_pool(self, parsed_specification: ParsedSpecification, context: ScoringContext) -> list[list[ScoringReport]]:
+        """
+        Submit every subscorer to the pool, collect results in submission order.
+        """
+
+        instrumentation = current_instrumentation()
+        tracer = active_tracer()
+
+        threaded = self.execution_mode == ExecutionMode.THREAD
+
+        # threads share the tracer, process workers need their own
+        observation = _WorkerObservation(
+            instrument=instrumentation is not None,
+            trace_memory=instrumentation is not None and instrumentation.trace_memory and not threaded, # tracemalloc is process-wide
+            threaded=threaded,
+            trace=tracer is not None and not threaded
+        )
+
+        executor = self._get_executor()
+        try:
+            if not (observation.instrument or observation.trace):
+                futures = [executor.submit(_score, subscorer, parsed_specification, context) for subscorer in self.subscorers]
+            else:
+                # workers measure subscorers themselves, timings and spans are merged in `_collect`
+                futures = [
+                    executor.submit(_score_observed, subscorer, parsed_specification, context, observation)
+                    for subscorer in self.subscorers
+                ]
+        except BrokenExecutor:
+            # worker process died in an earlier run, start over with a fresh pool
+            self._discard_executor(executor)
+            return self._run_in_pool(parsed_specification, context)
+
+        # all subscorers start together (pool is as big as needed by default), so they share the deadline
+        deadline = None if self.subscorer_timeout is None else time.monotonic() + self.subscorer_timeout
+
+        results = [
+            self._collect(subscorer, future, deadline, instrumentation, tracer if observation.trace else None)
+            for subscorer, future in zip(self.subscorers, futures)
+        ]
+
+        # crashed worker breaks the whole process pool, the next run gets a fresh one
+        if any(future.done() and not future.cancelled() and isinstance(future.exception(), BrokenExecutor) for future in futures):
+            self._discard_executor(executor)
+
+        return results
+
+    def _collect(self, subscorer: BaseScorer, future: Future, deadline: Optional[float],
+                 instrumentation: Optional[Instrumentation], tracer: Optional[Tracer]) -> list[ScoringReport]:
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+
+        try:
+            result = future.result(timeout=timeout)
+            if instrumentation is None and tracer is None:
+                return result
+
+            reports, timings, events = result
+            if instrumentation is not None:
+                for timing in timings:
+                    instrumentation.record(timing)
+            if tracer is not None:
+                tracer.extend(events)
+            return reports
+        except FutureTimeoutError:
+            future.cancel()
+            return [self._failure_report(subscorer, f"timed out after {self.subscorer_timeout} seconds")]
+        except Exception as e:
+            return [self._failure_report(subscorer, f"{type(e).__name__}: {e}")]
+
+    def _get_executor(self) -> Executor:
+        """
+        Pool of the engine, created on first use (or after `close()`, mode change, broken pool).
+        """
+
+        pool_type = ProcessPoolExecutor if self.execution_mode == ExecutionMode.PROCESS else ThreadPoolExecutor
+
+        with self._executor_lock:
+            if self._executor is not None and type(self._executor) is not pool_type:
+                # pool threads are joined before the next fork
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+            if self._executor is None:
+                max_workers = self.max_workers or len(self.subscorers)
+                if pool_type is ProcessPoolExecutor:
+                    self._executor = ProcessPoolExecutor(max_workers=max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="subscorer")
+            return self._executor
+
+    def _discard_executor(self, executor: Executor) -> None:
+        """
+        Drop a broken pool, its threads are joined first, so the next run doesn't fork next to them.
+        """
+
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _failure_report(self, subscorer: BaseScorer, error: str) -> ScoringReport:
+        name = subscorer.name or type(subscorer).__name__
+        logger.warning("Subscorer '%s' failed: %s", name, error)
+
+        report = ScoringReport(name, getattr(subscorer, "points", 0.0))
+        report.error = error
+        report.add_issue(Issue(
+            message=f"Subscorer failed: {error}",
+            severity=IssueSeverity.ZERO,
+            suggestion="Report this issue, the specification couldn't be assessed by this subscorer."
+        ))
+
+        return report
+
+
+def _score(subscorer: BaseScorer, parsed_specification: ParsedSpecification, context: ScoringContext) -> list[ScoringReport]:
+    """
+    Pool task, module-level so it can be pickled for process pool.
+    """
+
+    with stage(_stage_name(subscorer)):
+        return subscorer.score_spec(parsed_specification, context)
+
+
+@dataclass(frozen=True)
+class _WorkerObservation:
+    """
+    What pool workers should measure, instrumentation and tracer of the caller aren't reachable from them.
+    """
+
+    instrument: bool
+    trace_memory: bool
+    threaded: bool
+    trace: bool
+
+
+def _score_observed(subscorer: BaseScorer, parsed_specification: ParsedSpecification, context: ScoringContext,
+                    observation: _WorkerObservation) -> tuple[list[ScoringReport], list[StageTiming], list[dict[str, Any]]]:
+    """
+    Pool task measuring and/or tracing the subscorer, returns reports with stage timings and trace events.
+    """
+
+    instrumentation = None
+    tracer = None
+
+    with ExitStack() as stack:
+        if observation.instrument:
+            instrumentation = Instrumentation(
+                trace_memory=observation.trace_memory,
+                cpu_clock=time.thread_time if observation.threaded else time.process_time
+            )
+            stack.enter_context(instrumentation.activate())
+
+        if observation.trace:
+            tracer = Tracer()
+            stack.enter_context(tracer.activate())
+
+        reports = _score(subscorer, parsed_specification, context)
+
+    return reports, instrumentation.timings if instrumentation else [], tracer.events if tracer else []
+
+
+def _stage_name(subscorer: BaseScorer) -> str:
+    return f"subscorer:{subscorer.name or type(subscorer).__name__}"
@@ -0,0 +1,4 @@
+from api_scoring_app.infra.instrumentation.instrumentation import Instrumentation, stage, current_instrumentation
+from api_scoring_app.infra.instrumentation.tracer import Tracer, span, active_tracer
+
+__all__ = ["Instrumentation", "stage", "current_instrumentation", "Tracer", "span", "active_tracer"]
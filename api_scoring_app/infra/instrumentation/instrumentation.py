@@ -0,0 +1,148 @@
+import time
+import tracemalloc
+
+from typing import Callable, ContextManager, Iterator, Optional
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from api_scoring_app.core.instrumentation import StageTiming, StageHook
+from api_scoring_app.infra.instrumentation import tracer as tracing
+
+
+# instrumentation of the current pipeline run, set by `Instrumentation.activate`
+_current: ContextVar[Optional["Instrumentation"]] = ContextVar("instrumentation", default=None)
+
+_NO_STAGE = nullcontext()
+
+
+def current_instrumentation() -> Optional["Instrumentation"]:
+    return _current.get()
+
+
+def stage(name: str) -> ContextManager[None]:
+    """
+    Measure the block as pipeline stage of the active instrumentation, and trace it as span of
+    the active tracer. Does nothing if there is neither of them.
+    """
+
+    instrumentation = _current.get()
+    tracer = tracing._active_tracer
+
+    if instrumentation is None:
+        return _NO_STAGE if tracer is None else tracer.span(name, "stage")
+    if tracer is None:
+        return instrumentation.stage(name)
+    return _traced_stage(instrumentation, tracer, name)
+
+
+@contextmanager
+def _traced_stage(instrumentation: "Instrumentation", tracer: tracing.Tracer, name: str) -> Iterator[None]:
+    with tracer.span(name, "stage"), instrumentation.stage(name):
+        yield
+
+
+@dataclass
+class _OpenStage:
+    name: str
+    memory_start: int
+
+    # highest traced memory seen by finished child stages, since tracemalloc peak is reset by each of them
+    memory_peak: int = 0
+
+
+@dataclass
+class Instrumentation:
+    """
+    Records wall time, CPU time and (optionally) tracemalloc peak of pipeline stages.
+
+    Pipeline code marks stages with module-level `stage(name)`, which measures only while
+    instrumentation is active (`with instrumentation.activate(): ...`). Every finished stage is
+    kept in `timings` and passed to `hooks`.
+    """
+
+    trace_memory: bool = False
+    hooks: list[StageHook] = field(default_factory=list)
+
+    timings: list[StageTiming] = field(init=False, default_factory=list)
+
+    # CPU clock, `time.thread_time` for stages running concurrently in threads
+    cpu_clock: Callable[[], float] = field(default=time.process_time, repr=False)
+
+    _stack: list[_OpenStage] = field(init=False, repr=False, default_factory=list)
+
+    def add_hook(self, hook: StageHook) -> None:
+        self.hooks.append(hook)
+
+    @contextmanager
+    def activate(self) -> Iterator["Instrumentation"]:
+        """
+        Make it the instrumentation of the current context, memory tracing is started if needed.
+        """
+
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        token = _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+            if started_tracing:
+                tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        trace_memory = self.trace_memory and tracemalloc.is_tracing()
+
+        memory_start = 0
+        if trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1].memory_peak = max(self._stack[-1].memory_peak, peak)
+            tracemalloc.reset_peak()
+            memory_start = current
+
+        open_stage = _OpenStage("/".join([*(parent.name for parent in self._stack), name]), memory_start)
+        self._stack.append(open_stage)
+
+        start = time.perf_counter()
+        cpu_start = self.cpu_clock()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start
+            cpu = self.cpu_clock() - cpu_start
+            self._stack.pop()
+
+            peak_memory = None
+            if trace_memory:
+                peak = max(tracemalloc.get_traced_memory()[1], open_stage.memory_peak)
+                peak_memory = max(0, peak - open_stage.memory_start)
+                if self._stack:
+                    self._stack[-1].memory_peak = max(self._stack[-1].memory_peak, peak)
+
+            self._add(StageTiming(open_stage.name, wall, cpu, peak_memory, start=start))
+
+    def record(self, timing: StageTiming) -> None:
+        """
+        Add finished stage, e.g. measured in a worker. Its name is nested under currently open stages.
+        """
+
+        if self._stack:
+            timing.name = "/".join([self._stack[-1].name, timing.name])
+
+        self._add(timing)
+
+    def _add(self, timing: StageTiming) -> None:
+        self.timings.append(timing)
+        for hook in self.hooks:
+            hook(timing)
+
+    def sorted_timings(self) -> list[StageTiming]:
+        """
+        Timings in the order stages started.
+        """
+
+        return sorted(self.timings, key=lambda timing: timing.start)
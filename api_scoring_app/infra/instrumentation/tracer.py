@@ -0,0 +1,98 @@
+import os
+import json
+import time
+import threading
+
+from typing import Any, ContextManager, Iterator, Optional
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+
+
+# tracer receiving spans, module-level (not a context variable) so disabled `span` costs one global
+# lookup, and spans from subscorer threads end up in the same trace
+_active_tracer: Optional["Tracer"] = None
+
+_NO_SPAN = nullcontext()
+
+# tid of the virtual track for aggregated spans (e.g. per-collector totals of parser walk)
+AGGREGATED_TID = 0
+
+
+def active_tracer() -> Optional["Tracer"]:
+    return _active_tracer
+
+
+def span(name: str, category: str = "rule", **args: Any) -> ContextManager[None]:
+    """
+    Trace the block as span of the active tracer, does nothing if there is none.
+    """
+
+    tracer = _active_tracer
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.span(name, category, args)
+
+
+@dataclass
+class Tracer:
+    """
+    Collects spans as Chrome trace events (complete `X` events), the written file can be opened
+    in Perfetto (ui.perfetto.dev) or chrome://tracing.
+
+    Timestamps come from `perf_counter_ns` (monotonic clock, shared by processes on the same
+    machine), so events collected by worker processes (`extend`) line up with the rest.
+    """
+
+    events: list[dict[str, Any]] = field(default_factory=list)
+
+    @contextmanager
+    def activate(self) -> Iterator["Tracer"]:
+        global _active_tracer
+
+        previous, _active_tracer = _active_tracer, self
+        try:
+            yield self
+        finally:
+            _active_tracer = previous
+
+    @contextmanager
+    def span(self, name: str, category: str = "rule", args: Optional[dict[str, Any]] = None) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add_complete(name, category, start, time.perf_counter_ns() - start, args=args)
+
+    def add_complete(self, name: str, category: str, start_ns: int, duration_ns: int,
+                     tid: Optional[int] = None, args: Optional[dict[str, Any]] = None) -> None:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start_ns / 1000,
+            "dur": duration_ns / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_native_id() if tid is None else tid,
+        }
+        if args:
+            event["args"] = args
+
+        # list.append is atomic, spans of subscorer threads need no lock
+        self.events.append(event)
+
+    def name_thread(self, tid: int, name: str) -> None:
+        self.events.append({"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}})
+
+    def extend(self, events: list[dict[str, Any]]) -> None:
+        """
+        Add events collected elsewhere, e.g. by tracer of a worker process.
+        """
+
+        self.events.extend(events)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> None:
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file)
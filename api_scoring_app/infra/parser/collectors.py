@@ -0,0 +1,248 @@
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar, List
+from dataclasses import dataclass
+
+from openapi_pydantic import OpenAPI, Operation, PathItem, RequestBody, Response, SecurityRequirement, Server, Tag, MediaType, Schema, SecurityScheme
+
+from api_scoring_app.core.config import Config
+from api_scoring_app.core.types import PathNode
+from api_scoring_app.core.parser import WrappedTag, WrappedSecurityRequirement, ParsedSpecification, ContentProjection, SecuritySchemeProjection
+
+
+def project_content(obj: RequestBody | Response) -> ContentProjection:
+    """
+    Projection of request body or response, the model itself isn't kept by parsed specification.
+    """
+
+    if obj.content is None:
+        return ContentProjection(None, required=bool(getattr(obj, "required", False)))
+
+    has_example = False
+    for media_type in obj.content.values():
+        if (media_type.example is not None) or \
+           (media_type.examples and len(media_type.examples) > 0) or \
+           (media_type.media_type_schema and getattr(media_type.media_type_schema, 'example', None) is not None):
+            has_example = True
+            break
+
+    return ContentProjection(tuple(obj.content), has_example, bool(getattr(obj, "required", False)))
+
+
+@dataclass
+class BaseCollector(ABC):
+    """
+    Base class for parser collectors.
+
+    Each collector populates one section of `ParsedSpecification` and registers for
+    the node types (`node_types`, subclasses included) and/or keys (`keys`, last path
+    segment) it cares about. Parser calls `collect` only for matching nodes.
+    """
+
+    config: Config
+
+    # `ParsedSpecification` field populated by collector
+    section: ClassVar[str] = ""
+
+    node_types: ClassVar[tuple[type, ...]] = ()
+    keys: ClassVar[tuple[str, ...]] = ()
+
+    # model types having fields named by `keys`, parser walks down to them
+    key_owners: ClassVar[tuple[type, ...]] = ()
+
+    @abstractmethod
+    def collect(self, obj: Any, path: PathNode, parsed_specification: ParsedSpecification) -> bool:
+        """
+        Collect information from a matching node. Returns `True` if parser shouldn't descend into it.
+        """
+        pass
+
+
+@dataclass
+class DescriptionCollector(BaseCollector):
+    """
+    Populate the fields for description subscorer.
+    """
+
+    section = "descriptions"
+
+    def __post_init__(self):
+        self.node_types = tuple(self.config.DESCRIPTION_TYPES_TO_CHECK)
+
+    def collect(self, obj: Any, path: PathNode, parsed_specification: ParsedSpecification) -> bool:
+        if hasattr(obj, "description"):
+            if obj.description is None:
+                parsed_specification.descriptions.missing_descriptions.append(path)
+            elif not (len(obj.description) >= self.config.DESCRIPTION_MIN_DESCRIPTION_LENGTH):
+                parsed_specification.descriptions.short_descriptions.append(path)
+
+        return False
+
+
+@dataclass
+class ExamplesCollector(BaseCollector):
+    """
+    Populate the fields for examples subscorer.
+    """
+
+    section = "examples"
+    node_types = (RequestBody, Response)
+
+    def collect(self, obj: Any, path: PathNode, parsed_specification: ParsedSpecification) -> bool:
+        # examples should be defined for major methods
+        if len(path) > 2 and path[0] == 'paths' and path[2] in self.config.EXAMPLES_MAJOR_METHODS:
+            if isinstance(obj, RequestBody):
+                parsed_specification.examples.request_bodies.append((path, project_content(obj)))
+            else:
+                parsed_specification.examples.responses.append((path, project_content(obj)))
+
+        return False
+
+
+@dataclass
+class MiscCollector(BaseCollector):
+    """
+    Populate the fields for misc subscorer.
+    """
+
+    section = "misc"
+    node_types = (Tag, Server)
+    keys = ("paths", "tags")
+    key_owners = (OpenAPI, Operation)
+
+    def collect(self, obj: Any, path: PathNode, parsed_specification: ParsedSpecification) -> bool:
+        if isinstance(obj, Tag):
+            parsed_specification.misc.tags_defined.append(WrappedTag(obj.name, path))
+        elif isinstance(obj, Server):
+            parsed_specification.misc.servers_defined.append(obj.url)
+        elif path.key == 'paths':
+            if isinstance(obj, dict) and obj:
+                parsed_specification.misc.paths_defined.append(next(iter(obj)).strip('/'))
+        elif len(path) > 2 and obj is not None:
+            # only if it's in an operation object
+            if path[-2] in self.config.OPERATIONS:
+                for tag in obj:
+                    parsed_specification.misc.tags_from_operations.append(WrappedTag(tag, path))
+
+        return False
+
+
+@dataclass
+class PathsCollector(BaseCollector):
+    """
+    Populate the fields for paths subscorer.
+    """
+
+    section = "paths"
+    node_types = (PathItem,)
+
+    def collect(self, obj: Any, path: PathNode, parsed_specification: ParsedSpecification) -> bool:
+        parsed_specification.paths.path_to_operations[path.key] = self._get_operations(obj)
+        return False
+
+    def _get_operations(self, path_item: PathItem) -> List[str]:
+        """
+        Get the operations from the path item.
+        """
+
+        return [op for op in path_item.model_fields_set if op in self.config.OPERATIONS]
+
+
+@dataclass
+class ResponseCodesCollector(BaseCollector):
+    """
+    Populate the fields for response codes subscorer.
+    """
+
+    section = "response_codes"
+    node_types = (Operation, Response)
+
+    def collect(self, obj: Any, path: PathNode, parsed_specification: ParsedSpecification) -> bool:
+        if isinstance(obj, Operation):
+            if obj.responses is None:
+                parsed_specification.response_codes.missing_responses.append(path)
+
+        # response should come from path item
+        elif path[0] == 'paths':
+            parsed_specification.response_codes.responses.append((path, project_content(obj)))
+
+        return False
+
+
+@dataclass
+class SchemaCollector(BaseCollector):
+    """
+    Populate the fields for schemas subscorer.
+    """
+
+    section = "schemas"
+    node_types = (Schema, MediaType)
+
+    def collect(self, obj: Any, path: PathNode, parsed_specification: ParsedSpecification) -> bool:
+        # check free-form schemas
+        if isinstance(obj, Schema):
+            if self._is_free_form_schema(obj):
+                parsed_specification.schemas.free_form_schemas.append(path)
+
+        # check media types with missing schemas, should cover endpoints
+        elif obj.media_type_schema is None:
+            parsed_specification.schemas.missing_schemas.append(path)
+
+        return False
+
+    def _is_free_form_schema(self, schema: Schema) -> bool:
+        """
+        Check if the schema is a free-form schema.
+        """
+
+        condition = (schema.type == "object" and schema.additionalProperties is True) or \
+            (schema.type == "object" and schema.additionalProperties is None)
+
+        condition = condition and schema.properties is None
+
+        return condition
+
+
+@dataclass
+class SecurityCollector(BaseCollector):
+    """
+    Populate the fields for security subscorer.
+    """
+
+    section = "security"
+    node_types = (SecurityScheme,)
+    keys = ("security",)
+    key_owners = (OpenAPI, Operation)
+
+    def collect(self, obj: Any, path: PathNode, parsed_specification: ParsedSpecification) -> bool:
+        if isinstance(obj, SecurityScheme):
+            scheme_name = path.key
+            parsed_specification.security.defined_schemes.append(WrappedSecurityRequirement(scheme_name, path))
+            parsed_specification.security.schemes.append((path, SecuritySchemeProjection.from_model(obj)))
+            return False
+
+        if not isinstance(obj, list):
+            return False
+
+        # root level, otherwise it comes from operation object
+        if len(path) == 1:
+            referenced_schemes = parsed_specification.security.referenced_schemes
+        else:
+            referenced_schemes = parsed_specification.security.operation_referenced_schemes
+
+        requirements: list[SecurityRequirement] = obj
+        for requirement in requirements:
+            scheme_name = list(requirement.keys())[0]
+            referenced_schemes.append(WrappedSecurityRequirement(scheme_name, path.child(scheme_name)))
+
+        return True # stop here, no need to go deeper
+
+
+DEFAULT_COLLECTORS = (
+    DescriptionCollector,
+    ExamplesCollector,
+    MiscCollector,
+    ResponseCodesCollector,
+    SchemaCollector,
+    PathsCollector,
+    SecurityCollector,
+)
@@ -1,197 +1,287 @@
-from typing import Any, List
-from openapi_pydantic import OpenAPI, PathItem, RequestBody, Response, SecurityRequirement, Server, Tag, MediaType, Schema, SecurityScheme
+import time
+
+from typing import Any, Iterable, Optional, get_args
 from pydantic import BaseModel
 from dataclasses import dataclass, field
+from openapi_pydantic import OpenAPI
 from api_scoring_app.core.config import Config
-from api_scoring_app.core.parser import WrappedTag, WrappedSecurityRequirement, ParsedSpecification
+from api_scoring_app.core.parser import ParsedSpecification
+from api_scoring_app.core.types import PathNode, ROOT_PATH
+from api_scoring_app.infra.parser.collectors import BaseCollector, DEFAULT_COLLECTORS
+from api_scoring_app.infra.instrumentation import active_tracer
+from api_scoring_app.infra.instrumentation.tracer import AGGREGATED_TID
+
+# marks model fields no active collector can match in
+_PRUNED = object()
+
 
 @dataclass
-class Parser:
+class _Dispatch:
+    """
+    Dispatch tables of the collectors active for a set of sections.
+    """
 
-    config: Config = field(default_factory=Config)
-    parsed_specification: ParsedSpecification = field(init=False, default_factory=ParsedSpecification)
+    collectors: tuple[BaseCollector, ...]
 
-    def parse(self, obj: OpenAPI) -> ParsedSpecification:
-        """
-        Parse the OpenAPI specification object.
-        """
+    # node type -> collectors, last path segment -> collectors
+    type_handlers: dict[type, tuple[BaseCollector, ...]] = field(default_factory=dict)
+    key_handlers: dict[str, tuple[BaseCollector, ...]] = field(default_factory=dict)
 
-        self._recursive_parser(obj)
+    # node types of active collectors, and model types owning their keys
+    target_types: tuple[type, ...] = ()
 
-        return self.parsed_specification
-    
-    def _recursive_parser(self, obj: Any, path: list[str] = []) -> dict:
-        """
-        Recursively parse the OpenAPI specification object.
-        """
+    # model type -> field name -> model types reachable through the field, or `_PRUNED`
+    model_fields: dict[type, dict[str, Any]] = field(default_factory=dict)
 
-        self._populate_description(obj, path)
-        self._populate_examples(obj, path)
-        self._populate_misc(obj, path)
-        self._populate_response_codes(obj, path)
-        self._populate_schemas(obj, path)
-        self._populate_paths(obj, path)
-        
-        if self._populate_security(obj, path):
-            return
-
-        # recursion
-        if isinstance(obj, dict): # in depth
-            for key, value in obj.items():
-                self._recursive_parser(value, path + [key])
-
-        elif isinstance(obj, (list, tuple)): # in width
-            for i, item in enumerate(obj):
-                self._recursive_parser(item, path + [str(i)])
-
-        elif isinstance(obj, BaseModel):
-            for field_name, field_value in obj.__dict__.items():
-                if not field_name.startswith('_'): # skip private fields
-                    self._recursive_parser(field_value, path + [field_name])
-    
-
-    def _populate_description(self, obj: Any, path: list[str] = []):
-        """
-        Populate the fields for description subscorer.
-        """
+    # reachable model types -> whether any of them is a target type
+    reaches_target: dict[frozenset[type], bool] = field(default_factory=dict)
 
-        if isinstance(obj, self.config.DESCRIPTION_TYPES_TO_CHECK):
-            if hasattr(obj, "description"):
-                if obj.description is None:
-                    self.parsed_specification.descriptions.missing_descriptions.append(path)
-                elif not (len(obj.description) >= self.config.DESCRIPTION_MIN_DESCRIPTION_LENGTH):
-                    self.parsed_specification.descriptions.short_descriptions.append(path)
-    
+    def __post_init__(self):
+        for collector in self.collectors:
+            for key in collector.keys:
+                self.key_handlers[key] = self.key_handlers.get(key, ()) + (collector,)
 
-    def _populate_examples(self, obj: Any, path: list[str] = []):
-        """
-        Populate the fields for examples subscorer.
-        """
+        self.target_types = tuple({
+            node_type for collector in self.collectors for node_type in collector.node_types + collector.key_owners
+        })
 
-        if len(path) > 2 and path[0] == 'paths':
-            for method in self.config.EXAMPLES_MAJOR_METHODS: # examples should be defined for major methods
-                if path[2] != method:
-                    continue
+    def reaches(self, reach: frozenset[type]) -> bool:
+        hits_target = self.reaches_target.get(reach)
+        if hits_target is None:
+            hits_target = self.reaches_target[reach] = any(issubclass(model, self.target_types) for model in reach)
+        return hits_target
 
-                if (isinstance(obj, RequestBody)):
-                    self.parsed_specification.examples.request_bodies.append((path, obj))
-                elif (isinstance(obj, Response)):
-                    self.parsed_specification.examples.responses.append((path, obj))
-    
 
-    def _populate_misc(self, obj: Any, path: list[str] = []):
-        """
-        Populate the fields for misc subscorer.
-        """
+def _annotation_models(annotation: Any) -> set[type]:
+    """
+    Model classes mentioned in a field annotation (`Optional[Dict[str, Union[Reference, Schema]]]` etc.).
+    """
 
-        if isinstance(obj, Tag):
-            self.parsed_specification.misc.tags_defined.append(WrappedTag(obj.name, path))
-        elif isinstance(obj, Server):
-            self.parsed_specification.misc.servers_defined.append(obj)
-        elif len(path) > 0 and path[-1] == 'paths' and obj is not None:
-            self.parsed_specification.misc.paths_defined.append(list(obj.keys())[0].strip('/'))
-        elif len(path) > 2 and path[-1] == 'tags' and obj is not None:
-            op = path[-2]
-            if self._is_operation(op): # only if it's in an operation object
-                for tag in obj:
-                    self.parsed_specification.misc.tags_from_operations.append(WrappedTag(tag, path))
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return {annotation}
 
+    models = set()
+    for argument in get_args(annotation):
+        models |= _annotation_models(argument)
+    return models
 
-    def _populate_paths(self, obj: Any, path: list[str] = []):
-        """
-        Populate the fields for paths subscorer.
-        """
 
-        if isinstance(obj, PathItem):
-            operations = self._get_operations(obj)
-            self.parsed_specification.paths.path_to_operations[path[-1]] = operations
+@dataclass
+class Parser:
+
+    config: Config = field(default_factory=Config)
 
+    collectors: list[BaseCollector] = field(init=False, default_factory=list)
 
-    def _populate_response_codes(self, obj: Any, path: list[str] = []):
-        """
-        Populate the fields for response codes subscorer.
-        """
+    # active sections (None for all of them) -> dispatch tables
+    _dispatch: dict[Optional[frozenset[str]], _Dispatch] = field(init=False, repr=False, default_factory=dict)
 
-        if len(path) > 0 and path[-1] in self.config.OPERATIONS:
-            if obj is not None and obj.responses is None:
-                self.parsed_specification.response_codes.missing_responses.append(path)
+    # model type -> model types reachable from it (itself included), by field annotations
+    _reachable: dict[type, frozenset[type]] = field(init=False, repr=False, default_factory=dict)
 
-        if len(path) > 0 and path[0] == 'paths' and obj is not None: # response should come from path item
-            if isinstance(obj, Response):
-                # print(path)
-                self.parsed_specification.response_codes.responses.append((path, obj))
+    # node type -> whether parser descends into it
+    _walkable: dict[type, bool] = field(init=False, repr=False, default_factory=dict)
 
+    def __post_init__(self):
+        self.collectors = [collector_class(self.config) for collector_class in DEFAULT_COLLECTORS]
 
-    def _populate_schemas(self, obj: Any, path: list[str] = []):
+    def parse(self, obj: OpenAPI, sections: Optional[Iterable[str]] = None) -> ParsedSpecification:
         """
-        Populate the fields for schemas subscorer.
+        Parse the OpenAPI specification object, every call collects into a fresh `ParsedSpecification`.
+
+        With `sections` (`ParsedSpecification` field names), only their collectors run, the rest of
+        the sections stay empty, and subtrees none of them can match in are not walked.
         """
 
-        # check free-form schemas
-        if isinstance(obj, Schema):
-            if self._is_free_form_schema(obj):
-                self.parsed_specification.schemas.free_form_schemas.append(path)
+        parsed_specification = ParsedSpecification()
+        dispatch = self._get_dispatch(sections)
+
+        tracer = active_tracer()
+        if tracer is None:
+            self._walk(obj, parsed_specification, dispatch)
+            return parsed_specification
+
+        # collectors run interleaved on every node, a span per call would outweigh the call itself,
+        # so their total times are traced as consecutive spans on a separate track
+        collector_times = {collector.section: [0, 0] for collector in dispatch.collectors}
+
+        start = time.perf_counter_ns()
+        self._walk(obj, parsed_specification, dispatch, collector_times)
+
+        tracer.name_thread(AGGREGATED_TID, "parser collectors (aggregated)")
+        for section, (duration, calls) in collector_times.items():
+            tracer.add_complete(f"collector:{section}", "collector", start, duration, tid=AGGREGATED_TID, args={"calls": calls})
+            start += duration
+
+        return parsed_specification
 
-        # check media types with missing schemas, should cover endpoints
-        elif isinstance(obj, MediaType):
-            if obj.media_type_schema is None:   
-                self.parsed_specification.schemas.missing_schemas.append(path)
+    def _get_dispatch(self, sections: Optional[Iterable[str]]) -> _Dispatch:
+        key = None if sections is None else frozenset(sections)
 
+        dispatch = self._dispatch.get(key)
+        if dispatch is None:
+            if key is not None:
+                unknown = key - {collector.section for collector in self.collectors}
+                if unknown:
+                    raise ValueError(f"Unknown parsed specification sections: {', '.join(sorted(unknown))}")
 
-    def _populate_security(self, obj: Any, path: list[str] = []) -> bool:
+            dispatch = self._dispatch[key] = _Dispatch(tuple(
+                collector for collector in self.collectors if key is None or collector.section in key
+            ))
+
+        return dispatch
+
+    def _walk(self, root: Any, parsed_specification: ParsedSpecification, dispatch: _Dispatch,
+              collector_times: Optional[dict[str, list[int]]] = None) -> None:
         """
-        Populate the fields for security subscorer.
+        Walk the OpenAPI specification object depth-first (pre-order), with an explicit stack.
+
+        Only containers (dicts, lists, tuples) and models are visited, each of them is
+        dispatched to collectors registered for its type or its key. Model fields are only
+        descended into if an active collector can match in them: a model type reachable through
+        field's annotation is one of its node types (or key owners), or the field name is one
+        of its keys. Containers inherit what's reachable through their field, plain data
+        (e.g. `example` values) leads to no models. `collector_times`, if given, accumulates
+        `[nanoseconds, calls]` per collector section.
         """
 
-        if isinstance(obj, SecurityScheme):
-            scheme_name = path[-1]
-            self.parsed_specification.security.defined_schemes.append(WrappedSecurityRequirement(scheme_name, path))
-            self.parsed_specification.security.schemes.append((path, obj))
-        elif len(path) > 0 and obj is not None:
-            if path[0] == 'security':
-                referenced_schemes: list[SecurityRequirement] = obj
-
-                for scheme in referenced_schemes:
-                    scheme_name = list(scheme.keys())[0]
-                    scheme_path = path + [scheme_name]
-                    self.parsed_specification.security.referenced_schemes.append(WrappedSecurityRequirement(scheme_name, scheme_path))
-
-                return True # stop recursion here, no need to go deeper
-            elif path[-1] == 'security': # it comes from operation object
-                
-                referenced_schemes: list[SecurityRequirement] = obj
-
-                for scheme in referenced_schemes:
-                    scheme_name = list(scheme.keys())[0]
-                    scheme_path = path + [scheme_name]
-                    self.parsed_specification.security.operation_referenced_schemes.append(WrappedSecurityRequirement(scheme_name, scheme_path))
-                return True # stop recursion here, no need to go deeper
-
-        return False
-    
-    def _is_operation(self, keyword: str) -> bool:
+        type_handlers = dispatch.type_handlers
+        key_handlers = dispatch.key_handlers
+        model_fields = dispatch.model_fields
+        reaches_target = dispatch.reaches_target
+        walkable = self._walkable
+
+        # siblings share parent path node, nothing is copied per node; reach is the set of model
+        # types the node can contain, None if unknown (not under a model field)
+        stack: list[tuple[Any, PathNode, Optional[frozenset[type]]]] = [(root, ROOT_PATH, None)]
+
+        while stack:
+            obj, path, reach = stack.pop()
+
+            collectors = type_handlers.get(type(obj))
+            if collectors is None:
+                collectors = self._register_type(dispatch, type(obj))
+
+            stop = False
+            for collector in collectors:
+                if collector_times is None:
+                    stop = collector.collect(obj, path, parsed_specification) or stop
+                else:
+                    stop = self._timed_collect(collector, obj, path, parsed_specification, collector_times) or stop
+
+            if path.key in key_handlers:
+                for collector in key_handlers[path.key]:
+                    if collector not in collectors:
+                        if collector_times is None:
+                            stop = collector.collect(obj, path, parsed_specification) or stop
+                        else:
+                            stop = self._timed_collect(collector, obj, path, parsed_specification, collector_times) or stop
+
+            if stop:
+                continue
+
+            fields = None
+            if isinstance(obj, dict): # in depth
+                items = obj.items()
+
+            elif isinstance(obj, (list, tuple)): # in width
+                items = [(str(i), item) for i, item in enumerate(obj)]
+
+            elif isinstance(obj, BaseModel):
+                fields = model_fields.get(type(obj))
+                if fields is None:
+                    fields = self._register_model(dispatch, type(obj))
+
+                items = [
+                    (field_name, field_value)
+                    for field_name, field_value in obj.__dict__.items()
+                    if not field_name.startswith('_') # skip private fields
+                    and fields.get(field_name) is not _PRUNED
+                ]
+
+            else:
+                continue
+
+            # container items share the reach of their field, without any target among it only keys can match
+            keys_only = False
+            if reach is not None and fields is None:
+                hits_target = reaches_target.get(reach)
+                if hits_target is None:
+                    hits_target = dispatch.reaches(reach)
+                keys_only = not hits_target
+
+            children = []
+            for key, value in items:
+                if keys_only and key not in key_handlers:
+                    continue
+                is_walkable = walkable.get(type(value))
+                if is_walkable is None:
+                    is_walkable = walkable[type(value)] = issubclass(type(value), (dict, list, tuple, BaseModel))
+                if is_walkable:
+                    children.append((value, PathNode(path, key), fields.get(key) if fields is not None else reach))
+
+            # children are pushed in reverse, so they're popped in their original order
+            children.reverse()
+            stack.extend(children)
+
+    def _timed_collect(self, collector: BaseCollector, obj: Any, path: PathNode, parsed_specification: ParsedSpecification,
+                       collector_times: dict[str, list[int]]) -> bool:
+        start = time.perf_counter_ns()
+        stop = collector.collect(obj, path, parsed_specification)
+
+        times = collector_times[collector.section]
+        times[0] += time.perf_counter_ns() - start
+        times[1] += 1
+
+        return stop
+
+    def _register_type(self, dispatch: _Dispatch, node_type: type) -> tuple[BaseCollector, ...]:
         """
-        Check if the keyword is an operation.
+        Build (once) the dispatch table entry for a node type.
         """
 
-        return keyword in self.config.OPERATIONS
+        collectors = tuple(
+            collector for collector in dispatch.collectors
+            if issubclass(node_type, collector.node_types)
+        )
 
-    def _get_operations(self, path_item: PathItem) -> List[str]:
+        dispatch.type_handlers[node_type] = collectors
+        return collectors
+
+    def _register_model(self, dispatch: _Dispatch, model: type) -> dict[str, Any]:
         """
-        Get the operations from the path item.
+        Build (once) what's reachable through every field of the model, fields no active collector
+        can match in are `_PRUNED`.
         """
 
-        return [op for op in path_item.model_fields_set if op in self.config.OPERATIONS]
+        fields: dict[str, Any] = {}
+        for name, model_field in model.model_fields.items():
+            reach = frozenset().union(*(self._reachable_models(field_model) for field_model in _annotation_models(model_field.annotation)))
+            if name in dispatch.key_handlers or dispatch.reaches(reach):
+                fields[name] = reach
+            else:
+                fields[name] = _PRUNED
 
+        dispatch.model_fields[model] = fields
+        return fields
 
-    def _is_free_form_schema(self, schema: Schema) -> bool:
+    def _reachable_models(self, model: type) -> frozenset[type]:
         """
-        Check if the schema is a free-form schema.
+        Model types reachable from the model (itself included) through field annotations.
         """
 
-        condition = (schema.type == "object" and schema.additionalProperties is True) or \
-            (schema.type == "object" and schema.additionalProperties is None)
-        
-        condition = condition and schema.properties is None
-
-        return condition
\ No newline at end of file
+        reachable = self._reachable.get(model)
+        if reachable is not None:
+            return reachable
+
+        found = {model}
+        pending = [model]
+        while pending:
+            for model_field in pending.pop().model_fields.values():
+                for field_model in _annotation_models(model_field.annotation):
+                    if field_model not in found:
+                        found.add(field_model)
+                        pending.append(field_model)
+
+        reachable = self._reachable[model] = frozenset(found)
+        return reachable
@@ -1,54 +1,64 @@
+from typing import ClassVar
 from dataclasses import dataclass
 
 from api_scoring_app.core import Config
-from api_scoring_app.core.subscorers import ScoringReport, Issue, IssueSeverity, ParsedSpecification, BaseScorer
+from api_scoring_app.core.subscorers import ScoringReport, IssueSeverity, IssueTemplate, ParsedSpecification, BaseScorer, ScoringContext, DEFAULT_CONTEXT
+from api_scoring_app.infra.instrumentation import span
+
+
+MISSING_DESCRIPTION = IssueTemplate(
+    message="Missing description at: {path}",
+    severity=IssueSeverity.LOW,
+    suggestion="Add a meaningful description."
+)
+SHORT_DESCRIPTION = IssueTemplate(
+    message="Description too short at: {path}",
+    severity=IssueSeverity.LOW,
+    suggestion=f"Expand description to be at least {Config.DESCRIPTION_MIN_DESCRIPTION_LENGTH} characters."
+)
+
 
 @dataclass
 class DescriptionSubscorer(BaseScorer):
     """
     Descriptions & Documentation subscorer for OpenAPI specification.
     """
+    name: ClassVar[str] = Config.DESCRIPTION_SUBSCORER_NAME
+    sections: ClassVar[tuple[str, ...]] = ("descriptions",)
+
     points: float
 
-    def score_spec(self, parsed_specification: ParsedSpecification) -> list[ScoringReport]:
+    def score_spec(self, parsed_specification: ParsedSpecification, context: ScoringContext = DEFAULT_CONTEXT) -> list[ScoringReport]:
         """
         Score the specification using the description subscorer.
         """
 
-        scoring_report = ScoringReport(Config.DESCRIPTION_SUBSCORER_NAME, self.points)
+        scoring_report = ScoringReport(Config.DESCRIPTION_SUBSCORER_NAME, self.points, issue_cap=context.issue_cap)
 
         # check for missing descriptions
-        issues = []
-        for path in parsed_specification.descriptions.missing_descriptions:
-            path_as_string = " -> ".join(path)
-
-            issues.append(Issue(
-                message=f"Missing description at: {path_as_string}",
-                path=path_as_string,
-                severity=IssueSeverity.LOW,
-                suggestion="Add a meaningful description."
-            ))
+        with span("description: missing"):
+            issues = (
+                MISSING_DESCRIPTION.issue(path)
+                for path in parsed_specification.descriptions.missing_descriptions
+            )
         
-        scoring_report.bulk_add_issues(
-            issues=issues,
-            severity=IssueSeverity.LOW
-        )
+            scoring_report.bulk_add_issues(
+                issues=issues,
+                severity=IssueSeverity.LOW,
+                rule="missing_descriptions"
+            )
             
         # check for short descriptions
-        issues = []
-        for path in parsed_specification.descriptions.short_descriptions:
-            path_as_string = " -> ".join(path)
-
-            issues.append(Issue(
-                message=f"Description too short at: {path_as_string}",
-                path=path_as_string,
-                severity=IssueSeverity.LOW,
-                suggestion=f"Expand description to be at least {Config.DESCRIPTION_MIN_DESCRIPTION_LENGTH} characters."
-            ))
+        with span("description: short"):
+            issues = (
+                SHORT_DESCRIPTION.issue(path)
+                for path in parsed_specification.descriptions.short_descriptions
+            )
         
-        scoring_report.bulk_add_issues(
-            issues=issues,
-            severity=IssueSeverity.LOW
-        )
+            scoring_report.bulk_add_issues(
+                issues=issues,
+                severity=IssueSeverity.LOW,
+                rule="short_descriptions"
+            )
             
         return [scoring_report]
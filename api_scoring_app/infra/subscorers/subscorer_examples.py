@@ -1,9 +1,21 @@
-from dataclasses import dataclass, field
-
-from openapi_pydantic import MediaType
+from typing import ClassVar, Sequence
+from dataclasses import dataclass
 
 from api_scoring_app.core import Config
-from api_scoring_app.core.subscorers import ScoringReport, Issue, IssueSeverity, ParsedSpecification, BaseScorer
+from api_scoring_app.core.subscorers import ScoringReport, IssueSeverity, IssueTemplate, ParsedSpecification, BaseScorer, ScoringContext, DEFAULT_CONTEXT
+from api_scoring_app.infra.instrumentation import span
+
+MISSING_REQUEST_EXAMPLE = IssueTemplate(
+    message="Missing request example at major endpoint: {path}",
+    severity=IssueSeverity.MEDIUM,
+    suggestion="Add an example for the request body."
+)
+MISSING_RESPONSE_EXAMPLE = IssueTemplate(
+    message="Missing response example at endpoint: {path}",
+    severity=IssueSeverity.MEDIUM,
+    suggestion="Add examples for responses."
+)
+
 
 @dataclass
 class ExamplesSubscorer(BaseScorer):
@@ -11,91 +23,59 @@ class ExamplesSubscorer(BaseScorer):
     Examples & Samples subscorer for OpenAPI specification.
     """
 
-    points: float
+    name: ClassVar[str] = Config.EXAMPLES_SUBSCORER_NAME
+    sections: ClassVar[tuple[str, ...]] = ("examples",)
 
-    _missing_request_examples: list[list[str]] = field(init=False, default_factory=list)
-    _missing_response_examples: list[list[str]] = field(init=False, default_factory=list)
+    points: float
 
-    def score_spec(self, parsed_specification: ParsedSpecification) -> list[ScoringReport]:
+    def score_spec(self, parsed_specification: ParsedSpecification, context: ScoringContext = DEFAULT_CONTEXT) -> list[ScoringReport]:
         """
         Score the specification using the examples subscorer.
         """
 
-        scoring_report = ScoringReport(Config.EXAMPLES_SUBSCORER_NAME, self.points)
+        scoring_report = ScoringReport(Config.EXAMPLES_SUBSCORER_NAME, self.points, issue_cap=context.issue_cap)
 
-        self._populate_fields(parsed_specification)
+        missing_request_examples, missing_response_examples = self._find_missing_examples(parsed_specification)
 
         # missing request examples
-        issues = []
-        for path in self._missing_request_examples:
-            path_as_string = " -> ".join(path)
-            issues.append(Issue(
-                message=f"Missing request example at major endpoint: {path_as_string}",
-                path=path_as_string,
-                severity=IssueSeverity.MEDIUM,
-                suggestion="Add an example for the request body."
-            ))
+        issues = (MISSING_REQUEST_EXAMPLE.issue(path) for path in missing_request_examples)
         scoring_report.bulk_add_issues(
             issues=issues,
-            severity=IssueSeverity.MEDIUM
+            severity=IssueSeverity.MEDIUM,
+            rule="missing_request_examples"
         )
 
         # missing response examples
-        issues = []
-        for path in self._missing_response_examples:
-            path_as_string = " -> ".join(path)
-            issues.append(Issue(
-                message=f"Missing response example at endpoint: {path_as_string}",
-                path=path_as_string,
-                severity=IssueSeverity.MEDIUM,
-                suggestion="Add examples for responses."
-            ))
+        issues = (MISSING_RESPONSE_EXAMPLE.issue(path) for path in missing_response_examples)
         scoring_report.bulk_add_issues(
             issues=issues,
-            severity=IssueSeverity.MEDIUM
+            severity=IssueSeverity.MEDIUM,
+            rule="missing_response_examples"
         )
 
         return [scoring_report]
     
-    def _populate_fields(self, parsed_specification: ParsedSpecification) -> None:
+    def _find_missing_examples(self, parsed_specification: ParsedSpecification) -> tuple[list[Sequence[str]], list[Sequence[str]]]:
         """
-        Populate the fields for examples subscorer.
+        Find paths of request bodies and responses without examples.
         """
 
-        for path, request_body in parsed_specification.examples.request_bodies:
-            if request_body.required:
-                has_example = False
-
-                for _, media_type in request_body.content.items():
-                    if self._has_examples(media_type):
-                        has_example = True
-                        break
-
-                if not has_example:
-                    self._missing_request_examples.append(path)
-
-        for path, response in parsed_specification.examples.responses:
-            if response.content is None:
-                continue
-
-            has_example = False
-            
-            for _, media_type in response.content.items():
-                if self._has_examples(media_type):
-                    has_example = True
-                    break
-                            
-            if not has_example:
-                self._missing_response_examples.append(path)
-    
-    def _has_examples(self, media_type: MediaType) -> bool:
-        """
-        Check if a MediaType has example or examples, or if it's schema has example.
-        """
+        missing_request_examples: list[Sequence[str]] = []
+        missing_response_examples: list[Sequence[str]] = []
 
-        condition = (media_type.example is not None) or \
-                    (media_type.examples and len(media_type.examples) > 0) or \
-                    (media_type.media_type_schema and getattr(media_type.media_type_schema, 'example', None) is not None)
+        # request bodies
+        with span("examples: request bodies"):
+            for path, request_body in parsed_specification.examples.request_bodies:
+                if request_body.required and not request_body.has_example:
+                    missing_request_examples.append(path)
 
-        return condition
-    
+        # responses
+        with span("examples: responses"):
+            for path, response in parsed_specification.examples.responses:
+                if response.content_types is None:
+                    continue
+
+                if not response.has_example:
+                    missing_response_examples.append(path)
+
+        return missing_request_examples, missing_response_examples
@@ -1,6 +1,8 @@
+from typing import ClassVar
 from dataclasses import dataclass
 
-from api_scoring_app.core.subscorers import ScoringReport, Issue, IssueSeverity, ParsedSpecification, BaseScorer
+from api_scoring_app.core.subscorers import ScoringReport, Issue, IssueSeverity, ParsedSpecification, BaseScorer, ScoringContext, DEFAULT_CONTEXT
+from api_scoring_app.infra.instrumentation import span
 from api_scoring_app.core import Config
 
 
@@ -10,43 +12,51 @@ class MiscSubscorer(BaseScorer):
     Miscellaneous Best Practices subscorer for OpenAPI specification.
     """
 
+    name: ClassVar[str] = Config.MISC_SUBSCORER_NAME
+    sections: ClassVar[tuple[str, ...]] = ("misc",)
+
     points: float
 
-    def score_spec(self, parsed_specification: ParsedSpecification) -> list[ScoringReport]:
-        scoring_report = ScoringReport(Config.MISC_SUBSCORER_NAME, self.points)
+    def score_spec(self, parsed_specification: ParsedSpecification, context: ScoringContext = DEFAULT_CONTEXT) -> list[ScoringReport]:
+        scoring_report = ScoringReport(Config.MISC_SUBSCORER_NAME, self.points, issue_cap=context.issue_cap)
 
         # versioning
-        has_versioning = self._has_versioning(parsed_specification)
-        if not has_versioning:
-            scoring_report.add_issue(Issue(
-                message="Paths are not consistently versioned",
-                severity=IssueSeverity.LOW,
-                suggestion="Add versioned paths to the specification"
-            ))
+        with span("misc: versioning"):
+            has_versioning = self._has_versioning(parsed_specification)
+            if not has_versioning:
+                scoring_report.add_issue(Issue(
+                    message="Paths are not consistently versioned",
+                    severity=IssueSeverity.LOW,
+                    suggestion="Add versioned paths to the specification"
+                ))
 
         # servers
-        has_servers = self._has_servers_defined(parsed_specification)
-        if not has_servers:
-            scoring_report.add_issue(Issue(
-                message="Servers are not defined",
-                severity=IssueSeverity.MEDIUM,
-                suggestion="Add servers to the specification"
-            ))
+        with span("misc: servers"):
+            has_servers = self._has_servers_defined(parsed_specification)
+            if not has_servers:
+                scoring_report.add_issue(Issue(
+                    message="Servers are not defined",
+                    severity=IssueSeverity.MEDIUM,
+                    suggestion="Add servers to the specification"
+                ))
 
         # tags
-        has_tags_defined = self._has_tags_defined(parsed_specification)
-        if not has_tags_defined:
-            scoring_report.add_issue(Issue(
-                message="Tags are not defined",
-                severity=IssueSeverity.MEDIUM,
-                suggestion="Add tags to the specification"
-            ))
-        elif self._referenced_defined_tags_ratio(parsed_specification) < Config.MISC_REFERENCED_TAGS_THRESHOLD:
-            scoring_report.add_issue(Issue(
-                message="Tags are not consistently referenced from operations",
-                severity=IssueSeverity.MEDIUM,
-                suggestion=f"Define these tags on root level: {', '.join(parsed_specification.misc.undefined_tags)}"
-            ))
+        with span("misc: tags"):
+            has_tags_defined = self._has_tags_defined(parsed_specification)
+            if not has_tags_defined:
+                scoring_report.add_issue(Issue(
+                    message="Tags are not defined",
+                    severity=IssueSeverity.MEDIUM,
+                    suggestion="Add tags to the specification"
+                ))
+            else:
+                referenced_ratio, undefined_tags = self._referenced_defined_tags_ratio(parsed_specification)
+                if referenced_ratio < Config.MISC_REFERENCED_TAGS_THRESHOLD:
+                    scoring_report.add_issue(Issue(
+                        message="Tags are not consistently referenced from operations",
+                        severity=IssueSeverity.MEDIUM,
+                        suggestion=f"Define these tags on root level: {', '.join(undefined_tags)}"
+                    ))
 
         return [scoring_report]
 
@@ -78,18 +88,22 @@ class MiscSubscorer(BaseScorer):
         """
         return len(parsed_specification.misc.tags_defined) > 0
 
-    def _referenced_defined_tags_ratio(self, parsed_specification: ParsedSpecification) -> float:
+    def _referenced_defined_tags_ratio(self, parsed_specification: ParsedSpecification) -> tuple[float, list[str]]:
         """
-        Gets the ratio of tags referenced from operations to tags defined at the root level.
+        Gets the ratio of tags referenced from operations to tags defined at the root level,
+        along with the referenced tags that are not defined.
         """
         num_referenced = len(parsed_specification.misc.tags_from_operations)
         if num_referenced == 0:
-            return 1.0
+            return 1.0, []
+
+        undefined_tags = []
+        defined_names = {tag.name for tag in parsed_specification.misc.tags_defined}
 
         num_referenced_real = 0
         for tag in parsed_specification.misc.tags_from_operations:
-            if tag in parsed_specification.misc.tags_defined:
+            if tag.name in defined_names:
                 num_referenced_real += 1
             else:
-                parsed_specification.misc.undefined_tags.append(tag.name)
-        return num_referenced_real / num_referenced
+                undefined_tags.append(tag.name)
+        return num_referenced_real / num_referenced, undefined_tags
@@ -1,109 +1,231 @@
 import re
 
-from typing import Tuple
+from typing import ClassVar, Optional, Tuple
 from dataclasses import dataclass, field
 
-from api_scoring_app.core.subscorers import ScoringReport, Issue, IssueSeverity, ParsedSpecification, BaseScorer
+from api_scoring_app.core.subscorers import ScoringReport, IssueSeverity, IssueTemplate, ParsedSpecification, BaseScorer, ScoringContext, DEFAULT_CONTEXT
+from api_scoring_app.infra.instrumentation import span
 from api_scoring_app.core import Config
 from api_scoring_app.core.types import NamingConvention
 
+
+PATH_PARAMETER_PATTERN = re.compile(r'{[^}]+}')
+PATH_PARAMETER_PLACEHOLDER = "{piertotumlocomotor}"
+CAMEL_CASE_PATTERN = re.compile(r'[a-z0-9][A-Z]')
+
+CRUD_VIOLATION = IssueTemplate(
+    message="CRUD convention violation at '{0}' for operation '{1}'",
+    severity=IssueSeverity.LOW,
+    suggestion="'GET' for retrieval, 'POST' for creation, PUT/PATCH for updates, DELETE for removal."
+)
+OVERLAPPING_PATHS = IssueTemplate(
+    message="Overlapping paths: '{0}' and '{1}'",
+    severity=IssueSeverity.HIGH,
+    suggestion="Remove one of the paths."
+)
+
+
+class _SegmentTrie:
+    """
+    Trie over path segments, one per segment count. Parameter segments are normalized to
+    a single placeholder, which acts as a wildcard edge while matching.
+    """
+
+    __slots__ = ("children", "path_indices")
+
+    def __init__(self) -> None:
+        self.children: dict[str, "_SegmentTrie"] = {}
+        self.path_indices: list[int] = []
+
+    def insert(self, segments: list[str], path_index: int) -> None:
+        node = self
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _SegmentTrie()
+            node = child
+        node.path_indices.append(path_index)
+
+    def match(self, segments: list[str]) -> list[int]:
+        """
+        Indices of inserted paths overlapping with `segments`.
+        """
+
+        matches = []
+        depth_total = len(segments)
+
+        stack = [(self, 0)]
+        while stack:
+            node, depth = stack.pop()
+
+            if depth == depth_total:
+                matches.extend(node.path_indices)
+                continue
+
+            segment = segments[depth]
+            if segment == PATH_PARAMETER_PLACEHOLDER:
+                stack.extend((child, depth + 1) for child in node.children.values())
+                continue
+
+            child = node.children.get(segment)
+            if child is not None:
+                stack.append((child, depth + 1))
+
+            wildcard = node.children.get(PATH_PARAMETER_PLACEHOLDER)
+            if wildcard is not None:
+                stack.append((wildcard, depth + 1))
+
+        return matches
+
+
 @dataclass
-class PathsSubscorer(BaseScorer):
+class _PathsFindings:
     """
-    Paths & Operations subscorer for OpenAPI specification.
+    Findings of a single `score_spec` run.
     """
-    points: float
 
-    _overlapping_paths: list[Tuple[str, str]] = field(init=False, default_factory=list)
-    _inconsistent_namings: list[Tuple[str, str]] = field(init=False, default_factory=list)
-    _crud_violations: list[Tuple[str, str]] = field(init=False, default_factory=list)
+    overlapping_paths: list[Tuple[str, str]] = field(default_factory=list)
+    # (path, conventions it uses)
+    inconsistent_namings: list[Tuple[str, list[NamingConvention]]] = field(default_factory=list)
+    crud_violations: list[Tuple[str, str]] = field(default_factory=list)
 
     # Convention with most occurrences will be the suggestion, if inconsistent
-    _naming_convention_counts: dict[NamingConvention, int] = field(init=False, default_factory=lambda: {
+    naming_convention_counts: dict[NamingConvention, int] = field(default_factory=lambda: {
         NamingConvention.KEBAB: 0,
-        NamingConvention.SNAKE: 0
+        NamingConvention.SNAKE: 0,
+        NamingConvention.CAMEL: 0
     })
 
-    def score_spec(self, parsed_specification: ParsedSpecification) -> list[ScoringReport]:
+    # majority convention and a path following it
+    frequent_naming_convention: NamingConvention = NamingConvention.KEBAB
+    frequent_naming_example: Optional[str] = None
+
+
+@dataclass
+class PathsSubscorer(BaseScorer):
+    """
+    Paths & Operations subscorer for OpenAPI specification.
+    """
+    name: ClassVar[str] = Config.PATHS_SUBSCORER_NAME
+    sections: ClassVar[tuple[str, ...]] = ("paths",)
+
+    points: float
+
+    def score_spec(self, parsed_specification: ParsedSpecification, context: ScoringContext = DEFAULT_CONTEXT) -> list[ScoringReport]:
         """
         Score the specification using the paths subscorer.
         """
 
-        scoring_report = ScoringReport(Config.PATHS_SUBSCORER_NAME, self.points)
+        scoring_report = ScoringReport(Config.PATHS_SUBSCORER_NAME, self.points, issue_cap=context.issue_cap)
         
         # populate necessary fields
-        self._check_paths(parsed_specification)
+        findings = self._check_paths(parsed_specification)
 
         # Report CRUD violations
-        issues = []
-        for path, operation in self._crud_violations:
-            issues.append(Issue(
-                message=f"CRUD convention violation at '{path}' for operation '{operation}'",
-                path=f"paths -> {path} -> {operation}",
-                severity=IssueSeverity.LOW,
-                suggestion="'GET' for retrieval, 'POST' for creation, PUT/PATCH for updates, DELETE for removal."
-            ))
+        issues = (
+            CRUD_VIOLATION.issue(("paths", path, operation), path, operation)
+            for path, operation in findings.crud_violations
+        )
         
         scoring_report.bulk_add_issues(
             issues=issues,
-            severity=IssueSeverity.LOW
+            severity=IssueSeverity.LOW,
+            rule="crud_conventions"
         )
 
         # overlapping paths
-        issues = []
-        for path1, path2 in self._overlapping_paths:
-            issues.append(Issue(
-                message=f"Overlapping paths: '{path1}' and '{path2}'",
-                severity=IssueSeverity.HIGH,
-                suggestion="Remove one of the paths."
-            ))
+        issues = (OVERLAPPING_PATHS.issue(None, path1, path2) for path1, path2 in findings.overlapping_paths)
         
         scoring_report.bulk_add_issues(
             issues=issues,
-            severity=IssueSeverity.HIGH
+            severity=IssueSeverity.HIGH,
+            rule="overlapping_paths"
         )
 
         # inconsistent naming
-        frequent_naming_convention: NamingConvention = NamingConvention.KEBAB
-        if self._naming_convention_counts[NamingConvention.SNAKE] > self._naming_convention_counts[NamingConvention.KEBAB]:
-            frequent_naming_convention = NamingConvention.SNAKE
-        
-        suggestion = f"Stick with '{frequent_naming_convention.value}', you've got more of them in your spec."
-
-        issues = []
-        for path1, path2 in self._inconsistent_namings:
-            issues.append(Issue(
-                message=f"Inconsistent naming between '{path1}' and '{path2}'",
-                severity=IssueSeverity.MEDIUM,
-                suggestion=suggestion
-            ))
+        # majority convention (and its example) is the same for every issue of the run
+        frequent_naming_convention = findings.frequent_naming_convention
+        message = "Inconsistent naming at '{0}', it uses {1} while most paths use " + f"'{frequent_naming_convention.value}'"
+        if findings.frequent_naming_example is not None:
+            message += f", e.g. '{findings.frequent_naming_example}'".replace("{", "{{").replace("}", "}}")
+
+        inconsistent_naming = IssueTemplate(
+            message=message,
+            severity=IssueSeverity.MEDIUM,
+            suggestion=f"Stick with '{frequent_naming_convention.value}', you've got more of them in your spec."
+        )
+
+        # few distinct convention combinations, their text is shared between issues
+        used_texts: dict[tuple[NamingConvention, ...], str] = {}
+
+        def naming_issues():
+            for path, conventions in findings.inconsistent_namings:
+                key = tuple(conventions)
+                used = used_texts.get(key)
+                if used is None:
+                    used = used_texts[key] = ", ".join(f"'{convention.value}'" for convention in conventions)
+
+                yield inconsistent_naming.issue(("paths", path), path, used)
         
         scoring_report.bulk_add_issues(
-            issues=issues,
-            severity=IssueSeverity.LOW
+            issues=naming_issues(),
+            severity=IssueSeverity.LOW,
+            rule="inconsistent_naming"
         )
 
         return [scoring_report]
     
-    def _check_paths(self, parsed_specification: ParsedSpecification) -> None:
+    def _check_paths(self, parsed_specification: ParsedSpecification) -> _PathsFindings:
         """
         Check the paths of the specification for possible errors.
         """
 
+        findings = _PathsFindings()
         path_names = list(parsed_specification.paths.path_to_operations.keys())
 
-        for i, path1 in enumerate(path_names):
-            # CRUD conventions
-            self._follows_crud_conventions(path1, parsed_specification.paths.path_to_operations[path1])
+        # overlapping paths
+        with span("paths: overlapping"):
+            findings.overlapping_paths = self._find_overlapping_paths(path_names)
+
+        # CRUD conventions
+        with span("paths: CRUD conventions"):
+            for path, operations in parsed_specification.paths.path_to_operations.items():
+                self._follows_crud_conventions(path, operations, findings)
+
+        # inconsistent naming
+        with span("paths: naming"):
+            self._check_naming_consistency(path_names, findings)
+
+        return findings
+
+    def _find_overlapping_paths(self, path_names: list[str]) -> list[Tuple[str, str]]:
+        """
+        Find all pairs of paths that might be overlapping, same pairs (and order) as checking
+        every pair with `_are_overlapping`, but each path is matched against segment trie once.
+        """
+
+        segments = [self._normalize_path(path) for path in path_names]
+
+        tries: dict[int, _SegmentTrie] = {}
+        for i, path_segments in enumerate(segments):
+            trie = tries.get(len(path_segments))
+            if trie is None:
+                trie = tries[len(path_segments)] = _SegmentTrie()
+            trie.insert(path_segments, i)
 
-            for _, path2 in enumerate(path_names[i+1:], start=i+1):
-                # overlapping paths
-                if self._are_overlapping(path1, path2):
-                    self._overlapping_paths.append((path1, path2))
-                
-                # inconsistent naming
-                if not self._have_consistent_naming(path1, path2):
-                    self._inconsistent_namings.append((path1, path2))
+        overlapping_paths = []
+        for i, path_segments in enumerate(segments):
+            matches = sorted(j for j in tries[len(path_segments)].match(path_segments) if j > i)
+            overlapping_paths.extend((path_names[i], path_names[j]) for j in matches)
+
+        return overlapping_paths
+
+    def _normalize_path(self, path: str) -> list[str]:
+        """
+        Split path into segments, every parameter is replaced with the same placeholder.
+        """
+
+        return PATH_PARAMETER_PATTERN.sub(PATH_PARAMETER_PLACEHOLDER, path).strip('/').split('/')
 
     def _are_overlapping(self, path1: str, path2: str) -> bool:
         """
@@ -118,10 +240,10 @@ class PathsSubscorer(BaseScorer):
         if path1 == path2:
             return True
 
-        placeholder = "{piertotumlocomotor}"
+        placeholder = PATH_PARAMETER_PLACEHOLDER
 
-        path1_parts = re.sub(r'{[^}]+}', placeholder, path1).strip('/').split('/')
-        path2_parts = re.sub(r'{[^}]+}', placeholder, path2).strip('/').split('/')
+        path1_parts = self._normalize_path(path1)
+        path2_parts = self._normalize_path(path2)
 
         if len(path1_parts) != len(path2_parts):
             return False
@@ -135,31 +257,47 @@ class PathsSubscorer(BaseScorer):
         
         return is_overlapping
     
-    def _have_consistent_naming(self, path1: str, path2: str) -> bool:
+    def _check_naming_consistency(self, path_names: list[str], findings: _PathsFindings) -> None:
         """
-        Check if two paths follow consistent naming conventions. Update scores for each convention.
+        Classify every path once, the most frequent convention wins (ties go to kebab-case, then
+        snake_case). Paths following another convention, or mixing several, are inconsistent.
         """
-        dashes1 = path1.count('-')
-        underscores1 = path1.count('_')
 
-        dashes2 = path2.count('-')
-        underscores2 = path2.count('_')
+        path_conventions = [(path, self._naming_conventions(path)) for path in path_names]
+
+        examples: dict[NamingConvention, str] = {}
+        for path, conventions in path_conventions:
+            if len(conventions) == 1:
+                findings.naming_convention_counts[conventions[0]] += 1
+                examples.setdefault(conventions[0], path)
 
-        dashes_total = dashes1 + dashes2
-        underscores_total = underscores1 + underscores2
+        # dict keeps declaration order, so max picks the first one on ties
+        frequent_naming_convention = max(findings.naming_convention_counts, key=findings.naming_convention_counts.get)
+        findings.frequent_naming_convention = frequent_naming_convention
+        findings.frequent_naming_example = examples.get(frequent_naming_convention)
 
-        if dashes_total > underscores_total:
-            self._naming_convention_counts[NamingConvention.KEBAB] += 1
-        elif underscores_total > dashes_total:
-            self._naming_convention_counts[NamingConvention.SNAKE] += 1
+        for path, conventions in path_conventions:
+            if conventions and conventions != [frequent_naming_convention]:
+                findings.inconsistent_namings.append((path, conventions))
+
+    def _naming_conventions(self, path: str) -> list[NamingConvention]:
+        """
+        Naming conventions used by the fixed (non-parameter) segments of the path, in declaration
+        order. Single-word segments fit any convention.
+        """
 
-        condition = (dashes_total > underscores_total and underscores_total == 0) or \
-            (underscores_total > dashes_total and dashes_total == 0) or \
-            (dashes_total == 0 and underscores_total == 0)
+        used = set()
+        for segment in PATH_PARAMETER_PATTERN.sub('', path).split('/'):
+            if '-' in segment:
+                used.add(NamingConvention.KEBAB)
+            if '_' in segment:
+                used.add(NamingConvention.SNAKE)
+            if CAMEL_CASE_PATTERN.search(segment):
+                used.add(NamingConvention.CAMEL)
 
-        return condition
+        return [convention for convention in NamingConvention if convention in used]
     
-    def _follows_crud_conventions(self, path: str, operations: list[str]) -> None:
+    def _follows_crud_conventions(self, path: str, operations: list[str], findings: _PathsFindings) -> None:
         """
         Checks that `path_item` follows CRUD conventions:
         - `get` for retrieval
@@ -176,4 +314,4 @@ class PathsSubscorer(BaseScorer):
             violation4 = operation == 'delete' and ('update' in path or 'edit' in path)
 
             if violation1 or violation2 or violation3 or violation4:
-                self._crud_violations.append((path, operation))
+                findings.crud_violations.append((path, operation))
@@ -1,101 +1,118 @@
+from typing import ClassVar, Sequence
 from dataclasses import dataclass, field
 
 from api_scoring_app.core import Config
-from api_scoring_app.core.subscorers import ScoringReport, Issue, IssueSeverity, ParsedSpecification, BaseScorer
+from api_scoring_app.core.subscorers import ScoringReport, IssueSeverity, IssueTemplate, ParsedSpecification, BaseScorer, ScoringContext, DEFAULT_CONTEXT
+from api_scoring_app.infra.instrumentation import span
+
+
+MISSING_RESPONSES = IssueTemplate(
+    message="Missing responses definition at: {path}",
+    severity=IssueSeverity.MEDIUM,
+    suggestion="Add a responses definition to this operation."
+)
+MISSING_SUCCESS_RESPONSE = IssueTemplate(
+    message="Missing success response code at: {path}",
+    severity=IssueSeverity.HIGH,
+    suggestion="Add at least one success response to this operation."
+)
+MISSING_ERROR_RESPONSE = IssueTemplate(
+    message="Missing error response code at: {path}",
+    severity=IssueSeverity.MEDIUM,
+    suggestion="Add appropriate error responses to this operation."
+)
+EMPTY_CONTENT_RESPONSE = IssueTemplate(
+    message="Response has no content defined at: {path}",
+    severity=IssueSeverity.LOW,
+    suggestion="Add a content definition for this response."
+)
+
+
+@dataclass
+class _ResponseCodesFindings:
+    """
+    Findings of a single `score_spec` run.
+    """
+
+    missing_success_responses: list[Sequence[str]] = field(default_factory=list)
+    missing_error_responses: list[Sequence[str]] = field(default_factory=list)
+    empty_content_responses: list[Sequence[str]] = field(default_factory=list)
+
 
 @dataclass
 class ResponseCodesSubscorer(BaseScorer):
     """
     Response Codes subscorer for OpenAPI specification.
     """
-    points: float
 
-    # _missing_responses: list[list[str]] = field(init=False, default_factory=list)
-    _missing_success_responses: list[list[str]] = field(init=False, default_factory=list)
-    _missing_error_responses: list[list[str]] = field(init=False, default_factory=list)
-    _empty_content_responses: list[list[str]] = field(init=False, default_factory=list)
+    name: ClassVar[str] = Config.RESPONSE_CODES_SUBSCORER_NAME
+    sections: ClassVar[tuple[str, ...]] = ("response_codes",)
+
+    points: float
 
-    def score_spec(self, parsed_specification: ParsedSpecification) -> list[ScoringReport]:
+    def score_spec(self, parsed_specification: ParsedSpecification, context: ScoringContext = DEFAULT_CONTEXT) -> list[ScoringReport]:
         """
         Score the specification using the response codes subscorer.
         """
-        scoring_report = ScoringReport(Config.RESPONSE_CODES_SUBSCORER_NAME, self.points)
+        scoring_report = ScoringReport(Config.RESPONSE_CODES_SUBSCORER_NAME, self.points, issue_cap=context.issue_cap)
 
-        self._populate_fields(parsed_specification)
+        with span("response codes: status codes"):
+            findings = self._populate_fields(parsed_specification)
 
         # missing responses
-        issues = []
-        for missing_response in parsed_specification.response_codes.missing_responses:
-            path_as_string = " -> ".join(missing_response)
-            issues.append(Issue(
-                message=f"Missing responses definition at: {path_as_string}",
-                path=path_as_string,
-                severity=IssueSeverity.MEDIUM,
-                suggestion="Add a responses definition to this operation."
-            ))
+        with span("response codes: missing responses"):
+            issues = (
+                MISSING_RESPONSES.issue(missing_response)
+                for missing_response in parsed_specification.response_codes.missing_responses
+            )
         
-        scoring_report.bulk_add_issues(
-            issues=issues,
-            severity=IssueSeverity.LOW
-        )
+            scoring_report.bulk_add_issues(
+                issues=issues,
+                severity=IssueSeverity.LOW,
+                rule="missing_responses"
+            )
 
         # missing success responses
-        issues = []
-        for path in self._missing_success_responses:
-            path_as_string = " -> ".join(path)
-            issues.append(Issue(
-                message=f"Missing success response code at: {path_as_string}",
-                path=path_as_string,
-                severity=IssueSeverity.HIGH,
-                suggestion=f"Add at least one success response to this operation."
-            ))
+        with span("response codes: missing success"):
+            issues = (MISSING_SUCCESS_RESPONSE.issue(path) for path in findings.missing_success_responses)
         
-        scoring_report.bulk_add_issues(
-            issues=issues,
-            severity=IssueSeverity.MEDIUM
-        )
+            scoring_report.bulk_add_issues(
+                issues=issues,
+                severity=IssueSeverity.MEDIUM,
+                rule="missing_success_responses"
+            )
 
         # missing error responses
-        issues = []
-        for path in self._missing_error_responses:
-            path_as_string = " -> ".join(path)
-            issues.append(Issue(
-                message=f"Missing error response code at: {path_as_string}",
-                path=path_as_string,
-                severity=IssueSeverity.MEDIUM,
-                suggestion=f"Add appropriate error responses to this operation."
-            ))
+        with span("response codes: missing error"):
+            issues = (MISSING_ERROR_RESPONSE.issue(path) for path in findings.missing_error_responses)
         
-        scoring_report.bulk_add_issues(
-            issues=issues,
-            severity=IssueSeverity.MEDIUM
-        )
+            scoring_report.bulk_add_issues(
+                issues=issues,
+                severity=IssueSeverity.MEDIUM,
+                rule="missing_error_responses"
+            )
 
         # empty content
-        issues = []
-        for path in self._empty_content_responses:
-            path_as_string = " -> ".join(path)
-            issues.append(Issue(
-                message=f"Response has no content defined at: {path_as_string}",
-                path=path_as_string,
-                severity=IssueSeverity.LOW,
-                suggestion=f"Add a content definition for this response."
-            ))
+        with span("response codes: empty content"):
+            issues = (EMPTY_CONTENT_RESPONSE.issue(path) for path in findings.empty_content_responses)
 
-        scoring_report.bulk_add_issues(
-            issues=issues,
-            severity=IssueSeverity.LOW
-        )
+            scoring_report.bulk_add_issues(
+                issues=issues,
+                severity=IssueSeverity.LOW,
+                rule="empty_content_responses"
+            )
 
         return [scoring_report]
     
-    def _populate_fields(self, parsed_specification: ParsedSpecification) -> None:
+    def _populate_fields(self, parsed_specification: ParsedSpecification) -> _ResponseCodesFindings:
         """
-        Populate the fields for response codes subscorer.
+        Populate the findings for response codes subscorer.
         """
 
+        findings = _ResponseCodesFindings()
+
         if parsed_specification.response_codes.responses is None:
-            return # no need to check for success/error codes
+            return findings # no need to check for success/error codes
         
         # path -> observed status codes
         by_path: dict[tuple[str], list[str]] = {}
@@ -108,10 +125,10 @@ class ResponseCodesSubscorer(BaseScorer):
                 by_path[key] = [value]
             
             # content
-            if response.content is None:
+            if response.content_types is None:
                 # "204 = no content"
                 if value not in Config.RESPONSE_CODES_NO_CONTENT_CODES:
-                    self._empty_content_responses.append(path)
+                    findings.empty_content_responses.append(path)
         
 
         for path, status_codes in by_path.items():
@@ -126,7 +143,9 @@ class ResponseCodesSubscorer(BaseScorer):
                     has_error = True
 
             if not has_success:
-                self._missing_success_responses.append(path)
+                findings.missing_success_responses.append(path)
 
             if not has_error:
-                self._missing_error_responses.append(path)
+                findings.missing_error_responses.append(path)
+
+        return findings
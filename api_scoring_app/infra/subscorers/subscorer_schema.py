@@ -1,52 +1,62 @@
+from typing import ClassVar
 from dataclasses import dataclass, field
 
 from api_scoring_app.core import Config
-from api_scoring_app.core.subscorers import ScoringReport, Issue, IssueSeverity, ParsedSpecification, BaseScorer
+from api_scoring_app.core.subscorers import ScoringReport, IssueSeverity, IssueTemplate, ParsedSpecification, BaseScorer, ScoringContext, DEFAULT_CONTEXT
+from api_scoring_app.infra.instrumentation import span
+
+
+FREE_FORM_SCHEMA = IssueTemplate(
+    message="Free-form schema found at: {path}",
+    severity=IssueSeverity.MEDIUM,
+    suggestion="Specify a concrete schema for this path."
+)
+MISSING_SCHEMA = IssueTemplate(
+    message="Missing schema in media type at: {path}",
+    severity=IssueSeverity.MEDIUM,
+    suggestion="Specify a concrete schema for this path."
+)
+
 
 @dataclass
 class SchemaSubscorer(BaseScorer):
     """
     Schema & Types subscorer for OpenAPI specification.
     """
+    name: ClassVar[str] = Config.SCHEMA_SUBSCORER_NAME
+    sections: ClassVar[tuple[str, ...]] = ("schemas",)
+
     points: float
 
-    def score_spec(self, parsed_specification: ParsedSpecification) -> list[ScoringReport]:
+    def score_spec(self, parsed_specification: ParsedSpecification, context: ScoringContext = DEFAULT_CONTEXT) -> list[ScoringReport]:
         """
         Score the specification using the schema subscorer.
         """
 
-        scoring_report = ScoringReport(Config.SCHEMA_SUBSCORER_NAME, self.points)
+        scoring_report = ScoringReport(Config.SCHEMA_SUBSCORER_NAME, self.points, issue_cap=context.issue_cap)
 
         # check for free-form schemas
-        issues = []
-        for path in parsed_specification.schemas.free_form_schemas:
-            path_as_string = " -> ".join(path) # TODO: reuse
-
-            issues.append(Issue(
-                message=f"Free-form schema found at: {path_as_string}",
-                path=path_as_string,
+        with span("schema: free-form"):
+            issues = (
+                FREE_FORM_SCHEMA.issue(path)
+                for path in parsed_specification.schemas.free_form_schemas
+            )
+            scoring_report.bulk_add_issues(
+                issues=issues,
                 severity=IssueSeverity.MEDIUM,
-                suggestion="Specify a concrete schema for this path."
-            )) # TODO: reuse
-        scoring_report.bulk_add_issues(
-            issues=issues,
-            severity=IssueSeverity.MEDIUM
-        )
+                rule="free_form_schemas"
+            )
 
         # check for missing request/response schemas
-        issues = []
-        for path in parsed_specification.schemas.missing_schemas:
-            path_as_string = " -> ".join(path)
-
-            issues.append(Issue(
-                message=f"Missing schema in media type at: {path_as_string}",
-                path=path_as_string,
-                severity=IssueSeverity.MEDIUM,
-                suggestion="Specify a concrete schema for this path."
-            ))
-        scoring_report.bulk_add_issues(
-            issues=issues,
-            severity=IssueSeverity.HIGH
-        )
+        with span("schema: missing"):
+            issues = (
+                MISSING_SCHEMA.issue(path)
+                for path in parsed_specification.schemas.missing_schemas
+            )
+            scoring_report.bulk_add_issues(
+                issues=issues,
+                severity=IssueSeverity.HIGH,
+                rule="missing_schemas"
+            )
             
         return [scoring_report]
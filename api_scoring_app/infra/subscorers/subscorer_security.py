@@ -1,31 +1,60 @@
+from typing import ClassVar, Sequence
 from dataclasses import dataclass, field
 
-from openapi_pydantic import SecurityScheme, OAuthFlows
-
 from api_scoring_app.core import Config
 from api_scoring_app.core.types import MissingFieldError
-from api_scoring_app.core.parser import WrappedSecurityRequirement
-from api_scoring_app.core.subscorers import ScoringReport, Issue, IssueSeverity, ParsedSpecification, BaseScorer
+from api_scoring_app.core.parser import WrappedSecurityRequirement, SecuritySchemeProjection, OAuthFlowsProjection
+from api_scoring_app.core.subscorers import ScoringReport, Issue, IssueSeverity, IssueTemplate, ParsedSpecification, BaseScorer, ScoringContext, DEFAULT_CONTEXT
+from api_scoring_app.infra.instrumentation import span
+
+
+INVALID_SECURITY_SCHEME = IssueTemplate(
+    message="{0}",
+    severity=IssueSeverity.ZERO,
+    suggestion="Add missing fields"
+)
+UNUSED_SECURITY_SCHEME = IssueTemplate(
+    message="Security scheme '{0}' is defined, but not referenced",
+    severity=IssueSeverity.HIGH,
+    suggestion="Reference the defined security schemes"
+)
+UNDEFINED_SECURITY_SCHEME = IssueTemplate(
+    message="Security scheme '{0}' is referenced, but not defined",
+    severity=IssueSeverity.MEDIUM,
+    suggestion="Define the referenced security schemes"
+)
+
+
+@dataclass
+class _SecurityFindings:
+    """
+    Findings of a single `score_spec` run.
+    """
+
+    security_scheme_errors: list[MissingFieldError] = field(default_factory=list)
+    unused_security_schemes: list[WrappedSecurityRequirement] = field(default_factory=list)
+    undefined_security_schemes: list[WrappedSecurityRequirement] = field(default_factory=list)
+
 
 @dataclass
 class SecuritySubscorer(BaseScorer):
     """
     Security subscorer for OpenAPI specification.
     """
+    name: ClassVar[str] = Config.SECURITY_SUBSCORER_NAME
+    sections: ClassVar[tuple[str, ...]] = ("security",)
+
     points: float
-    
-    _security_scheme_errors: list[MissingFieldError] = field(init=False, default_factory=list)
-    _unused_security_schemes: list[WrappedSecurityRequirement] = field(init=False, default_factory=list)
-    _undefined_security_schemes: list[WrappedSecurityRequirement] = field(init=False, default_factory=list)
 
-    def score_spec(self, parsed_specification: ParsedSpecification) -> list[ScoringReport]:
+    def score_spec(self, parsed_specification: ParsedSpecification, context: ScoringContext = DEFAULT_CONTEXT) -> list[ScoringReport]:
         """
         Score the specification using the security subscorer.
         """
-        scoring_report = ScoringReport(Config.SECURITY_SUBSCORER_NAME, self.points)
+        scoring_report = ScoringReport(Config.SECURITY_SUBSCORER_NAME, self.points, issue_cap=context.issue_cap)
 
         # self._recursive_security_schema_search(spec)
-        self._populate_security_info(parsed_specification)
+        with span("security: schemes"):
+            findings = self._populate_security_info(parsed_specification)
 
         # security schemes are not defined
         if not parsed_specification.security.defined_schemes:
@@ -38,71 +67,67 @@ class SecuritySubscorer(BaseScorer):
             )
 
         # security schemes are defined, but have missing fields
-        elif self._security_scheme_errors:
-            issues = []
-            for error in self._security_scheme_errors:
-                path_as_str = " -> ".join(error.path)
-                issues.append(Issue(
-                    severity=IssueSeverity.ZERO,
-                    message=str(error),
-                    path=path_as_str,
-                    suggestion="Add missing fields"
-                ))
+        elif findings.security_scheme_errors:
+            # message is rendered from the error itself
+            issues = (INVALID_SECURITY_SCHEME.issue(error.path, error) for error in findings.security_scheme_errors)
             scoring_report.bulk_add_issues(
                 issues=issues,
-                severity=IssueSeverity.CRITICAL
+                severity=IssueSeverity.CRITICAL,
+                rule="invalid_security_schemes"
             )
 
         # security schemes are correctly defined, but not referenced
-        issues = []
-        for unused in self._unused_security_schemes:
-            path_as_str = " -> ".join(unused.path)
-            issues.append(Issue(
-                severity=IssueSeverity.HIGH,
-                message=f"Security scheme '{unused.name}' is defined, but not referenced",
-                path=path_as_str,
-                suggestion="Reference the defined security schemes"
-            ))
-        scoring_report.bulk_add_issues(
-            issues=issues,
-            severity=IssueSeverity.MEDIUM
-        )
+        with span("security: unused schemes"):
+            issues = (
+                UNUSED_SECURITY_SCHEME.issue(unused.path, unused.name)
+                for unused in findings.unused_security_schemes
+            )
+            scoring_report.bulk_add_issues(
+                issues=issues,
+                severity=IssueSeverity.MEDIUM,
+                rule="unused_security_schemes"
+            )
 
         # security schemes are referenced, but not defined
-        issues = []
-        for undefined in self._undefined_security_schemes:
-            path_as_str = " -> ".join(undefined.path)
-            issues.append(Issue(
-                severity=IssueSeverity.MEDIUM,
-                message=f"Security scheme '{undefined.name}' is referenced, but not defined",
-                path=path_as_str,
-                suggestion="Define the referenced security schemes"
-            ))
-        scoring_report.bulk_add_issues(
-            issues=issues,
-            severity=IssueSeverity.HIGH
-        )
+        with span("security: undefined schemes"):
+            issues = (
+                UNDEFINED_SECURITY_SCHEME.issue(undefined.path, undefined.name)
+                for undefined in findings.undefined_security_schemes
+            )
+            scoring_report.bulk_add_issues(
+                issues=issues,
+                severity=IssueSeverity.HIGH,
+                rule="undefined_security_schemes"
+            )
 
         return [scoring_report]
     
-    def _populate_security_info(self, parsed_specification: ParsedSpecification) -> None:
+    def _populate_security_info(self, parsed_specification: ParsedSpecification) -> _SecurityFindings:
         """
-        Populate the fields for security subscorer.
+        Populate the findings for security subscorer.
         """
 
+        findings = _SecurityFindings()
+
         for path, scheme in parsed_specification.security.schemes:
             validation_errors = self._validate_security_scheme(scheme, path)
             if validation_errors:
-                self._security_scheme_errors.extend(validation_errors)
+                findings.security_scheme_errors.extend(validation_errors)
+
+        # name indexes, built once per run
+        defined_names = {scheme.name for scheme in parsed_specification.security.defined_schemes}
+        referenced_names = {scheme.name for scheme in parsed_specification.security.referenced_schemes}
 
-        self._unused_security_schemes = [scheme for scheme in parsed_specification.security.defined_schemes if scheme not in parsed_specification.security.referenced_schemes]
+        findings.unused_security_schemes = [scheme for scheme in parsed_specification.security.defined_schemes if scheme.name not in referenced_names]
         
-        undefined_from_referenced = [scheme for scheme in parsed_specification.security.referenced_schemes if scheme not in parsed_specification.security.defined_schemes]
-        undefined_from_operation_referenced = [scheme for scheme in parsed_specification.security.operation_referenced_schemes if scheme not in parsed_specification.security.defined_schemes]
-        self._undefined_security_schemes = undefined_from_referenced + undefined_from_operation_referenced
+        undefined_from_referenced = [scheme for scheme in parsed_specification.security.referenced_schemes if scheme.name not in defined_names]
+        undefined_from_operation_referenced = [scheme for scheme in parsed_specification.security.operation_referenced_schemes if scheme.name not in defined_names]
+        findings.undefined_security_schemes = undefined_from_referenced + undefined_from_operation_referenced
+
+        return findings
 
 
-    def _validate_security_scheme(self, scheme: SecurityScheme, path: list[str]) -> list[MissingFieldError]:
+    def _validate_security_scheme(self, scheme: SecuritySchemeProjection, path: Sequence[str]) -> list[MissingFieldError]:
         """
         Validate a security scheme based on its type and required fields.
         """
@@ -147,7 +172,7 @@ class SecuritySubscorer(BaseScorer):
                 return missing_field_errors
 
             # validate flows
-            flows: OAuthFlows = scheme.flows
+            flows: OAuthFlowsProjection = scheme.flows
 
             # for implicit flow
             if flows.implicit:
@@ -1,5 +1,5 @@
-from api_scoring_app.infra.utils.spec_loader import LocalSpecLoader, URLSpecLoader, SpecLoaderFactory
+from api_scoring_app.infra.utils.spec_loader import LocalSpecLoader, URLSpecLoader, BytesSpecLoader, SpecLoaderFactory
 from api_scoring_app.infra.utils.request_builder import RequestBuilder
 from api_scoring_app.infra.utils.reports import ReportGeneratorFactory
 
-__all__ = ["LocalSpecLoader", "URLSpecLoader", "SpecLoaderFactory", "RequestBuilder", "ReportGeneratorFactory"]
+__all__ = ["LocalSpecLoader", "URLSpecLoader", "BytesSpecLoader", "SpecLoaderFactory", "RequestBuilder", "ReportGeneratorFactory"]
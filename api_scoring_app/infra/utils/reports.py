@@ -1,12 +1,20 @@
+import io
 import json
+import functools
 
-from typing import List, Dict, Protocol
+from typing import Any, List, Dict, Optional, Protocol, TextIO
+from dataclasses import dataclass
 
-from api_scoring_app.core.subscorers import ScoringReport, IssueSeverity
+from api_scoring_app.core.instrumentation import StageTiming
+from api_scoring_app.core.subscorers import ScoringReport, Issue, IssueAggregate, IssueSeverity
+from api_scoring_app.infra.instrumentation import stage
 
 
 class IReportGenerator(Protocol):
-    def generate_report(self, reports: List[ScoringReport]) -> str:
+    def generate_report(self, reports: List[ScoringReport], timings: Optional[List[StageTiming]] = None) -> str:
+        pass
+
+    def write_report(self, reports: List[ScoringReport], output: TextIO, timings: Optional[List[StageTiming]] = None) -> None:
         pass
 
 
@@ -30,27 +38,20 @@ class ReportUtils:
         """
         Get the count of issues for each severity.
         """
-        severity_counts = {
-            IssueSeverity.LOW.name: 0,
-            IssueSeverity.MEDIUM.name: 0, 
-            IssueSeverity.HIGH.name: 0,
-            IssueSeverity.CRITICAL.name: 0,
-            IssueSeverity.ZERO.name: 0
-        }
-
-        for report in reports:
-            for issue in report.issues:
-                severity_name = issue.severity.name
-                severity_counts[severity_name] += 1
-
-        return severity_counts
+        return dict(zip(SEVERITY_ORDER, _sum_severity_counts(reports)))
     
     @staticmethod
     def get_overall_grade(reports: List[ScoringReport]) -> str:
         """
         Get the overall grade of the reports.
         """
-        total_score = ReportUtils.get_total_score(reports)
+        return ReportUtils.grade(ReportUtils.get_total_score(reports))
+
+    @staticmethod
+    def grade(total_score: float) -> str:
+        """
+        Get the grade of a total score.
+        """
         if total_score >= 90:
             return "A"
         elif total_score >= 80:
@@ -64,54 +65,222 @@ class ReportUtils:
         else:
             return "F"
 
+    @staticmethod
+    def get_summary(reports: List[ScoringReport]) -> Dict[str, Any]:
+        """
+        Get the summary fields of the report (scores, grade, severity counts), in a single pass over the reports.
+        """
+        total_score = 0
+        max_possible_score = 0
+
+        for report in reports:
+            total_score += report.points
+            max_possible_score += report.max_points
+
+        total_score = round(total_score, 1)
+        return {
+            "total_score": total_score,
+            "max_total_Score": round(max_possible_score, 1),
+            "overall_grade": ReportUtils.grade(total_score),
+            "severity_counts": ReportUtils.get_severity_counts(reports),
+        }
+
+
+# order of `severity_counts` in reports, same as severity codes of `ScoringReport.counts_by_severity`
+SEVERITY_ORDER = [severity.name for severity in IssueSeverity]
+
+
+def _sum_severity_counts(reports: List[ScoringReport]) -> List[int]:
+    totals = [0] * len(SEVERITY_ORDER)
+    for report in reports:
+        for code, count in enumerate(report.counts_by_severity):
+            totals[code] += count
+    return totals
+
+
+def _report_fields(report: ScoringReport) -> Dict[str, Any]:
+    return {
+        "subscorer": report.subscorer,
+        "score": round(report.points, 1),
+        "max_score": round(report.max_points, 1),
+    }
+
+
+ISSUE_FIELDS = ("message", "severity", "path", "suggestion")
+
+
+def _issue_values(issue: Issue) -> tuple[Any, ...]:
+    # lazy path is joined once, for both message and path
+    message, path = issue.rendered()
+    suggestion = issue.suggestion
+    return message, issue.severity.name, path if path else "N/A", suggestion if suggestion else "N/A"
+
+
+def _issue_data(issue: Issue) -> Dict[str, Any]:
+    return dict(zip(ISSUE_FIELDS, _issue_values(issue)))
+
+
+def _aggregate_data(aggregate: IssueAggregate) -> Dict[str, Any]:
+    return {
+        "rule": aggregate.rule,
+        "count": aggregate.count,
+        "omitted": aggregate.omitted,
+        "path_histogram": aggregate.path_histogram
+    }
+
+
+def _timings_data(timings: List[StageTiming]) -> List[Dict[str, Any]]:
+    return [timing.to_dict() for timing in sorted(timings, key=lambda timing: timing.start)]
 
+
+@dataclass
 class JsonReportGenerator:
-    def generate_report(self, reports: List[ScoringReport]) -> str:
-        """
-        Generate a JSON report of the reports.
-        """
-        try:
-            total_score = ReportUtils.get_total_score(reports)
-            overall_grade = ReportUtils.get_overall_grade(reports)
-            severity_counts = ReportUtils.get_severity_counts(reports)
-            max_possible_score = ReportUtils.get_max_possible_score(reports)
-
-            report_data = {
-                "total_score": total_score,
-                "max_total_Score": max_possible_score,
-                "overall_grade": overall_grade,
-                "severity_counts": severity_counts,
-                "reports": [{
-                    "subscorer": report.subscorer,
-                    "score": round(report.points, 1),
-                    "max_score": round(report.max_points, 1),
-                    "issues": [
-                        {
-                            "message": issue.message,
-                            "severity": issue.severity.name,
-                            "path": issue.path if issue.path else "N/A",
-                            "suggestion": issue.suggestion if issue.suggestion else "N/A"
-                        }
-                        for issue in report.issues
-                    ]
-                } for report in reports]
-            }
-                
-            return json.dumps(report_data, indent=2)
-        except json.JSONDecodeError as e:
-            print(e)
-            return "Error generating report"
+    """
+    JSON report, pretty-printed with `indent` spaces, or compact if `indent` is None.
+    With `summary_only`, reports hold scores only, issues are never rendered.
+    """
+
+    indent: Optional[int] = 2
+    summary_only: bool = False
+
+    def build_report_data(self, reports: List[ScoringReport]) -> Dict[str, Any]:
+        """
+        Build JSON-serializable report data of the reports.
+        """
+        if self.summary_only:
+            return {**ReportUtils.get_summary(reports), "reports": [_report_fields(report) for report in reports]}
+
+        return {
+            **ReportUtils.get_summary(reports),
+            "reports": [{
+                **_report_fields(report),
+                "issues": [_issue_data(issue) for issue in report.issues],
+                # aggregation mode only
+                **({"aggregates": [_aggregate_data(aggregate) for aggregate in report.aggregates]} if report.aggregates else {})
+            } for report in reports]
+        }
+
+    def generate_report(self, reports: List[ScoringReport], timings: Optional[List[StageTiming]] = None) -> str:
+        """
+        Generate a JSON report of the reports, with `timings` section if stage timings are given.
+        """
+        output = io.StringIO()
+        self.write_report(reports, output, timings)
+        return output.getvalue().rstrip("\n")
+
+    def write_report(self, reports: List[ScoringReport], output: TextIO, timings: Optional[List[StageTiming]] = None) -> None:
+        """
+        Stream the report to `output`, issue by issue, without building the whole document in memory.
+        Output is the same as `json.dumps` of `build_report_data` (plus `timings`), with trailing newline.
+        """
+        indent = self.indent
+        key_separator = ": " if indent is not None else ":"
+
+        def newline(level: int) -> str:
+            return "" if indent is None else "\n" + " " * (indent * level)
+
+        def dumps(value: Any, level: int) -> str:
+            # nested value, re-indented to its level (encoded strings can't contain raw newlines)
+            if indent is None:
+                return json.dumps(value, separators=(",", ":"))
+            return json.dumps(value, indent=indent).replace("\n", newline(level))
+
+        def fields(data: Dict[str, Any], level: int) -> str:
+            # strings are encoded directly by the C encoder, `json.dumps` with indent is pure-python
+            separator = newline(level)
+            return ",".join(
+                f"{separator}{encode_string(key)}{key_separator}{encode_string(value) if type(value) is str else dumps(value, level)}"
+                for key, value in data.items()
+            )
+
+        write = output.write
+        encode_string = json.encoder.encode_basestring_ascii
+
+        # issues are the bulk of the report, their objects are filled into a layout built once
+        issue_layout = "{" + ",".join(
+            f"{newline(5)}{encode_string(key)}{key_separator}%s" for key in ISSUE_FIELDS
+        ) + newline(4) + "}"
+
+        def issue_object(issue: Issue) -> str:
+            return issue_layout % tuple(
+                encode_string(value) if type(value) is str else dumps(value, 5) for value in _issue_values(issue)
+            )
+
+        with stage("report"):
+            write("{" + fields(ReportUtils.get_summary(reports), 1))
+
+            write(f",{newline(1)}\"reports\"{key_separator}[")
+            for report_index, report in enumerate(reports):
+                write(("," if report_index else "") + newline(2) + "{" + fields(_report_fields(report), 3))
+                if self.summary_only:
+                    write(newline(2) + "}")
+                    continue
+
+                write(f",{newline(3)}\"issues\"{key_separator}[")
+                issue_newline = newline(4)
+                for issue_index, issue in enumerate(report.issues):
+                    write(("," if issue_index else "") + issue_newline + issue_object(issue))
+                write((newline(3) if report.issues else "") + "]")
+
+                if report.aggregates:
+                    write("," + fields({"aggregates": [_aggregate_data(aggregate) for aggregate in report.aggregates]}, 3))
+
+                write(newline(2) + "}")
+            write((newline(1) if reports else "") + "]")
+
+        # written after the report stage, so it's included if `timings` is the live list of active instrumentation
+        if timings is not None:
+            write("," + fields({"timings": _timings_data(timings)}, 1))
+
+        write(newline(0) + "}\n")
+
+
+class NdjsonReportGenerator:
+    """
+    Newline-delimited JSON report, one object per line: `summary`, then every subscorer `report`
+    followed by its `issue` (and `aggregate`, in aggregation mode) lines, and `timings` if stage
+    timings are given. With `summary_only`, `issue` and `aggregate` lines are left out.
+    """
+
+    def __init__(self, summary_only: bool = False) -> None:
+        self.summary_only = summary_only
+
+    def generate_report(self, reports: List[ScoringReport], timings: Optional[List[StageTiming]] = None) -> str:
+        output = io.StringIO()
+        self.write_report(reports, output, timings)
+        return output.getvalue().rstrip("\n")
+
+    def write_report(self, reports: List[ScoringReport], output: TextIO, timings: Optional[List[StageTiming]] = None) -> None:
+        dumps = functools.partial(json.dumps, separators=(",", ":"))
+        write = output.write
+
+        with stage("report"):
+            write(dumps({"type": "summary", **ReportUtils.get_summary(reports)}) + "\n")
 
+            for report in reports:
+                write(dumps({"type": "report", **_report_fields(report), "issue_count": report.issue_count}) + "\n")
+                if self.summary_only:
+                    continue
+                for issue in report.issues:
+                    write(dumps({"type": "issue", "subscorer": report.subscorer, **_issue_data(issue)}) + "\n")
+                for aggregate in report.aggregates:
+                    write(dumps({"type": "aggregate", "subscorer": report.subscorer, **_aggregate_data(aggregate)}) + "\n")
 
+        if timings is not None:
+            write(dumps({"type": "timings", "timings": _timings_data(timings)}) + "\n")
 
 
 class ReportGeneratorFactory:
     """Factory for creating spec exporters."""
 
     @staticmethod
-    def generate(format: str = "json") -> IReportGenerator:
+    def generate(format: str = "json", summary_only: bool = False) -> IReportGenerator:
         if format == "json":
-            return JsonReportGenerator()
+            return JsonReportGenerator(summary_only=summary_only)
+        elif format == "json-compact":
+            return JsonReportGenerator(indent=None, summary_only=summary_only)
+        elif format == "ndjson":
+            return NdjsonReportGenerator(summary_only=summary_only)
         # elif format == "md":
         #     return MarkdownReportGenerator()
         else:
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
-import requests
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from typing import Any, Dict, Optional
+if TYPE_CHECKING:
+    import requests
+
+
+def __getattr__(name: str) -> Any:
+    # `requests` is imported on first use (it's heavy and only URL sources need it),
+    # `request_builder.requests` stays available, e.g. for patching in tests
+    if name == "requests":
+        import requests
+        return requests
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 
@@ -55,6 +65,8 @@ class RequestBuilder:
         return request
     
     def get(self) -> requests.Response:
+        import requests
+
         request_config = self._build()
 
         response = requests.get(
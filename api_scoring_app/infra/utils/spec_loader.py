@@ -1,15 +1,93 @@
+from __future__ import annotations
+
 import os
+import gzip
+import hashlib
 import yaml
 import json
-import requests
+import logging
 
-from typing import Any
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional
 from api_scoring_app.core import ISpecLoader
 from api_scoring_app.core.spec_loader import SpecLoaderException
 from api_scoring_app.infra.utils.request_builder import RequestBuilder
+from api_scoring_app.infra.instrumentation import span
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+
+class _JsonKeysMixin:
+    """
+    Converts mapping keys to strings, the same way json would (`200` -> `"200"`).
+    Loaded object can be handed over to validator as is, without json round trip.
+    """
+
+    def construct_mapping(self, node, deep=False):
+        mapping = super().construct_mapping(node, deep=deep)
+
+        if all(isinstance(key, str) for key in mapping):
+            return mapping
+
+        return {_json_key(key): value for key, value in mapping.items()}
+
+
+class JsonKeysSafeLoader(_JsonKeysMixin, yaml.SafeLoader):
+    """Pure-Python YAML safe loader."""
+
+
+if getattr(yaml, "__with_libyaml__", False):
+    class JsonKeysCSafeLoader(_JsonKeysMixin, yaml.CSafeLoader):
+        """YAML safe loader backed by libyaml."""
+
+    YAML_LOADER = JsonKeysCSafeLoader
+    YAML_BACKEND = "libyaml"
+else:
+    YAML_LOADER = JsonKeysSafeLoader
+    YAML_BACKEND = "python"
+
+
+def _json_key(key: Any) -> str:
+    if isinstance(key, str):
+        return key
+    if isinstance(key, (bool, int, float)) or key is None:
+        return json.dumps(key)
+    return str(key)
+
+
+def load_yaml(stream: Any) -> Any:
+    """
+    Load YAML from string, bytes or (binary) stream, with the fastest available loader.
+    """
+
+    return yaml.load(stream, Loader=YAML_LOADER)
+
+
+def parse_spec_data(data: str | bytes) -> Any:
+    """
+    Parse raw specification text/bytes, json first, yaml otherwise.
+    """
+
+    try:
+        return json.loads(data)
+    except ValueError:
+        return load_yaml(data)
+
 
 class LocalSpecLoader:
-    """Load OpenAPI specification from a local file."""
+    """
+    Load OpenAPI specification from a local file.
+
+    Supports `.yaml`/`.yml` and `.json` files, optionally gzip-compressed (`.yaml.gz`, `.json.gz`).
+    """
+
+    FORMATS = {
+        ".yaml": "yaml",
+        ".yml": "yaml",
+        ".json": "json",
+    }
 
     def __init__(self, spec_path: str):
         self.spec_source = spec_path
@@ -18,51 +96,114 @@ class LocalSpecLoader:
         if not os.path.exists(self.spec_source):
             raise SpecLoaderException(f"File not found: {self.spec_source}")
         
-        extension = os.path.splitext(self.spec_source)[1]
-        if extension == '.yaml':
-            try:
-                with open(self.spec_source, 'r') as file:
-                    yaml_data = yaml.safe_load(file)
-                return yaml_data 
-            except Exception as e:
-                raise SpecLoaderException(f"Error loading spec from local file: {e}")
-        elif extension == '.json':
-            try:
-                with open(self.spec_source, 'r') as file:
-                    json_data = json.load(file)
-                return json_data
-            except Exception as e:
-                raise SpecLoaderException(f"Error loading spec from local file: {e}")
-        else:
-            raise SpecLoaderException(f"Unsupported file extension, should be .yaml or .json")
+        spec_format, compressed = self.detect_format(self.spec_source)
+        if spec_format is None:
+            raise SpecLoaderException(f"Unsupported file extension, should be .yaml or .json (.yml and .gz compressed files are accepted too)")
+
+        backend = YAML_BACKEND if spec_format == "yaml" else "json"
+        logger.debug("Loading %s (%s%s) with %s backend", self.spec_source, spec_format, ", gzip" if compressed else "", backend)
+
+        try:
+            with span("load local file", "loader", path=self.spec_source, format=spec_format, compressed=compressed, backend=backend), \
+                    self._open(compressed) as file:
+                if spec_format == "yaml":
+                    return load_yaml(file)
+
+                # bytes are decoded by json itself, single pass
+                return json.loads(file.read())
+        except Exception as e:
+            raise SpecLoaderException(f"Error loading spec from local file: {e}")
+
+    @classmethod
+    def detect_format(cls, spec_path: str) -> tuple[Optional[str], bool]:
+        """
+        Spec format by file extension (`None` if unsupported) and whether file is gzip-compressed.
+        """
+
+        root, extension = os.path.splitext(spec_path)
+        compressed = extension == '.gz'
+        if compressed:
+            extension = os.path.splitext(root)[1]
+
+        return cls.FORMATS.get(extension), compressed
+
+    def digest(self) -> str:
+        """
+        SHA-256 of the raw (possibly compressed) file bytes, read in chunks.
+        """
+
+        if not os.path.exists(self.spec_source):
+            raise SpecLoaderException(f"File not found: {self.spec_source}")
+
+        sha = hashlib.sha256()
+        with open(self.spec_source, 'rb') as file:
+            for chunk in iter(lambda: file.read(1 << 20), b''):
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    def _open(self, compressed: bool) -> BinaryIO:
+        """
+        Open spec file as binary stream, decompressing on the fly if needed.
+        """
+
+        if compressed:
+            return gzip.open(self.spec_source, 'rb')
+        return open(self.spec_source, 'rb')
 
 class URLSpecLoader:
     """Load OpenAPI specification from a URL."""
 
     def __init__(self, spec_url: str):
         self.spec_url = spec_url
+        self._response: Optional[requests.Response] = None
+
+    def _fetch(self) -> requests.Response:
+        """
+        Fetch the spec once, both `load` and `digest` work on the same response.
+        """
+
+        if self._response is None:
+            with span("fetch URL", "loader", url=self.spec_url):
+                self._response = RequestBuilder() \
+                    .with_url(self.spec_url) \
+                    .with_headers({"Accept": "application/json, application/yaml"}) \
+                    .with_timeout(10) \
+                    .get()
+
+        return self._response
+
+    def digest(self) -> str:
+        """
+        SHA-256 of the response body.
+        """
+
+        # requests is heavy to import, only URL sources need it
+        import requests
+
+        try:
+            return hashlib.sha256(self._fetch().content).hexdigest()
+        except requests.RequestException as e:
+            raise SpecLoaderException(f"Error loading spec from URL: {e}")
 
     def load(self) -> dict[str, Any]:
+        import requests
+
         try:
-            response = RequestBuilder() \
-                .with_url(self.spec_url) \
-                .with_headers({"Accept": "application/json, application/yaml"}) \
-                .with_timeout(10) \
-                .get()
+            response = self._fetch()
 
             content_type = response.headers.get("Content-Type", "").lower()
 
             if "json" in content_type:
                 return response.json()
             elif ("yaml" in content_type) or ("yml" in content_type):
-                return yaml.safe_load(response.text)
+                return load_yaml(response.text)
             else:
                 # try json first, then yaml
                 try:
                     return response.json()
                 except json.JSONDecodeError:
                     try:
-                        return yaml.safe_load(response.text)
+                        return load_yaml(response.text)
                     except yaml.YAMLError:
                         raise SpecLoaderException("Loaded spec is not valid yaml, nor json")
 
@@ -71,6 +212,35 @@ class URLSpecLoader:
         except (json.JSONDecodeError, yaml.YAMLError) as e:
             raise SpecLoaderException(f"Error parsing spec from URL: {e}")
 
+class BytesSpecLoader:
+    """
+    Load OpenAPI specification from raw (optionally gzip-compressed) bytes, e.g. a request body.
+    """
+
+    def __init__(self, data: bytes, compressed: bool = False):
+        self.data = data
+        self.compressed = compressed
+
+    def digest(self) -> str:
+        """
+        SHA-256 of the raw bytes, as received.
+        """
+
+        return hashlib.sha256(self.data).hexdigest()
+
+    def load(self) -> dict[str, Any]:
+        try:
+            with span("load bytes", "loader", size=len(self.data), compressed=self.compressed):
+                data = gzip.decompress(self.data) if self.compressed else self.data
+                spec = parse_spec_data(data)
+        except Exception as e:
+            raise SpecLoaderException(f"Error loading spec from bytes: {e}")
+
+        if not isinstance(spec, dict):
+            raise SpecLoaderException("Loaded spec is not an object")
+
+        return spec
+
 class SpecLoaderFactory:
     """Factory for creating spec loaders."""
 
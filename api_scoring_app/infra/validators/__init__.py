@@ -1,5 +1,8 @@
 from api_scoring_app.infra.validators.pydantic_validator import PydanticValidator
+from api_scoring_app.infra.validators.ref_resolver import RefResolver, RefResolutionError
 
 __all__ = [
     "PydanticValidator",
+    "RefResolver",
+    "RefResolutionError",
 ]
@@ -1,41 +1,49 @@
-from typing import Any
-from prance.util.resolver import RefResolver
-from prance.util.formats import parse_spec
-from prance import _PLACEHOLDER_URL as PLACEHOLDER_URL
+from typing import Any, Optional
 
 from openapi_pydantic import OpenAPI
 from pydantic_core import ValidationError as PydanticValidationError
 
-from api_scoring_app.core.validator import ValidationResult, ValidationError
+from api_scoring_app.core.validator import ValidationResult, ValidationError, SpecInput
+from api_scoring_app.infra.utils.spec_loader import parse_spec_data
+from api_scoring_app.infra.instrumentation import stage
+from api_scoring_app.infra.validators.ref_resolver import RefResolver
 
 class PydanticValidator:
-    
-    def _resolve(self, spec_string: str) -> dict[str, Any]:
+
+    def _resolve(self, spec: SpecInput, source: Optional[str] = None) -> tuple[dict[str, Any], list[str]]:
         """
-        Uses Prance just for resolving references.
+        Resolves references with in-house `RefResolver`, returns the resolved spec and external files it references.
+
+        Already loaded objects are resolved in place, raw text/bytes are parsed first. File references
+        are only followed for specs read from a file (`source`), not for bytes received or fetched.
         """
 
-        specification = parse_spec(spec_string, PLACEHOLDER_URL)
+        if isinstance(spec, (str, bytes)):
+            specification = parse_spec_data(spec)
+        else:
+            specification = spec
 
-        resolver = RefResolver(
-            specification,
-            PLACEHOLDER_URL
-        )
-        resolver.resolve_references()
-        return resolver.specs
+        resolver = RefResolver(base_path=source, allow_files=source is not None)
+        return resolver.resolve(specification), resolver.external_documents
 
-    def validate(self, spec_string: str) -> ValidationResult:
+    def validate(self, spec: SpecInput, source: Optional[str] = None) -> ValidationResult:
         """
         Uses pydantic models from `openapi-pydantic` for validating the resolved spec.
+
+        `spec` can be either already loaded specification object (it will be resolved in place),
+        or raw json/yaml string/bytes. `source` is the location of the specification file,
+        relative file references are resolved against it, without it file references are rejected.
         """
-        
+
         result = ValidationResult()
-        
+
         try:
             # Resolve references first
-            resolved_spec = self._resolve(spec_string)
+            with stage("resolve"):
+                resolved_spec, result.documents = self._resolve(spec, source)
 
-            spec_model = OpenAPI.model_validate(resolved_spec)
+            with stage("pydantic"):
+                spec_model = OpenAPI.model_validate(resolved_spec)
             result.set_specification(spec_model)
         except PydanticValidationError as e:
             for error in e.errors():
@@ -43,4 +51,4 @@ class PydanticValidator:
         except Exception as e:
             result.add_error(str(e))
 
-        return result
\ No newline at end of file
+        return result
@@ -0,0 +1,241 @@
+import os
+
+from typing import Any, Optional
+from urllib.parse import unquote, urlparse
+
+
+class RefResolutionError(Exception):
+    """
+    Exception raised when `$ref` can not be resolved.
+    """
+    pass
+
+
+class RefResolver:
+    """
+    Iterative `$ref` resolver.
+
+    References are resolved in place: every `{"$ref": ...}` object is replaced by the
+    referenced object itself, so a component referenced from many places is resolved
+    once and shared by identity (nothing is copied).
+
+    Recursive references would make the result cyclic, so after resolution, references
+    closing a cycle are put back as plain `{"$ref": ...}` objects (valid `Reference`s
+    for the validator).
+
+    Local file references (`other.yaml#/components/schemas/Pet`) are supported, relative
+    to the referencing document. Every file is loaded once per resolver. With `allow_files`
+    off (specs received from untrusted sources), every reference outside the document is
+    rejected without touching the file system.
+    """
+
+    def __init__(self, base_path: Optional[str] = None, allow_files: bool = True):
+        # uri of the root document, relative file references are resolved against it
+        self.base_uri = os.path.abspath(base_path) if base_path else os.path.join(os.getcwd(), "")
+        self.allow_files = allow_files
+
+        # per-run document cache: uri -> document
+        self._documents: dict[str, Any] = {}
+
+        # (id(container), key) -> original `$ref`, for every replaced reference
+        self._ref_edges: dict[tuple[int, Any], str] = {}
+
+    def resolve(self, spec: dict[str, Any]) -> dict[str, Any]:
+        """
+        Resolve all references of the `spec` (in place) and return it.
+        """
+
+        self._documents[self.base_uri] = spec
+
+        self._link(spec, self.base_uri)
+        self._break_cycles(spec)
+
+        return spec
+
+    @property
+    def external_documents(self) -> list[str]:
+        """
+        Absolute paths of the files loaded for references, the root document excluded.
+        """
+
+        return [uri for uri in self._documents if uri != self.base_uri]
+
+    def _link(self, root: Any, root_uri: str) -> None:
+        """
+        Replace every reference object with its target, walking with an explicit stack.
+        """
+
+        visited: set[int] = set()
+        stack: list[tuple[Any, str]] = [(root, root_uri)]
+
+        while stack:
+            node, uri = stack.pop()
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+
+            items = node.items() if isinstance(node, dict) else enumerate(node)
+            for key, value in items:
+                value_uri = uri
+
+                if isinstance(value, dict) and isinstance(value.get("$ref"), str):
+                    ref = value["$ref"]
+                    value, value_uri = self._lookup(ref, uri)
+
+                    # replacing values of existing keys is safe while iterating
+                    node[key] = value
+                    self._ref_edges[(id(node), key)] = ref
+
+                if isinstance(value, (dict, list)) and id(value) not in visited:
+                    stack.append((value, value_uri))
+
+    def _break_cycles(self, root: Any) -> None:
+        """
+        Depth-first search over resolved object graph, every reference pointing back to
+        an object which is still being visited (cycle) is restored as `{"$ref": ...}`.
+        Cycle found through a plain (containment) edge is broken at the nearest reference
+        on the path instead, so the result doesn't depend on the order of keys.
+        """
+
+        in_progress: set[int] = set()
+        done: set[int] = set()
+
+        # (node, key in its parent, children iterator)
+        in_progress.add(id(root))
+        stack: list[tuple[Any, Any, Any]] = [(root, None, iter(self._children(root)))]
+
+        while stack:
+            node, _, children = stack[-1]
+
+            for key, child in children:
+                if not isinstance(child, (dict, list)) or id(child) in done:
+                    continue
+
+                if id(child) in in_progress:
+                    ref = self._ref_edges.get((id(node), key))
+                    if ref is None:
+                        self._break_path(stack, child, in_progress)
+                        break
+                    # replacing values of existing keys is safe while iterating
+                    node[key] = {"$ref": ref}
+                    continue
+
+                in_progress.add(id(child))
+                stack.append((child, key, iter(self._children(child))))
+                break
+            else:
+                stack.pop()
+                in_progress.discard(id(node))
+                done.add(id(node))
+
+    def _break_path(self, stack: list[tuple[Any, Any, Any]], target: Any, in_progress: set[int]) -> None:
+        """
+        Restore the nearest reference on the search path from `target` to the top of the stack.
+        Nodes above it are unwound (not done), they are searched again if reachable some other way.
+        """
+
+        for index in range(len(stack) - 1, 0, -1):
+            node, key, _ = stack[index]
+            if node is target:
+                break
+
+            parent = stack[index - 1][0]
+            ref = self._ref_edges.get((id(parent), key))
+            if ref is not None:
+                parent[key] = {"$ref": ref}
+                for unwound, _, _ in stack[index:]:
+                    in_progress.discard(id(unwound))
+                del stack[index:]
+                return
+
+        raise RefResolutionError("Specification contains recursive structure without references")
+
+    @staticmethod
+    def _children(node: Any):
+        return node.items() if isinstance(node, dict) else enumerate(node)
+
+    def _lookup(self, ref: str, uri: str) -> tuple[Any, str]:
+        """
+        Find the target of a reference, following chains of references (`A -> B -> C`).
+        Returns the target and uri of the document it belongs to.
+        """
+
+        seen: set[tuple[str, str]] = set()
+
+        while True:
+            target_uri, pointer = self._split_ref(ref, uri)
+            if (target_uri, pointer) in seen:
+                raise RefResolutionError(f"Circular reference chain: {ref}")
+            seen.add((target_uri, pointer))
+
+            target, target_uri = self._walk_pointer(target_uri, pointer, ref)
+
+            if isinstance(target, dict) and isinstance(target.get("$ref"), str):
+                ref, uri = target["$ref"], target_uri
+                continue
+
+            return target, target_uri
+
+    def _split_ref(self, ref: str, uri: str) -> tuple[str, str]:
+        """
+        Split the reference into absolute document uri and json pointer.
+        """
+
+        location, _, pointer = ref.partition("#")
+        if not location:
+            return uri, pointer
+
+        if not self.allow_files:
+            raise RefResolutionError(f"Only references within the document are allowed: {ref}")
+
+        parsed = urlparse(location)
+        if parsed.scheme not in ("", "file") or parsed.netloc:
+            raise RefResolutionError(f"Only local references are supported: {ref}")
+
+        path = unquote(parsed.path)
+        if not os.path.isabs(path):
+            path = os.path.join(os.path.dirname(uri), path)
+        return os.path.normpath(path), pointer
+
+    def _document(self, uri: str) -> Any:
+        if uri not in self._documents:
+            # imported here, loaders are not needed for specs without file references
+            from api_scoring_app.infra.utils.spec_loader import LocalSpecLoader
+
+            try:
+                self._documents[uri] = LocalSpecLoader(uri).load()
+            except Exception as e:
+                raise RefResolutionError(f"Can not load referenced document {uri}: {e}")
+
+        return self._documents[uri]
+
+    def _walk_pointer(self, uri: str, pointer: str, ref: str) -> tuple[Any, str]:
+        """
+        Walk RFC 6901 json pointer (`/components/schemas/Pet`) in the document,
+        following references met on the way.
+        """
+
+        node = self._document(uri)
+        if not pointer:
+            return node, uri
+
+        if not pointer.startswith("/"):
+            raise RefResolutionError(f"Invalid reference: {ref}")
+
+        for token in pointer[1:].split("/"):
+            if isinstance(node, dict) and isinstance(node.get("$ref"), str):
+                node, uri = self._lookup(node["$ref"], uri)
+
+            token = unquote(token).replace("~1", "/").replace("~0", "~")
+
+            try:
+                if isinstance(node, list):
+                    node = node[int(token)]
+                elif isinstance(node, dict):
+                    node = node[token]
+                else:
+                    raise KeyError(token)
+            except (KeyError, IndexError, ValueError):
+                raise RefResolutionError(f"Unresolvable reference: {ref}")
+
+        return node, uri
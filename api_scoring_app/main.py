@@ -1,51 +1,380 @@
+import sys
+import json
 import click
+import signal
+import logging
 
 from typing import Optional
+from contextlib import nullcontext
 
-from api_scoring_app.core.validator import ValidationException
-from api_scoring_app.infra.utils.spec_loader import SpecLoaderException
-from api_scoring_app.infra.utils.reports import ReportGeneratorFactory
-from api_scoring_app.runner.ApiSpecProcessor import APISpecificationProcessor
-from api_scoring_app.infra.subscorers import ExamplesSubscorer, SchemaSubscorer, DescriptionSubscorer, PathsSubscorer, ResponseCodesSubscorer, SecuritySubscorer, MiscSubscorer
+from api_scoring_app.client import DEFAULT_HOST, DEFAULT_PORT
+from api_scoring_app.core.types import ExecutionMode, ResultOrder
 
-@click.command()
+# scoring pipeline (pydantic models, subscorers, ...) is imported by the command that needs it,
+# so `--help`, usage errors and the other commands don't pay for it
+
+
+class DefaultCommandGroup(click.Group):
+    """
+    Group that falls back to `default_command` when the first argument is not a command name,
+    so `run.py spec.yaml` keeps working next to `run.py batch ...`.
+    """
+
+    def __init__(self, *args, default_command: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.default_command = default_command
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if args and args[0] not in self.commands and args[0] not in ctx.help_option_names:
+            args = [self.default_command] + args
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultCommandGroup, default_command="score")
+def main():
+    """
+    Score OpenAPI specifications, `score` is the default command.
+    """
+
+
+@main.command()
 @click.argument("spec_source", type=click.Path(exists=True, dir_okay=False), required=True)
 @click.option(
     '--format', '-f',
-    type=click.Choice(['json'], case_sensitive=False),
+    type=click.Choice(['json', 'json-compact', 'ndjson'], case_sensitive=False),
     default='json',
-    help='Report output format (default: json)'
+    help='Report output format: pretty-printed json, json-compact or ndjson (one summary/report/issue object per line) (default: json)'
 )
 @click.option(
     '--output-file', '-o',
     type=click.Path(dir_okay=False, writable=True),
     help='Report output file path (default: stdout)'
 )
-def main(spec_source: str, format: Optional[str], output_file: Optional[str]):
-    processor = APISpecificationProcessor()
+@click.option(
+    '--cache-dir',
+    type=click.Path(file_okay=False, writable=True),
+    help='Directory for caching reports of already scored specifications (default: no caching)'
+)
+@click.option(
+    '--cache-max-size',
+    type=click.IntRange(min=1),
+    default=256,
+    show_default=True,
+    help='Maximum size of the cache directory in MiB, least recently used entries are evicted'
+)
+@click.option(
+    '--execution-mode',
+    type=click.Choice([mode.value for mode in ExecutionMode], case_sensitive=False),
+    default=ExecutionMode.SEQUENTIAL.value,
+    show_default=True,
+    help='Run subscorers one after another, or concurrently in a thread/process pool'
+)
+@click.option(
+    '--workers',
+    type=click.IntRange(min=1),
+    help='Size of the subscorer pool (default: one worker per subscorer)'
+)
+@click.option(
+    '--subscorer-timeout',
+    type=click.FloatRange(min=0, min_open=True),
+    help='Seconds to wait for each subscorer in pool modes, slower ones get zero score (default: no timeout)'
+)
+@click.option(
+    '--max-issues-per-rule',
+    type=click.IntRange(min=0),
+    help='Aggregate issues: keep only the first N issues of every rule, with exact counts and a histogram by top-level path (default: keep all)'
+)
+@click.option(
+    '--summary-only',
+    is_flag=True,
+    default=False,
+    help='Report scores, grade and severity counts only, without issues (issue messages and paths are never formatted)'
+)
+@click.option(
+    '--profile',
+    is_flag=True,
+    default=False,
+    help='Add `timings` section to the report, wall and CPU time of every pipeline stage'
+)
+@click.option(
+    '--profile-memory',
+    is_flag=True,
+    default=False,
+    help='Same as --profile, with tracemalloc peak of every stage too (slows scoring down)'
+)
+@click.option(
+    '--trace',
+    'trace_file',
+    type=click.Path(dir_okay=False, writable=True),
+    help='Write Chrome trace-event JSON of stages, parser collectors and subscorer rules to this file (open in Perfetto)'
+)
+@click.option(
+    '--debug',
+    is_flag=True,
+    default=False,
+    help='Print debug output to stderr'
+)
+def score(spec_source: str, format: Optional[str], output_file: Optional[str], cache_dir: Optional[str], cache_max_size: int,
+          execution_mode: str, workers: Optional[int], subscorer_timeout: Optional[float], max_issues_per_rule: Optional[int], summary_only: bool, profile: bool, profile_memory: bool, trace_file: Optional[str], debug: bool):
+    """
+    Score a single specification.
+    """
+
+    if debug:
+        logging.basicConfig(level=logging.DEBUG, format="%(levelname)s %(name)s: %(message)s")
 
-    processor.scoring_engine.add_subscorer(SchemaSubscorer(points=20))
-    processor.scoring_engine.add_subscorer(DescriptionSubscorer(points=20))
-    processor.scoring_engine.add_subscorer(PathsSubscorer(points=15))
-    processor.scoring_engine.add_subscorer(ResponseCodesSubscorer(points=15))
-    processor.scoring_engine.add_subscorer(ExamplesSubscorer(points=10))
-    processor.scoring_engine.add_subscorer(SecuritySubscorer(points=10))
-    processor.scoring_engine.add_subscorer(MiscSubscorer(points=10))
+    from api_scoring_app.core.validator import ValidationException
+    from api_scoring_app.infra.utils.spec_loader import SpecLoaderException
+    from api_scoring_app.infra.utils.reports import ReportGeneratorFactory
+    from api_scoring_app.runner.ProcessorFactory import ProcessorFactory
+    from api_scoring_app.infra.instrumentation import Instrumentation, Tracer
+
+    cache = None
+    if cache_dir:
+        from api_scoring_app.infra.cache import DiskSpecCache
+        cache = DiskSpecCache(cache_dir, max_bytes=cache_max_size * 1024 * 1024)
+    instrumentation = Instrumentation(trace_memory=profile_memory) if profile or profile_memory else None
+    tracer = Tracer() if trace_file else None
+
+    processor = ProcessorFactory.create(
+        cache=cache,
+        execution_mode=ExecutionMode(execution_mode.lower()),
+        max_workers=workers,
+        subscorer_timeout=subscorer_timeout,
+        instrumentation=instrumentation,
+        issue_cap=max_issues_per_rule
+    )
 
     try:
-        scoring_reports = processor.process(spec_source)
+        with tracer.activate() if tracer else nullcontext():
+            scoring_reports = processor.process(spec_source)
 
-        report_generator = ReportGeneratorFactory.generate(format=format)
-        report = report_generator.generate_report(scoring_reports)
+            report_generator = ReportGeneratorFactory.generate(format=format.lower(), summary_only=summary_only)
 
-        if output_file:
-            # format check is omitted, json is supported
-            with open(output_file, 'w') as f:
-                f.write(report)
-        else:
-            print(report)
+            # report is streamed issue by issue, never held in memory as a whole
+            with open(output_file, 'w') if output_file else nullcontext(sys.stdout) as output:
+                if instrumentation is None:
+                    report_generator.write_report(scoring_reports, output)
+                else:
+                    with instrumentation.activate():
+                        report_generator.write_report(scoring_reports, output, timings=instrumentation.timings)
 
     except (SpecLoaderException, ValidationException) as e:
         print(e)
     except Exception as e:
         print(f'Error occured while generating report: {e}')
+    finally:
+        if tracer is not None:
+            tracer.write(trace_file)
+            click.echo(f"Trace: {trace_file} ({len(tracer.events)} events)", err=True)
+        if processor.cache is not None:
+            click.echo(f"Cache: {processor.cache.stats}", err=True)
+        processor.close()
+
+
+
+@main.command()
+@click.argument("sources", nargs=-1)
+@click.option(
+    '--spec-list', '-l',
+    type=click.File('r'),
+    help='File listing spec paths, one per line ("-" for stdin)'
+)
+@click.option(
+    '--output-file', '-o',
+    type=click.File('w'),
+    default='-',
+    help='JSON Lines output, one record per spec (default: stdout)'
+)
+@click.option(
+    '--summary-file',
+    type=click.File('w'),
+    help='Write run summary as JSON to this file (summary is always printed to stderr)'
+)
+@click.option(
+    '--workers', '-w',
+    type=click.IntRange(min=1),
+    help='Number of worker processes (default: CPU count)'
+)
+@click.option(
+    '--cache-dir',
+    type=click.Path(file_okay=False, writable=True),
+    help='Directory for caching reports of already scored specifications (default: no caching)'
+)
+@click.option(
+    '--cache-max-size',
+    type=click.IntRange(min=1),
+    default=256,
+    show_default=True,
+    help='Maximum size of the cache directory in MiB, least recently used entries are evicted'
+)
+def batch(sources: tuple[str, ...], spec_list, output_file, summary_file, workers: Optional[int], cache_dir: Optional[str], cache_max_size: int):
+    """
+    Score many specifications (files, directories, glob patterns) with a pool of worker processes.
+    """
+
+    from api_scoring_app.runner.BatchRunner import BatchRunner, expand_spec_sources, read_spec_list
+
+    spec_sources = list(sources)
+    if spec_list is not None:
+        spec_sources.extend(read_spec_list(spec_list))
+
+    spec_sources = expand_spec_sources(spec_sources)
+    if not spec_sources:
+        raise click.UsageError("No specifications to score, pass files, directories, globs or --spec-list")
+
+    runner = BatchRunner(cache_dir=cache_dir, cache_max_bytes=cache_max_size * 1024 * 1024)
+    if workers:
+        runner.workers = workers
+
+    summary = runner.run(spec_sources, output_file)
+
+    click.echo(str(summary), err=True)
+    if summary_file is not None:
+        json.dump(summary.to_dict(), summary_file, indent=2)
+
+
+@main.command()
+@click.argument("jobs_file", type=click.File('r'))
+@click.option(
+    '--output-file', '-o',
+    type=click.Path(dir_okay=False, writable=True, allow_dash=True),
+    default='-',
+    help='JSON Lines results, one line per job (default: stdout)'
+)
+@click.option(
+    '--order',
+    type=click.Choice([order.value for order in ResultOrder], case_sensitive=False),
+    default=ResultOrder.INPUT.value,
+    show_default=True,
+    help='Write results in job file order, or as soon as each job completes'
+)
+@click.option(
+    '--concurrency', '-c',
+    type=click.IntRange(min=1),
+    help='Maximum number of jobs in flight, also the number of worker processes (default: CPU count)'
+)
+@click.option(
+    '--profiles',
+    type=click.Path(exists=True, dir_okay=False),
+    help='YAML/JSON file mapping profile names to {subscorer: points}, e.g. {"strict": {"schema": 30, "security": 30}}'
+)
+@click.option(
+    '--resume',
+    is_flag=True,
+    default=False,
+    help='Append to existing results file, skipping jobs already recorded there'
+)
+def jobs(jobs_file, output_file: str, order: str, concurrency: Optional[int], profiles: Optional[str], resume: bool):
+    """
+    Run scoring jobs from a JSON Lines file ("-" for stdin), one {"spec", "profile", "output"} object per line.
+    """
+
+    from api_scoring_app.runner.JobRunner import JobRunner, load_profiles, prepare_resume
+
+    runner = JobRunner(order=ResultOrder(order.lower()))
+    if concurrency:
+        runner.concurrency = concurrency
+
+    try:
+        if profiles:
+            runner.profiles = load_profiles(profiles)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--profiles")
+
+    if output_file == '-':
+        counts = runner.run(jobs_file, click.get_text_stream('stdout'))
+    else:
+        if resume:
+            runner.skip_lines = prepare_resume(output_file)
+
+        with open(output_file, 'a' if resume else 'w') as output:
+            counts = runner.run(jobs_file, output)
+
+    click.echo(f"Jobs: {counts['ok']} ok, {counts['error']} failed, {counts['skipped']} skipped (already done)", err=True)
+
+
+@main.command()
+@click.option('--host', default=DEFAULT_HOST, show_default=True, help='Address to listen on')
+@click.option('--port', type=click.IntRange(min=0, max=65535), default=DEFAULT_PORT, show_default=True, help='Port to listen on')
+@click.option(
+    '--socket', 'socket_path',
+    type=click.Path(dir_okay=False),
+    help='Listen on this unix socket instead of host/port'
+)
+@click.option(
+    '--workers', '-w',
+    type=click.IntRange(min=1),
+    help='Number of worker processes scoring the specs (default: CPU count)'
+)
+@click.option(
+    '--max-queue',
+    type=click.IntRange(min=0),
+    default=16,
+    show_default=True,
+    help='Requests waiting for a free worker, further ones are rejected with 503'
+)
+@click.option(
+    '--max-body-size',
+    type=click.IntRange(min=1),
+    default=64,
+    show_default=True,
+    help='Largest accepted spec in MiB'
+)
+@click.option(
+    '--request-timeout',
+    type=click.FloatRange(min=0, min_open=True),
+    default=60.0,
+    show_default=True,
+    help='Seconds to wait for a report, slower requests get 504'
+)
+@click.option(
+    '--cache-dir',
+    type=click.Path(file_okay=False, writable=True),
+    help='Directory for caching reports of already scored specifications (default: no caching)'
+)
+@click.option(
+    '--cache-max-size',
+    type=click.IntRange(min=1),
+    default=256,
+    show_default=True,
+    help='Maximum size of the cache directory in MiB, least recently used entries are evicted'
+)
+@click.option(
+    '--debug',
+    is_flag=True,
+    default=False,
+    help='Log every request to stderr'
+)
+def serve(host: str, port: int, socket_path: Optional[str], workers: Optional[int], max_queue: int, max_body_size: int,
+          request_timeout: float, cache_dir: Optional[str], cache_max_size: int, debug: bool):
+    """
+    Run scoring server with warm worker processes, `POST /score` takes the spec as body.
+    """
+
+    logging.basicConfig(level=logging.DEBUG if debug else logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
+    from api_scoring_app.runner.ScoringServer import ScoringServer
+
+    server = ScoringServer(
+        host=host,
+        port=port,
+        socket_path=socket_path,
+        max_queue=max_queue,
+        max_body_size=max_body_size * 1024 * 1024,
+        request_timeout=request_timeout,
+        cache_dir=cache_dir,
+        cache_max_bytes=cache_max_size * 1024 * 1024
+    )
+    if workers:
+        server.workers = workers
+
+    # stop on SIGTERM the same way as on Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
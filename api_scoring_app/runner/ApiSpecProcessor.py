@@ -1,14 +1,16 @@
-import json
-
+from typing import Optional
 from dataclasses import dataclass, field
 
+from api_scoring_app.core.cache import CacheEntry, ISpecCache
 from api_scoring_app.core.subscorers import ScoringReport
 from api_scoring_app.infra.engine import ScoringEngine
-from api_scoring_app.core import IValidator, IParser, BaseScorer
+from api_scoring_app.core import IValidator, IParser, BaseScorer, ISpecLoader
 from api_scoring_app.core.validator import ValidationException
 from api_scoring_app.infra.validators import PydanticValidator
 from api_scoring_app.infra.parser import Parser
-from api_scoring_app.infra.utils import SpecLoaderFactory
+from api_scoring_app.infra.utils import SpecLoaderFactory, LocalSpecLoader
+from api_scoring_app.infra.cache import cache_key, file_digest
+from api_scoring_app.infra.instrumentation import Instrumentation, stage, current_instrumentation
 
 
 @dataclass
@@ -21,22 +23,79 @@ class APISpecificationProcessor:
     validator: IValidator = field(default_factory=PydanticValidator)
     parser: IParser = field(default_factory=Parser)
     scoring_engine: BaseScorer = field(default_factory=ScoringEngine)
+    cache: Optional[ISpecCache] = field(default=None)
+
+    # per-stage timings of every run, see `Instrumentation`
+    instrumentation: Optional[Instrumentation] = field(default=None)
 
     def process(self, spec_source: str) -> list[ScoringReport]:
-        # 1. load
         loader = self.loader_factory.create_loader(spec_source)
-        spec_dict = loader.load()
-        spec_string = json.dumps(spec_dict)
+
+        source = spec_source if isinstance(loader, LocalSpecLoader) else None
+        return self.process_loader(loader, source=source)
+
+    def close(self) -> None:
+        """
+        Release resources of the scoring engine (worker pool), if it has any.
+        """
+
+        close = getattr(self.scoring_engine, "close", None)
+        if close is not None:
+            close()
+
+    def process_loader(self, loader: ISpecLoader, source: Optional[str] = None) -> list[ScoringReport]:
+        """
+        Score the specification of an already created loader (e.g. bytes received by server).
+        `source` is the location relative file references are resolved against.
+        """
+
+        if self.instrumentation is None or current_instrumentation() is self.instrumentation:
+            return self._process(loader, source)
+
+        with self.instrumentation.activate():
+            return self._process(loader, source)
+
+    def _process(self, loader: ISpecLoader, source: Optional[str]) -> list[ScoringReport]:
+        # 0. cached reports for the same spec content and scoring setup
+        key = None
+        if self.cache is not None:
+            with stage("cache"):
+                key = cache_key(loader.digest(), self.parser, self.scoring_engine)
+                cached = self.cache.get(key)
+            if cached is not None:
+                return cached.reports
+
+        # 1. load
+        with stage("load"):
+            spec_dict = loader.load()
 
         # 2. validate
-        validation_result = self.validator.validate(spec_string)
+        with stage("validate"):
+            validation_result = self.validator.validate(spec_dict, source=source)
         if not validation_result.is_valid():
             raise ValidationException(validation_result.errors)
 
-        # 3. parse
-        parsed_spec = self.parser.parse(validation_result.specification)
+        # resolved in place, the model is all that's needed from here on
+        del spec_dict
+
+        # key covers the root document only, referenced files are checked on every hit
+        dependencies = {}
+        if key is not None:
+            dependencies = {document: file_digest(document) for document in validation_result.documents}
+
+        # 3. parse, only the sections subscorers read
+        with stage("parse"):
+            parsed_spec = self.parser.parse(validation_result.specification, sections=self.scoring_engine.required_sections())
+
+        # parsed specification holds projections only, the model can go before scoring and reports
+        del validation_result
 
         # 4. score
-        reports = self.scoring_engine.score_spec(parsed_spec)
+        with stage("score"):
+            reports = self.scoring_engine.score_spec(parsed_spec)
+
+        # failed/timed out subscorers are not cached, next run might succeed
+        if key is not None and not any(report.error for report in reports):
+            self.cache.put(key, CacheEntry(reports, dependencies))
 
         return reports
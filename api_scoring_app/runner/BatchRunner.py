@@ -0,0 +1,240 @@
+import os
+import sys
+import glob
+import json
+import time
+import statistics
+
+from typing import Any, Iterable, Optional, TextIO
+from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from api_scoring_app.core.validator import ValidationException
+from api_scoring_app.infra.utils import LocalSpecLoader
+from api_scoring_app.infra.utils.spec_loader import SpecLoaderException
+from api_scoring_app.infra.utils.reports import JsonReportGenerator
+from api_scoring_app.runner.ApiSpecProcessor import APISpecificationProcessor
+from api_scoring_app.runner.ProcessorFactory import ProcessorFactory
+
+
+# warm processor of the worker process, created once by pool initializer
+_worker_processor: Optional[APISpecificationProcessor] = None
+
+
+def _init_worker(cache_dir: Optional[str], cache_max_bytes: int) -> None:
+    global _worker_processor
+
+    cache = None
+    if cache_dir:
+        from api_scoring_app.infra.cache import DiskSpecCache
+        cache = DiskSpecCache(cache_dir, max_bytes=cache_max_bytes)
+
+    _worker_processor = ProcessorFactory.create(cache=cache)
+
+
+def score_spec(spec_source: str, processor: Optional[APISpecificationProcessor] = None) -> dict[str, Any]:
+    """
+    Score single spec into JSON Lines record, failures are recorded instead of raised.
+    """
+
+    processor = processor or _worker_processor or ProcessorFactory.create()
+
+    start = time.perf_counter()
+    record: dict[str, Any] = {"spec": spec_source}
+
+    try:
+        reports = processor.process(spec_source)
+        record["status"] = "ok"
+        record["report"] = JsonReportGenerator().build_report_data(reports)
+    except (SpecLoaderException, ValidationException) as e:
+        record["status"] = "error"
+        record["error"] = str(e)
+    except Exception as e:
+        record["status"] = "error"
+        record["error"] = f"Error occured while generating report: {e}"
+
+    record["elapsed"] = round(time.perf_counter() - start, 4)
+    return record
+
+
+@dataclass
+class BatchSummary:
+    """
+    Summary of the batch run.
+    """
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    total_bytes: int = 0
+    wall_time: float = 0.0
+    spec_times: list[float] = field(default_factory=list, repr=False)
+
+    def add(self, record: dict[str, Any], size: int) -> None:
+        self.total += 1
+        self.total_bytes += size
+        self.spec_times.append(record["elapsed"])
+        if record["status"] == "ok":
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        spec_times = sorted(self.spec_times)
+
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "wall_time": round(self.wall_time, 3),
+            "specs_per_second": round(self.total / self.wall_time, 2) if self.wall_time else None,
+            "megabytes_per_second": round(self.total_bytes / (1024 * 1024) / self.wall_time, 2) if self.wall_time else None,
+            "spec_time_mean": round(statistics.fmean(spec_times), 4) if spec_times else None,
+            "spec_time_p50": round(spec_times[len(spec_times) // 2], 4) if spec_times else None,
+            "spec_time_p95": round(spec_times[min(len(spec_times) - 1, int(len(spec_times) * 0.95))], 4) if spec_times else None,
+        }
+
+    def __str__(self) -> str:
+        summary = self.to_dict()
+        return (
+            f"Scored {summary['total']} specs ({summary['succeeded']} ok, {summary['failed']} failed) in {summary['wall_time']}s, "
+            f"{summary['specs_per_second']} specs/s, {summary['megabytes_per_second']} MiB/s, "
+            f"per spec: mean {summary['spec_time_mean']}s, p50 {summary['spec_time_p50']}s, p95 {summary['spec_time_p95']}s"
+        )
+
+
+@dataclass
+class BatchRunner:
+    """
+    Score many specs with a pool of worker processes, each holding its own warm processor.
+
+    Records are written to `output` as JSON Lines, in completion order, as soon as they're ready.
+    At most `workers` specs are in flight, so a worker dying (e.g. killed by OOM) takes only them
+    down with the pool: the pool is replaced and they're rerun one at a time, so only the spec
+    that kills its worker again is recorded as failed.
+    """
+
+    workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    cache_dir: Optional[str] = None
+    cache_max_bytes: int = 256 * 1024 * 1024
+
+    def run(self, spec_sources: list[str], output: TextIO) -> BatchSummary:
+        summary = BatchSummary()
+        start = time.perf_counter()
+
+        def emit(record: dict[str, Any]) -> None:
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+            summary.add(record, _file_size(record["spec"]))
+
+        queue = deque(spec_sources)
+
+        # specs in flight when the pool broke, each is rerun alone, so a crash is its own
+        suspects: deque[str] = deque()
+        isolated: Optional[str] = None
+
+        pending: dict[Future, str] = {}
+        executor = self._create_executor()
+        try:
+            while queue or suspects or pending:
+                if suspects:
+                    if not pending:
+                        isolated = suspects.popleft()
+                        pending[executor.submit(score_spec, isolated)] = isolated
+                else:
+                    while queue and len(pending) < self.workers:
+                        spec_source = queue.popleft()
+                        pending[executor.submit(score_spec, spec_source)] = spec_source
+
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+
+                broken = False
+                for future in done:
+                    spec_source = pending.pop(future)
+                    try:
+                        record = future.result()
+                    except BrokenExecutor as e:
+                        broken = True
+                        if spec_source != isolated:
+                            suspects.append(spec_source)
+                            continue
+                        record = _worker_failure(spec_source, e)
+                    except Exception as e:
+                        record = _worker_failure(spec_source, e)
+
+                    emit(record)
+
+                if broken:
+                    # the rest of in-flight specs fail with the pool too
+                    for future in wait(list(pending)).done:
+                        suspects.append(pending.pop(future))
+                    # pool threads are joined before the next fork
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    executor = self._create_executor()
+
+                if not pending:
+                    isolated = None
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        summary.wall_time = time.perf_counter() - start
+        return summary
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.cache_dir, self.cache_max_bytes)
+        )
+
+
+def _worker_failure(spec_source: str, error: Exception) -> dict[str, Any]:
+    # worker itself died (e.g. killed by OOM), spec is still accounted for
+    return {"spec": spec_source, "status": "error", "error": f"Worker failed: {error}", "elapsed": 0.0}
+
+
+def expand_spec_sources(sources: Iterable[str]) -> list[str]:
+    """
+    Expand directories (recursively, supported spec extensions only) and glob patterns into spec
+    paths, other sources (files, URLs) are kept as they are. Duplicates are dropped, order is kept.
+    """
+
+    spec_sources: dict[str, None] = {}
+
+    for source in sources:
+        if os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for name in sorted(files):
+                    path = os.path.join(root, name)
+                    if LocalSpecLoader.detect_format(path)[0] is not None:
+                        spec_sources[path] = None
+
+        elif glob.has_magic(source):
+            matches = sorted(glob.glob(source, recursive=True))
+            if not matches:
+                print(f"No specs match '{source}'", file=sys.stderr)
+            for path in matches:
+                if os.path.isfile(path):
+                    spec_sources[path] = None
+
+        else:
+            spec_sources[source] = None
+
+    return list(spec_sources)
+
+
+def read_spec_list(file: TextIO) -> list[str]:
+    """
+    Spec sources listed one per line, blank lines and `#` comments are skipped.
+    """
+
+    return [line.strip() for line in file if line.strip() and not line.lstrip().startswith("#")]
+
+
+def _file_size(spec_source: str) -> int:
+    try:
+        return os.path.getsize(spec_source)
+    except OSError:
+        return 0
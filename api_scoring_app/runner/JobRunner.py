@@ -0,0 +1,294 @@
+import os
+import json
+import time
+
+from typing import Any, Iterator, Optional, TextIO
+from dataclasses import dataclass, field
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from api_scoring_app.core.types import ResultOrder
+from api_scoring_app.core.validator import ValidationException
+from api_scoring_app.infra.utils.spec_loader import SpecLoaderException, load_yaml
+from api_scoring_app.infra.utils.reports import JsonReportGenerator, ReportUtils
+from api_scoring_app.runner.ApiSpecProcessor import APISpecificationProcessor
+from api_scoring_app.runner.ProcessorFactory import ProcessorFactory
+
+DEFAULT_PROFILE = "default"
+
+
+@dataclass
+class Job:
+    """
+    Single line of the job file.
+
+    `{"spec": "<path or URL>", "profile": "<name>", "output": "<report path>", "id": "<any>"}`,
+    only `spec` is required.
+    """
+
+    line: int
+    spec: str
+    profile: str = DEFAULT_PROFILE
+    output: Optional[str] = None
+    id: Any = None
+
+
+class JobError(Exception):
+    """Malformed job line."""
+
+
+def parse_job(line_number: int, line: str) -> Job:
+    try:
+        data = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise JobError(f"Invalid JSON: {e}")
+
+    if not isinstance(data, dict) or not isinstance(data.get("spec"), str):
+        raise JobError("Job should be an object with `spec` string")
+
+    return Job(
+        line=line_number,
+        spec=data["spec"],
+        profile=data.get("profile") or DEFAULT_PROFILE,
+        output=data.get("output"),
+        id=data.get("id"),
+    )
+
+
+def load_profiles(path: str) -> dict[str, dict[str, float]]:
+    """
+    Profiles file (YAML or JSON): profile name -> {subscorer key: points}.
+    """
+
+    with open(path, 'rb') as file:
+        profiles = load_yaml(file) or {}
+
+    if not isinstance(profiles, dict) or not all(isinstance(points, dict) for points in profiles.values()):
+        raise ValueError(f"Profiles file should map profile names to {{subscorer: points}}: {path}")
+
+    # check them upfront, not in every job
+    for points in profiles.values():
+        ProcessorFactory.create(subscorer_points=points)
+
+    return profiles
+
+
+# processors of the worker process, one per profile, created on first use
+_worker_profiles: dict[str, dict[str, float]] = {}
+_worker_processors: dict[str, APISpecificationProcessor] = {}
+
+
+def _init_worker(profiles: dict[str, dict[str, float]]) -> None:
+    _worker_profiles.clear()
+    _worker_profiles.update(profiles)
+    _worker_processors.clear()
+
+
+def run_job(job: Job) -> dict[str, Any]:
+    """
+    Score the spec of the job, report is written to job's output target or embedded into the result.
+    """
+
+    start = time.perf_counter()
+    result: dict[str, Any] = {"line": job.line, "id": job.id, "spec": job.spec, "profile": job.profile}
+
+    try:
+        processor = _worker_processors.get(job.profile)
+        if processor is None:
+            if job.profile != DEFAULT_PROFILE and job.profile not in _worker_profiles:
+                raise JobError(f"Unknown profile: {job.profile}")
+            processor = _worker_processors[job.profile] = ProcessorFactory.create(subscorer_points=_worker_profiles.get(job.profile))
+
+        reports = processor.process(job.spec)
+        summary = ReportUtils.get_summary(reports)
+
+        result["status"] = "ok"
+        result["total_score"] = summary["total_score"]
+        result["overall_grade"] = summary["overall_grade"]
+
+        if job.output:
+            output_dir = os.path.dirname(job.output)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            with open(job.output, 'w') as file:
+                JsonReportGenerator().write_report(reports, file)
+            result["output"] = job.output
+        else:
+            result["report"] = JsonReportGenerator().build_report_data(reports)
+
+    except (SpecLoaderException, ValidationException, JobError) as e:
+        result["status"] = "error"
+        result["error"] = str(e)
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = f"Error occured while generating report: {e}"
+
+    result["elapsed"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def _worker_failure(job: Job, error: Exception) -> dict[str, Any]:
+    # job task itself failed (e.g. worker killed by OOM), job still gets its result line
+    return {
+        "line": job.line, "id": job.id, "spec": job.spec, "profile": job.profile,
+        "status": "error", "error": f"Worker failed: {error}", "elapsed": 0.0
+    }
+
+
+def prepare_resume(results_path: str) -> set[int]:
+    """
+    Job lines already recorded in results file. Truncated last line (run died while writing it)
+    is cut off, so appended results start on a fresh line and the job runs again.
+    """
+
+    completed: set[int] = set()
+    if not os.path.exists(results_path):
+        return completed
+
+    with open(results_path, 'rb+') as file:
+        content_end = 0
+        for line in file:
+            if not line.endswith(b"\n"):
+                break
+            content_end += len(line)
+            try:
+                completed.add(json.loads(line)["line"])
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+
+        file.truncate(content_end)
+
+    return completed
+
+
+@dataclass
+class JobRunner:
+    """
+    Stream jobs from JSON Lines input and run them on a process pool, at most `concurrency` jobs
+    are in flight (and buffered, for input order) at any time.
+
+    Every job gets a result line, even if its task fails: a worker dying breaks the pool, which is
+    replaced, and the jobs in flight are rerun one at a time, so only the job that kills its worker
+    again is recorded as failed.
+    """
+
+    concurrency: int = field(default_factory=lambda: os.cpu_count() or 1)
+    order: ResultOrder = ResultOrder.INPUT
+    profiles: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    # job lines to skip, e.g. already completed by a crashed run
+    skip_lines: set[int] = field(default_factory=set)
+
+    def run(self, jobs_input: TextIO, output: TextIO) -> dict[str, int]:
+        """
+        Run all jobs, result lines are flushed one by one. Returns counts per status.
+        """
+
+        counts = {"ok": 0, "error": 0, "skipped": 0}
+
+        def emit(result: dict[str, Any]) -> None:
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+            counts[result["status"]] += 1
+
+        pending: dict[Future, Job] = {}
+        finished: dict[int, dict[str, Any]] = {}
+
+        # lines in submission order, for input ordering
+        submitted: list[int] = []
+
+        executor = self._create_executor()
+
+        def drain(block: bool) -> None:
+            nonlocal executor
+
+            if pending:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED, timeout=None if block else 0)
+
+                # jobs in flight when the pool broke, one of them killed its worker
+                suspects: list[Job] = []
+                for future in done:
+                    job = pending.pop(future)
+                    try:
+                        finished[job.line] = future.result()
+                    except BrokenExecutor:
+                        suspects.append(job)
+                    except Exception as e:
+                        finished[job.line] = _worker_failure(job, e)
+
+                if suspects:
+                    # the rest of in-flight jobs fail with the pool too
+                    for future in wait(list(pending)).done:
+                        suspects.append(pending.pop(future))
+                    executor = self._replace_executor(executor)
+
+                    # rerun alone, so a crash is their own
+                    for job in sorted(suspects, key=lambda job: job.line):
+                        try:
+                            finished[job.line] = executor.submit(run_job, job).result()
+                        except BrokenExecutor as e:
+                            finished[job.line] = _worker_failure(job, e)
+                            executor = self._replace_executor(executor)
+                        except Exception as e:
+                            finished[job.line] = _worker_failure(job, e)
+
+            if self.order == ResultOrder.COMPLETION:
+                for line in list(finished):
+                    emit(finished.pop(line))
+            else:
+                while submitted and submitted[0] in finished:
+                    emit(finished.pop(submitted.pop(0)))
+
+        def submit(job: Job) -> None:
+            try:
+                pending[executor.submit(run_job, job)] = job
+            except BrokenExecutor:
+                # pool broke since the last drain, jobs in flight are settled (and pool replaced) first
+                while pending:
+                    drain(block=True)
+                pending[executor.submit(run_job, job)] = job
+
+        try:
+            for line_number, job_or_error in self._read_jobs(jobs_input):
+                if line_number in self.skip_lines:
+                    counts["skipped"] += 1
+                    continue
+
+                # bounded concurrency, input isn't read ahead of the pool
+                while len(pending) + len(finished) >= self.concurrency:
+                    drain(block=True)
+
+                submitted.append(line_number)
+                if isinstance(job_or_error, Job):
+                    submit(job_or_error)
+                else:
+                    finished[line_number] = {"line": line_number, "status": "error", "error": str(job_or_error)}
+
+                drain(block=False)
+
+            while pending or finished:
+                drain(block=True)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return counts
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.concurrency, initializer=_init_worker, initargs=(self.profiles,))
+
+    def _replace_executor(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        # pool threads are joined first, forking next to them can deadlock the new workers
+        broken.shutdown(wait=True, cancel_futures=True)
+        return self._create_executor()
+
+    def _read_jobs(self, jobs_input: TextIO) -> Iterator[tuple[int, Job | JobError]]:
+        """
+        Lazily parse jobs, blank lines are skipped but still counted, so line numbers match the file.
+        """
+
+        for line_number, line in enumerate(jobs_input, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, parse_job(line_number, line)
+            except JobError as e:
+                yield line_number, e
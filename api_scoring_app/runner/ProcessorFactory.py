@@ -0,0 +1,60 @@
+from typing import Optional
+
+from api_scoring_app.core import BaseScorer
+from api_scoring_app.core.cache import ISpecCache
+from api_scoring_app.core.types import ExecutionMode
+from api_scoring_app.infra.instrumentation import Instrumentation
+from api_scoring_app.runner.ApiSpecProcessor import APISpecificationProcessor
+from api_scoring_app.infra.subscorers import ExamplesSubscorer, SchemaSubscorer, DescriptionSubscorer, PathsSubscorer, ResponseCodesSubscorer, SecuritySubscorer, MiscSubscorer
+
+
+# subscorer key -> (class, default points), in report order
+SUBSCORERS: dict[str, tuple[type[BaseScorer], float]] = {
+    "schema": (SchemaSubscorer, 20),
+    "description": (DescriptionSubscorer, 20),
+    "paths": (PathsSubscorer, 15),
+    "response_codes": (ResponseCodesSubscorer, 15),
+    "examples": (ExamplesSubscorer, 10),
+    "security": (SecuritySubscorer, 10),
+    "misc": (MiscSubscorer, 10),
+}
+
+
+class ProcessorFactory:
+    """Factory for processors with the default (or selected) set of subscorers."""
+
+    @staticmethod
+    def create(
+        cache: Optional[ISpecCache] = None,
+        execution_mode: ExecutionMode = ExecutionMode.SEQUENTIAL,
+        max_workers: Optional[int] = None,
+        subscorer_timeout: Optional[float] = None,
+        subscorer_points: Optional[dict[str, float]] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        issue_cap: Optional[int] = None
+    ) -> APISpecificationProcessor:
+        """
+        `subscorer_points` selects subscorers (keys of `SUBSCORERS`) and their points,
+        all subscorers with default points are used if it's not given. `issue_cap` turns
+        on issue aggregation, see `ScoringReport`.
+        """
+
+        if subscorer_points is None:
+            subscorer_points = {key: points for key, (_, points) in SUBSCORERS.items()}
+
+        unknown = set(subscorer_points) - set(SUBSCORERS)
+        if unknown:
+            raise ValueError(f"Unknown subscorers: {', '.join(sorted(unknown))}, expected some of: {', '.join(SUBSCORERS)}")
+
+        processor = APISpecificationProcessor(cache=cache, instrumentation=instrumentation)
+
+        processor.scoring_engine.execution_mode = execution_mode
+        processor.scoring_engine.max_workers = max_workers
+        processor.scoring_engine.subscorer_timeout = subscorer_timeout
+        processor.scoring_engine.issue_cap = issue_cap
+
+        for key, (subscorer_class, _) in SUBSCORERS.items():
+            if key in subscorer_points:
+                processor.scoring_engine.add_subscorer(subscorer_class(points=subscorer_points[key]))
+
+        return processor
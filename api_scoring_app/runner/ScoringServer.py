@@ -0,0 +1,287 @@
+import os
+import json
+import signal
+import logging
+import threading
+import socketserver
+
+from typing import Any, Optional
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from api_scoring_app.client import DEFAULT_HOST, DEFAULT_PORT
+from api_scoring_app.core.validator import ValidationException
+from api_scoring_app.infra.utils import BytesSpecLoader
+from api_scoring_app.infra.utils.spec_loader import SpecLoaderException
+from api_scoring_app.infra.utils.reports import JsonReportGenerator
+from api_scoring_app.runner.ApiSpecProcessor import APISpecificationProcessor
+from api_scoring_app.runner.ProcessorFactory import ProcessorFactory
+
+logger = logging.getLogger(__name__)
+
+# smallest valid spec, scored once by every worker so lazily built caches are warm too
+_WARMUP_SPEC = b'{"openapi": "3.1.0", "info": {"title": "warmup", "version": "1.0.0"}, "paths": {}}'
+
+
+# warm processor of the worker process, created once by pool initializer
+_worker_processor: Optional[APISpecificationProcessor] = None
+
+
+def _init_worker(cache_dir: Optional[str], cache_max_bytes: int) -> None:
+    global _worker_processor
+
+    # Ctrl+C reaches the whole process group, server shuts the pool down itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    cache = None
+    if cache_dir:
+        from api_scoring_app.infra.cache import DiskSpecCache
+        cache = DiskSpecCache(cache_dir, max_bytes=cache_max_bytes)
+
+    _worker_processor = ProcessorFactory.create(cache=cache)
+    _worker_processor.process_loader(BytesSpecLoader(_WARMUP_SPEC))
+
+
+def score_bytes(data: bytes, compressed: bool = False) -> tuple[int, dict[str, Any]]:
+    """
+    Score the spec body, returns HTTP status and JSON payload (report, or `{"error": ...}`).
+    """
+
+    processor = _worker_processor or ProcessorFactory.create()
+
+    try:
+        reports = processor.process_loader(BytesSpecLoader(data, compressed=compressed))
+        return 200, JsonReportGenerator().build_report_data(reports)
+    except (SpecLoaderException, ValidationException) as e:
+        return 422, {"error": str(e)}
+    except Exception as e:
+        return 500, {"error": f"Error occured while generating report: {e}"}
+
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    """
+    `POST /score` with the spec (JSON or YAML, `Content-Encoding: gzip` is accepted) as body,
+    responds with the same JSON as `JsonReportGenerator`. `GET /health` for liveness checks.
+    """
+
+    server: "ScoringHTTPServer | ScoringUnixServer"
+
+    # keep-alive, so editor plugins can reuse the connection
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/health":
+            return self._respond(404, {"error": f"Not found: {self.path}"})
+
+        scoring_server = self.server.scoring_server
+        self._respond(200, {"status": "ok", "workers": scoring_server.workers, "in_flight": scoring_server.in_flight})
+
+    def do_POST(self):
+        if self.path.split("?")[0] != "/score":
+            self._discard_body()
+            return self._respond(404, {"error": f"Not found: {self.path}"})
+
+        content_length = self.headers.get("Content-Length")
+        if content_length is None or not content_length.isdigit():
+            self.close_connection = True
+            return self._respond(411, {"error": "Content-Length is required"})
+
+        scoring_server = self.server.scoring_server
+        if int(content_length) > scoring_server.max_body_size:
+            self.close_connection = True
+            return self._respond(413, {"error": f"Spec is larger than {scoring_server.max_body_size} bytes"})
+
+        data = self.rfile.read(int(content_length))
+        compressed = self.headers.get("Content-Encoding", "").lower() == "gzip"
+
+        status, payload = scoring_server.score(data, compressed)
+        self._respond(status, payload)
+
+    def address_string(self) -> str:
+        # unix socket peers have no address
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _discard_body(self) -> None:
+        content_length = self.headers.get("Content-Length", "")
+        if content_length.isdigit():
+            self.rfile.read(int(content_length))
+
+    def _respond(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ScoringHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], scoring_server: "ScoringServer"):
+        self.scoring_server = scoring_server
+        super().__init__(address, ScoringRequestHandler)
+
+
+class ScoringUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, scoring_server: "ScoringServer"):
+        self.scoring_server = scoring_server
+        super().__init__(socket_path, ScoringRequestHandler)
+
+
+@dataclass
+class ScoringServer:
+    """
+    Long-running scoring service, keeps warm processors resident so every request skips
+    interpreter startup and imports.
+
+    Requests are handled by threads, scoring itself runs in a pool of `workers` processes.
+    At most `workers + max_queue` requests are accepted at once, the rest get `503` right away.
+    A request that timed out (`504`) still counts until its job finishes, the worker can't be
+    interrupted. References to files are rejected, a posted spec can't read the server's files.
+    """
+
+    host: str = DEFAULT_HOST
+    port: int = DEFAULT_PORT
+
+    # serve on unix socket instead of TCP
+    socket_path: Optional[str] = None
+
+    workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    max_queue: int = 16
+    max_body_size: int = 64 * 1024 * 1024
+    request_timeout: Optional[float] = 60.0
+
+    cache_dir: Optional[str] = None
+    cache_max_bytes: int = 256 * 1024 * 1024
+
+    in_flight: int = field(init=False, default=0)
+
+    _executor: Optional[ProcessPoolExecutor] = field(init=False, repr=False, default=None)
+    _server: Optional[socketserver.BaseServer] = field(init=False, repr=False, default=None)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+    # pool replacement, apart from `_lock`: done callbacks of the old pool take `_lock` while it's joined
+    _executor_lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+
+    @property
+    def address(self) -> str:
+        if self.socket_path:
+            return f"unix:{self.socket_path}"
+
+        host, port = self._server.server_address[:2] if self._server else (self.host, self.port)
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """
+        Start the worker pool (warming every worker up) and bind the socket, without serving yet.
+        """
+
+        self._executor = self._create_executor()
+
+        if self.socket_path:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            self._server = ScoringUnixServer(self.socket_path, self)
+        else:
+            self._server = ScoringHTTPServer((self.host, self.port), self)
+
+    def serve_forever(self) -> None:
+        if self._server is None:
+            self.start()
+
+        logger.info("Scoring server listening on %s with %d workers", self.address, self.workers)
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        """
+        Stop serving, called from another thread than `serve_forever`.
+        """
+
+        if self._server is not None:
+            self._server.shutdown()
+
+    def close(self) -> None:
+        """
+        Close the socket and the worker pool.
+        """
+
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            if self.socket_path and os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+        with self._executor_lock:
+            if self._executor is not None:
+                # queued jobs are cancelled, running ones are waited for, no worker is left behind
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+    def score(self, data: bytes, compressed: bool = False) -> tuple[int, dict[str, Any]]:
+        """
+        Score the spec on the worker pool, bounded by `workers + max_queue` requests in flight.
+        """
+
+        with self._lock:
+            if self.in_flight >= self.workers + self.max_queue:
+                return 503, {"error": "Server is busy, try again later"}
+            self.in_flight += 1
+
+        executor = self._executor
+        try:
+            future = executor.submit(score_bytes, data, compressed)
+        except BrokenProcessPool as e:
+            self._release()
+            self._replace_executor(executor)
+            return 500, {"error": f"Worker failed: {e}"}
+        except BaseException:
+            self._release()
+            raise
+
+        # slot is held until the job is done (or cancelled before it started), not just waited for
+        future.add_done_callback(self._release)
+
+        try:
+            return future.result(timeout=self.request_timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            return 504, {"error": f"Scoring timed out after {self.request_timeout} seconds"}
+        except BrokenProcessPool as e:
+            # worker itself died (e.g. killed by OOM), following requests get a fresh pool
+            self._replace_executor(executor)
+            return 500, {"error": f"Worker failed: {e}"}
+
+    def _release(self, future: Optional[Future] = None) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.cache_dir, self.cache_max_bytes)
+        )
+
+        # workers are started lazily by executor, have them all warm before the first request
+        for future in [executor.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+        return executor
+
+    def _replace_executor(self, broken: ProcessPoolExecutor) -> None:
+        with self._executor_lock:
+            # other requests on the same pool might have replaced it already
+            if self._executor is not broken:
+                return
+
+            # pool threads are joined before the next fork
+            broken.shutdown(wait=True, cancel_futures=True)
+            self._executor = self._create_executor()
@@ -0,0 +1,5 @@
+"""
+Standalone benchmarks for the scoring pipeline, run from the repository root, e.g.
+
+    python -m benchmarks.bench_validation
+"""
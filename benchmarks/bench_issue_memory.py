@@ -0,0 +1,112 @@
+"""
+Cost of a single issue: build time, tracemalloc bytes retained per issue and pickled bytes per issue
+(process pool / report cache). Dict-backed `Issue` with formatted message (as it was before) vs
+slotted, templated `Issue` with joined path string vs path segments rendered lazily (paths are
+shared with parsed specification, so they cost nothing per issue).
+
+    python -m benchmarks.bench_issue_memory --issues 100000
+"""
+
+import gc
+import time
+import pickle
+import argparse
+import statistics
+import tracemalloc
+
+from typing import Any, Callable, Optional
+from dataclasses import dataclass, field
+
+from api_scoring_app.core.subscorers import Issue, IssueSeverity
+from api_scoring_app.infra.subscorers.subscorer_description import MISSING_DESCRIPTION
+
+
+@dataclass
+class LegacyIssue:
+    """
+    `Issue` as it was before: `__dict__` per instance, message formatted upfront.
+    """
+
+    message: str
+    severity: IssueSeverity
+    path: Optional[str] = field(default=None)
+    suggestion: Optional[str] = field(default=None)
+
+
+def issue_paths(count: int) -> list[list[str]]:
+    return [["paths", f"/resource{i // 5}", ("get", "post", "put", "patch", "delete")[i % 5], "description"] for i in range(count)]
+
+
+def legacy_issues(paths: list[list[str]]) -> list[LegacyIssue]:
+    issues = []
+    for path in paths:
+        path_as_string = " -> ".join(path)
+        issues.append(LegacyIssue(
+            message=f"Missing description at: {path_as_string}",
+            path=path_as_string,
+            severity=IssueSeverity.LOW,
+            suggestion="Add a meaningful description."
+        ))
+    return issues
+
+
+def templated_issues(paths: list[list[str]]) -> list[Issue]:
+    return [MISSING_DESCRIPTION.issue(" -> ".join(path)) for path in paths]
+
+
+def lazy_issues(paths: list[list[str]]) -> list[Issue]:
+    return [MISSING_DESCRIPTION.issue(path) for path in paths]
+
+
+def retained_bytes(build: Callable[[], list[Any]]) -> tuple[int, list[Any]]:
+    """
+    Memory retained by the built list and its issues.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        issues = build()
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return retained, issues
+
+
+def build_time(build: Callable[[], list[Any]], repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        build()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--issues", type=int, default=100_000)
+    args = arg_parser.parse_args()
+
+    paths = issue_paths(args.issues)
+    print(f"{args.issues} issues")
+
+    variants = (
+        ("legacy (dict, formatted)", lambda: legacy_issues(paths)),
+        ("slotted, templated", lambda: templated_issues(paths)),
+        ("slotted, lazy path", lambda: lazy_issues(paths)),
+    )
+    for name, build in variants:
+        elapsed = build_time(build)
+        retained, issues = retained_bytes(build)
+        pickled = len(pickle.dumps(issues, protocol=pickle.HIGHEST_PROTOCOL))
+        print(
+            f"    {name:<28} build {elapsed * 1000:>8.2f} ms   "
+            f"retained {retained / args.issues:>8.1f} B/issue   pickled {pickled / args.issues:>8.1f} B/issue"
+        )
+        del issues
+
+
+if __name__ == "__main__":
+    main()
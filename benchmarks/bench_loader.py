@@ -0,0 +1,65 @@
+"""
+Spec loading time: plain `yaml.safe_load` vs `LocalSpecLoader` (libyaml backend when available), on scaled-up public_sample.yaml.
+
+    python -m benchmarks.bench_loader --factor 50
+"""
+
+import argparse
+import gzip
+import json
+import os
+import shutil
+import tempfile
+
+import yaml
+
+from api_scoring_app.infra.utils import LocalSpecLoader
+from api_scoring_app.infra.utils.spec_loader import YAML_BACKEND
+from benchmarks.utils import measure, load_public_sample, scale_spec
+
+
+def legacy_yaml_load(spec_path: str) -> None:
+    with open(spec_path, "r") as file:
+        yaml.safe_load(file)
+
+
+def legacy_json_load(spec_path: str) -> None:
+    with open(spec_path, "r") as file:
+        json.load(file)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--factor", type=int, default=50, help="How many times to replicate paths of public_sample.yaml")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    spec = scale_spec(load_public_sample(), args.factor)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yaml_path = os.path.join(tmp_dir, "spec.yaml")
+        json_path = os.path.join(tmp_dir, "spec.json")
+
+        with open(yaml_path, "w") as file:
+            yaml.dump(spec, file, Dumper=dumper, sort_keys=False)
+        with open(json_path, "w") as file:
+            json.dump(spec, file)
+
+        for path in (yaml_path, json_path):
+            with open(path, "rb") as src, gzip.open(path + ".gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+
+        print(f"yaml backend: {YAML_BACKEND}")
+        print(f"spec size: {os.path.getsize(yaml_path) / (1024 * 1024):.2f} MiB yaml, {len(spec['paths'])} paths")
+
+        print(measure("yaml.safe_load", lambda: legacy_yaml_load(yaml_path), args.repeat, trace_memory=False))
+        print(measure("LocalSpecLoader .yaml", lambda: LocalSpecLoader(yaml_path).load(), args.repeat, trace_memory=False))
+        print(measure("LocalSpecLoader .yaml.gz", lambda: LocalSpecLoader(yaml_path + ".gz").load(), args.repeat, trace_memory=False))
+        print(measure("json.load (text mode)", lambda: legacy_json_load(json_path), args.repeat))
+        print(measure("LocalSpecLoader .json", lambda: LocalSpecLoader(json_path).load(), args.repeat))
+        print(measure("LocalSpecLoader .json.gz", lambda: LocalSpecLoader(json_path + ".gz").load(), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Security and misc subscorers on many operation-level security requirements and tags: list scans vs name indexes.
+
+    python -m benchmarks.bench_membership --operations 20000 --names 2000
+"""
+
+import argparse
+
+from api_scoring_app.core.types import PathNode
+from api_scoring_app.core.parser import ParsedSpecification, WrappedSecurityRequirement, WrappedTag
+from api_scoring_app.infra.subscorers import SecuritySubscorer, MiscSubscorer
+from benchmarks.utils import measure
+
+
+def membership_heavy_spec(operations: int, names: int) -> ParsedSpecification:
+    """
+    `names` defined schemes and tags, every operation references one scheme and two tags, some undefined.
+    """
+
+    parsed_specification = ParsedSpecification()
+    security = parsed_specification.security
+    misc = parsed_specification.misc
+
+    for i in range(names):
+        security.defined_schemes.append(WrappedSecurityRequirement(f"scheme{i}", PathNode.from_keys(["components", "securitySchemes", f"scheme{i}"])))
+        misc.tags_defined.append(WrappedTag(f"tag{i}", PathNode.from_keys(["tags", str(i)])))
+
+    security.referenced_schemes.append(WrappedSecurityRequirement("scheme0", PathNode.from_keys(["security", "scheme0"])))
+
+    for i in range(operations):
+        operation_path = PathNode.from_keys(["paths", f"/resource{i}", "get"])
+        # every tenth operation references something undefined
+        name = i % names if i % 10 else names + i
+        security.operation_referenced_schemes.append(WrappedSecurityRequirement(f"scheme{name}", operation_path + ["security", f"scheme{name}"]))
+        misc.tags_from_operations.append(WrappedTag(f"tag{name}", operation_path + ["tags"]))
+        misc.tags_from_operations.append(WrappedTag(f"tag{(i * 7) % names}", operation_path + ["tags"]))
+
+    return parsed_specification
+
+
+def list_scans(parsed_specification: ParsedSpecification) -> None:
+    """
+    Membership checks as they were done before name indexes.
+    """
+
+    security = parsed_specification.security
+    [scheme for scheme in security.defined_schemes if scheme not in security.referenced_schemes]
+    [scheme for scheme in security.referenced_schemes if scheme not in security.defined_schemes]
+    [scheme for scheme in security.operation_referenced_schemes if scheme not in security.defined_schemes]
+
+    [tag for tag in parsed_specification.misc.tags_from_operations if tag not in parsed_specification.misc.tags_defined]
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--operations", type=int, default=20000)
+    arg_parser.add_argument("--names", type=int, default=2000, help="Number of defined security schemes and tags")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    parsed_specification = membership_heavy_spec(args.operations, args.names)
+    security_subscorer = SecuritySubscorer(points=10)
+    misc_subscorer = MiscSubscorer(points=10)
+
+    print(f"{args.operations} operations, {args.names} defined schemes and tags")
+    print(measure("list scans", lambda: list_scans(parsed_specification), 1, trace_memory=False))
+    print(measure("SecuritySubscorer.score_spec", lambda: security_subscorer.score_spec(parsed_specification), args.repeat))
+    print(measure("MiscSubscorer.score_spec", lambda: misc_subscorer.score_spec(parsed_specification), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Overlapping path detection scaling: segment trie vs pairwise `_are_overlapping` (quadratic, small sizes only).
+
+    python -m benchmarks.bench_overlapping_paths --sizes 1000 10000 50000
+"""
+
+import argparse
+import random
+
+from api_scoring_app.infra.subscorers import PathsSubscorer
+from benchmarks.utils import measure
+
+
+def gateway_paths(count: int, seed: int = 0) -> list[str]:
+    """
+    Paths of an aggregated gateway: services, nested resources, item paths with parameters and some actions,
+    some of them (`/search` next to `/{id}`) overlapping.
+    """
+
+    rnd = random.Random(seed)
+    paths: dict[str, None] = {}
+
+    i = 0
+    while len(paths) < count:
+        service = f"service{i // 50}"
+        resource = f"resource{i % 50}"
+        base = f"/{service}/v{rnd.randint(1, 2)}/{resource}"
+
+        paths[base] = None
+        paths[f"{base}/{{{resource}Id}}"] = None
+        if rnd.random() < 0.3:
+            paths[f"{base}/{{{resource}Id}}/{rnd.choice(['activate', 'archive', 'history'])}"] = None
+        if rnd.random() < 0.1:
+            paths[f"{base}/{{id}}/items/{{itemId}}"] = None
+        if rnd.random() < 0.1:
+            # overlaps with item path
+            paths[f"{base}/search"] = None
+
+        i += 1
+
+    return list(paths)[:count]
+
+
+def pairwise_overlapping_paths(subscorer: PathsSubscorer, path_names: list[str]) -> list[tuple[str, str]]:
+    return [
+        (path1, path2)
+        for i, path1 in enumerate(path_names)
+        for path2 in path_names[i+1:]
+        if subscorer._are_overlapping(path1, path2)
+    ]
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    arg_parser.add_argument("--pairwise-max", type=int, default=1000, help="Largest size to run pairwise check for")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    subscorer = PathsSubscorer(points=15)
+
+    for size in args.sizes:
+        path_names = gateway_paths(size)
+        overlapping = subscorer._find_overlapping_paths(path_names)
+        print(f"{size} paths, {len(overlapping)} overlapping pairs")
+
+        print(measure(f"trie ({size})", lambda: subscorer._find_overlapping_paths(path_names), args.repeat))
+        if size <= args.pairwise_max:
+            print(measure(f"pairwise ({size})", lambda: pairwise_overlapping_paths(subscorer, path_names), 1, trace_memory=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Parser traversal time on scaled public sample (validated model in, `ParsedSpecification` out),
+all sections vs only the sections of selected subscorers (e.g. security-only CI gate).
+
+    python -m benchmarks.bench_parser --factor 200 --sections security misc
+"""
+
+import argparse
+
+from openapi_pydantic import OpenAPI
+
+from api_scoring_app.core.config import Config
+from api_scoring_app.infra.parser import Parser
+from benchmarks.utils import measure, load_public_sample, scale_spec
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--factor", type=int, default=100, help="How many times to replicate paths of public_sample.yaml")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--sections", nargs="+", default=["security", "misc"], help="Sections of the selective run")
+    args = arg_parser.parse_args()
+
+    spec = scale_spec(load_public_sample(), args.factor)
+    openapi = OpenAPI.model_validate(spec)
+    config = Config()
+
+    print(f"{len(spec['paths'])} paths")
+    print(measure("Parser().parse", lambda: Parser(config).parse(openapi), args.repeat))
+    print(measure(f"Parser().parse({', '.join(args.sections)})", lambda: Parser(config).parse(openapi, sections=args.sections), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
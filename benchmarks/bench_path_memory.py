@@ -0,0 +1,72 @@
+"""
+Parser memory on a schema-heavy spec: tracemalloc peak during `parse` and memory retained by `ParsedSpecification`.
+
+    python -m benchmarks.bench_path_memory --paths 100 --depth 5 --width 3
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from openapi_pydantic import OpenAPI
+
+from api_scoring_app.infra.parser import Parser
+
+
+def nested_schema(depth: int, width: int) -> dict:
+    """
+    Object schema nested `depth` levels deep, `width` properties on every level, free-form objects as leaves.
+    """
+
+    schema = {"type": "object"}
+    for _ in range(depth):
+        schema = {"type": "object", "properties": {f"field{k}": schema for k in range(width)}}
+    return schema
+
+
+def schema_heavy_spec(paths: int, depth: int, width: int) -> dict:
+    return {
+        "openapi": "3.1.0",
+        "info": {"title": "schema heavy", "version": "1.0.0"},
+        "paths": {
+            f"/resource{i}": {"get": {"responses": {"200": {
+                "description": "ok",
+                "content": {"application/json": {"schema": nested_schema(depth, width)}}
+            }}}}
+            for i in range(paths)
+        },
+    }
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--paths", type=int, default=100)
+    arg_parser.add_argument("--depth", type=int, default=5)
+    arg_parser.add_argument("--width", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    openapi = OpenAPI.model_validate(schema_heavy_spec(args.paths, args.depth, args.width))
+    parser = Parser()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        parsed = parser.parse(openapi)
+        elapsed = time.perf_counter() - start
+
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    findings = len(parsed.descriptions.missing_descriptions) + len(parsed.schemas.free_form_schemas)
+    print(f"{args.paths} paths, schema depth {args.depth}, width {args.width}: {findings} findings")
+    print(f"parse (traced)   {elapsed * 1000:>10.2f} ms")
+    print(f"peak             {peak / (1024 * 1024):>10.2f} MiB")
+    print(f"retained         {retained / (1024 * 1024):>10.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
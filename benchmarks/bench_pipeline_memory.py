@@ -0,0 +1,75 @@
+"""
+Memory of the whole pipeline on a synthetic spec: tracemalloc bytes still alive when scoring starts
+(what scoring and reports run on top of), peak during scoring + report, peak of the whole run,
+and peak RSS of the process. Run it once per process, RSS peak never goes down.
+
+    python -m benchmarks.bench_pipeline_memory --paths 500
+"""
+
+import gc
+import os
+import argparse
+import resource
+import tempfile
+import tracemalloc
+
+from api_scoring_app.infra.utils.reports import JsonReportGenerator
+from api_scoring_app.runner.ProcessorFactory import ProcessorFactory
+from benchmarks.synthetic import SyntheticSpecOptions, generate_spec, dump_spec
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--paths", type=int, default=500)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        spec_path = os.path.join(tmp_dir, "spec.json")
+        dump_spec(generate_spec(SyntheticSpecOptions(paths=args.paths, seed=args.seed)), spec_path)
+
+        processor = ProcessorFactory.create()
+        score_spec = processor.scoring_engine.score_spec
+        alive_at_score = []
+
+        def probed_score_spec(parsed_specification):
+            gc.collect()
+            alive_at_score.append(tracemalloc.get_traced_memory()[0])
+            tracemalloc.reset_peak()
+            return score_spec(parsed_specification)
+
+        processor.scoring_engine.score_spec = probed_score_spec
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            reports = processor.process(spec_path)
+            with open(os.devnull, "w") as output:
+                JsonReportGenerator().write_report(reports, output)
+            score_report_peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        # whole run, without tracemalloc (separate run, peak above was reset at scoring start)
+        del reports
+        gc.collect()
+        tracemalloc.start()
+        try:
+            processor.scoring_engine.score_spec = score_spec
+            with open(os.devnull, "w") as output:
+                JsonReportGenerator().write_report(processor.process(spec_path), output)
+            run_peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        mib = 1024 * 1024
+        print(f"{args.paths} paths, {os.path.getsize(spec_path) / 1024:.0f} KiB")
+        print(f"    alive at scoring start   {alive_at_score[0] / mib:>8.2f} MiB")
+        print(f"    peak score + report      {score_report_peak / mib:>8.2f} MiB")
+        print(f"    peak whole run           {run_peak / mib:>8.2f} MiB")
+        # KiB on Linux
+        print(f"    peak RSS                 {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:>8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Reference resolution on component-heavy spec: prance `RefResolver` (deep inlining) vs in-house `RefResolver` (shared components).
+
+    python -m benchmarks.bench_ref_resolver --operations 2000 --components 200
+"""
+
+import argparse
+import json
+import random
+
+from api_scoring_app.infra.validators import RefResolver
+from benchmarks.utils import measure
+
+
+def component_heavy_spec(operations: int, components: int, fanout: int = 3, seed: int = 0) -> dict:
+    """
+    Every operation references components in its request and response. First half of the components
+    reference `fanout` components of the second half (leaves), so inlined size stays finite.
+    """
+
+    rnd = random.Random(seed)
+    leaves = range(components // 2, components)
+
+    schemas = {}
+    for i in range(components):
+        properties = {f"field{k}": {"type": "string", "description": f"field {k}"} for k in range(10)}
+        if i < components // 2:
+            for j in rnd.sample(leaves, min(fanout, len(leaves))):
+                properties[f"c{j}"] = {"$ref": f"#/components/schemas/C{j}"}
+        schemas[f"C{i}"] = {"type": "object", "properties": properties}
+
+    paths = {}
+    for i in range(operations):
+        request_ref = {"$ref": f"#/components/schemas/C{rnd.randrange(components)}"}
+        response_ref = {"$ref": f"#/components/schemas/C{rnd.randrange(components)}"}
+        paths[f"/resource{i}"] = {"post": {
+            "requestBody": {"content": {"application/json": {"schema": request_ref}}},
+            "responses": {"200": {"description": "ok", "content": {"application/json": {"schema": response_ref}}}},
+        }}
+
+    return {
+        "openapi": "3.1.0",
+        "info": {"title": "component heavy", "version": "1.0.0"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--operations", type=int, default=2000)
+    arg_parser.add_argument("--components", type=int, default=200)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    spec_json = json.dumps(component_heavy_spec(args.operations, args.components))
+    print(f"{args.operations} operations, {args.components} components, {len(spec_json) / 1024:.0f} KiB json")
+
+    # resolvers work on fresh copy every time, in-house one resolves in place
+    print(measure("json.loads (baseline)", lambda: json.loads(spec_json), args.repeat))
+    print(measure("in-house RefResolver", lambda: RefResolver().resolve(json.loads(spec_json)), args.repeat))
+
+    try:
+        from prance.util.resolver import RefResolver as PranceRefResolver
+        from prance import _PLACEHOLDER_URL as PLACEHOLDER_URL
+    except ImportError:
+        print("prance is not installed, skipping")
+        return
+
+    def prance_resolve():
+        resolver = PranceRefResolver(json.loads(spec_json), PLACEHOLDER_URL)
+        resolver.resolve_references()
+
+    print(measure("prance RefResolver", prance_resolve, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
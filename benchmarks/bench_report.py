@@ -0,0 +1,83 @@
+"""
+Report generation on many issues: whole document built in memory (dict + `json.dumps` string + write) vs streamed writers,
+and issue aggregation (first N issues per rule kept) vs all issues kept.
+
+    python -m benchmarks.bench_report --issues 200000
+"""
+
+import os
+import json
+import argparse
+
+from typing import Optional
+
+from api_scoring_app.core.subscorers import ScoringReport, Issue, IssueSeverity
+from api_scoring_app.infra.utils.reports import JsonReportGenerator, NdjsonReportGenerator
+from benchmarks.utils import measure
+
+
+def issue_heavy_reports(issues: int, subscorers: int = 7, issue_cap: Optional[int] = None) -> list[ScoringReport]:
+    reports = []
+    for i in range(subscorers):
+        report = ScoringReport(f"Subscorer {i}", 20, issue_cap=issue_cap)
+        report.bulk_add_issues((
+            Issue(
+                message=f"Missing response example at endpoint: paths -> /resource{j} -> get -> responses -> 200",
+                path=f"paths -> /resource{j} -> get -> responses -> 200",
+                severity=IssueSeverity.MEDIUM,
+                suggestion="Add examples for responses."
+            )
+            for j in range(issues // subscorers)
+        ), IssueSeverity.MEDIUM, rule="missing_response_examples")
+        reports.append(report)
+
+    return reports
+
+
+def build_and_write(issues: int, issue_cap: Optional[int]) -> None:
+    with open(os.devnull, "w") as file:
+        JsonReportGenerator().write_report(issue_heavy_reports(issues, issue_cap=issue_cap), file)
+
+
+def in_memory(reports: list[ScoringReport]) -> None:
+    """
+    Report generation as it was done before streaming writers.
+    """
+
+    report = json.dumps(JsonReportGenerator().build_report_data(reports), indent=2)
+    with open(os.devnull, "w") as file:
+        file.write(report)
+
+
+def streamed(generator) -> None:
+    with open(os.devnull, "w") as file:
+        generator.write_report(reports_under_test, file)
+
+
+reports_under_test: list[ScoringReport] = []
+
+
+def main() -> None:
+    global reports_under_test
+
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--issues", type=int, default=200000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--cap", type=int, default=10, help="Issues kept per rule in aggregation mode")
+    args = arg_parser.parse_args()
+
+    reports_under_test = issue_heavy_reports(args.issues)
+    print(f"{sum(len(report.issues) for report in reports_under_test)} issues")
+
+    print(measure("in memory (dict + dumps)", lambda: in_memory(reports_under_test), args.repeat))
+    print(measure("streamed json", lambda: streamed(JsonReportGenerator()), args.repeat))
+    print(measure("streamed json-compact", lambda: streamed(JsonReportGenerator(indent=None)), args.repeat))
+    print(measure("streamed ndjson", lambda: streamed(NdjsonReportGenerator()), args.repeat))
+
+    reports_under_test = []
+    print(measure("build + write, all issues", lambda: build_and_write(args.issues, None), args.repeat))
+    print(measure(f"build + write, {args.cap} issues per rule", lambda: build_and_write(args.issues, args.cap), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
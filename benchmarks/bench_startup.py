@@ -0,0 +1,101 @@
+"""
+CLI startup: wall time of fresh interpreter runs, and `python -X importtime` breakdown of what they import.
+
+    python -m benchmarks.bench_startup --repeat 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.utils import ROOT_DIR
+
+RUN_PY = os.path.join(ROOT_DIR, "run.py")
+SIMPLEST_SPEC_PATH = os.path.join(ROOT_DIR, "tests", "specs", "spec_simplest.yaml")
+
+# modules that are expensive to import, and should load only when needed
+HEAVY_MODULES = ("requests", "openapi_pydantic", "pydantic")
+
+SCENARIOS = {
+    "cli --help": [RUN_PY, "--help"],
+    "client --help": [RUN_PY, "client", "--help"],
+    "score local spec": [RUN_PY, SIMPLEST_SPEC_PATH],
+}
+
+
+def import_profile(args: list[str]) -> dict[str, int]:
+    """
+    Run python with `-X importtime`, returns top-level imported module -> cumulative import time (us).
+    Nested imports are accounted for by the module that triggered them.
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True
+    )
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit() or name.startswith("  "):
+            continue  # header line, or nested import
+
+        profile[name.strip()] = int(cumulative)
+
+    return profile
+
+
+def imported_modules(args: list[str]) -> set[str]:
+    """
+    All modules imported by the run, nested ones included.
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True
+    )
+
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+def wall_time(args: list[str], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=ROOT_DIR, capture_output=True, check=True)
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--top", type=int, default=5, help="How many slowest top-level imports to show per scenario")
+    args = arg_parser.parse_args()
+
+    baseline = wall_time(["-c", "pass"], args.repeat)
+    print(f"{'bare interpreter':<40} median {baseline * 1000:>10.2f} ms")
+
+    for name, scenario_args in SCENARIOS.items():
+        median = wall_time(scenario_args, args.repeat)
+        profile = import_profile(scenario_args)
+        heavy = sorted(module for module in imported_modules(scenario_args) if module in HEAVY_MODULES)
+
+        print(f"{name:<40} median {median * 1000:>10.2f} ms   imports {sum(profile.values()) / 1000:>8.2f} ms   heavy: {', '.join(heavy) or '-'}")
+        for module, cumulative in sorted(profile.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"    {module:<36} {cumulative / 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
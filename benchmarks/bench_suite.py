@@ -0,0 +1,216 @@
+"""
+Stage benchmark suite: wall/CPU time and tracemalloc peak of every pipeline stage and subscorer, on synthetic
+specs of growing size. JSON results (`-o`) can be compared between commits.
+
+    python -m benchmarks.bench_suite --tiers small,medium --repeat 5 -o results.json
+
+Regression gate (exits with 1 if any stage got slower or fatter than the baseline tolerates,
+tiers and spec options are taken from the baseline):
+
+    python -m benchmarks.bench_suite --compare benchmarks/baseline.json
+    python -m benchmarks.bench_suite --tiers small,medium --update-baseline benchmarks/baseline.json
+"""
+
+import os
+import gc
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+
+from typing import Any, Optional
+from dataclasses import replace
+
+from api_scoring_app.infra.instrumentation import Instrumentation
+from api_scoring_app.infra.utils.reports import JsonReportGenerator
+from api_scoring_app.runner.ProcessorFactory import ProcessorFactory
+from benchmarks.regression import Tolerances, calibration_scales, compare, format_table, load_baseline, write_baseline
+from benchmarks.synthetic import SyntheticSpecOptions, generate_spec, dump_spec
+from benchmarks.utils import ROOT_DIR
+
+TIERS = {
+    "small": SyntheticSpecOptions(paths=10),
+    "medium": SyntheticSpecOptions(paths=100),
+    "large": SyntheticSpecOptions(paths=500),
+}
+
+# whole run (process + report), next to the stages reported by instrumentation
+TOTAL_STAGE = "total"
+
+
+def run_tier(options: SyntheticSpecOptions, repeat: int = 5, trace_memory: bool = True, spec_format: str = "json") -> dict[str, Any]:
+    """
+    Score the synthetic spec `repeat` times, returns median wall/CPU time per stage. Memory peaks
+    are measured on an extra, separate run (tracemalloc slows things down).
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        spec_path = os.path.join(tmp_dir, f"spec.{spec_format}")
+        dump_spec(generate_spec(options), spec_path)
+
+        processor = ProcessorFactory.create()
+
+        # lazily built caches (dispatch tables, imports) shouldn't count towards the first run
+        _score(processor, spec_path, Instrumentation())
+
+        runs = []
+        calibrations = []
+        for _ in range(repeat):
+            gc.collect()
+            calibrations.append(calibrate())
+            runs.append(_score(processor, spec_path, Instrumentation()))
+
+        peaks = {}
+        if trace_memory:
+            gc.collect()
+            peaks = {name: peak for name, (_, _, peak) in _score(processor, spec_path, Instrumentation(trace_memory=True)).items()}
+
+        return {
+            "options": options.to_dict(),
+            "spec_bytes": os.path.getsize(spec_path),
+            "calibration": statistics.median(calibrations),
+            "stages": {
+                name: {
+                    "wall": statistics.median(run[name][0] for run in runs),
+                    "cpu": statistics.median(run[name][1] for run in runs),
+                    "peak_memory": peaks.get(name),
+                }
+                for name in runs[0]
+            },
+        }
+
+
+def calibrate() -> float:
+    """
+    Time of fixed pure-Python workload (dict building and traversal, json round trip, like the pipeline),
+    measured next to every run so results of differently fast or busy machines can be normalized.
+    """
+
+    start = time.perf_counter()
+    data = [{"id": i, "name": f"item{i}", "tags": [str(i % 7)] * 3} for i in range(20000)]
+    sum(len(item["name"]) for item in data if item["id"] % 3)
+    json.loads(json.dumps(data))
+    return time.perf_counter() - start
+
+
+def _score(processor, spec_path: str, instrumentation: Instrumentation) -> dict[str, tuple[float, float, Optional[int]]]:
+    """
+    Single instrumented run, returns stage -> (wall, cpu, peak memory).
+    """
+
+    processor.instrumentation = instrumentation
+
+    start, cpu_start = time.perf_counter(), time.process_time()
+    with instrumentation.activate():
+        reports = processor.process(spec_path)
+        JsonReportGenerator().generate_report(reports, timings=instrumentation.timings)
+    wall, cpu = time.perf_counter() - start, time.process_time() - cpu_start
+
+    stages = {timing.name: (timing.wall, timing.cpu, timing.peak_memory) for timing in instrumentation.sorted_timings()}
+    # stage peaks are relative to stage start, the largest of them stands for the run
+    stages[TOTAL_STAGE] = (wall, cpu, max((peak for _, _, peak in stages.values() if peak is not None), default=None))
+    return stages
+
+
+def run_suite(tiers: dict[str, SyntheticSpecOptions], repeat: int = 5, trace_memory: bool = True, spec_format: str = "json") -> dict[str, Any]:
+    return {
+        "meta": environment(repeat),
+        "tiers": {name: run_tier(options, repeat, trace_memory, spec_format) for name, options in tiers.items()},
+    }
+
+
+def environment(repeat: int) -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def print_results(results: dict[str, Any], file=sys.stdout) -> None:
+    for tier, tier_results in results["tiers"].items():
+        print(f"{tier} ({tier_results['options']['paths']} paths, {tier_results['spec_bytes'] / 1024:.0f} KiB)", file=file)
+        for name, stage in tier_results["stages"].items():
+            output = f"    {name:<52} wall {stage['wall'] * 1000:>10.2f} ms   cpu {stage['cpu'] * 1000:>10.2f} ms"
+            if stage["peak_memory"] is not None:
+                output += f"   peak {stage['peak_memory'] / (1024 * 1024):>8.2f} MiB"
+            print(output, file=file)
+
+
+def select_tiers(names: str, seed: int) -> dict[str, SyntheticSpecOptions]:
+    tiers = {}
+    for name in names.split(","):
+        if name not in TIERS:
+            raise SystemExit(f"Unknown tier: {name} (available: {', '.join(TIERS)})")
+        tiers[name] = replace(TIERS[name], seed=seed)
+    return tiers
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--tiers", default=",".join(TIERS), help=f"Comma separated size tiers (default: {','.join(TIERS)})")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--format", choices=["json", "yaml"], default="json", help="Spec file format, affects the load stage")
+    arg_parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc run")
+    arg_parser.add_argument("-o", "--output", help="Write JSON results to this file")
+    arg_parser.add_argument("--compare", metavar="BASELINE", help="Compare against baseline file, exit with 1 on regression")
+    arg_parser.add_argument("--update-baseline", metavar="BASELINE", help="Write results as the new baseline, keeping its tolerances")
+    arg_parser.add_argument("--current", metavar="RESULTS", help="With --compare: use these results instead of running the suite")
+    arg_parser.add_argument("--regressions-only", action="store_true", help="With --compare: print regressed rows only")
+    arg_parser.add_argument("--no-normalize", action="store_true", help="With --compare: don't scale wall times by calibration workload")
+    args = arg_parser.parse_args()
+
+    if args.compare:
+        baseline, tolerances = load_baseline(args.compare)
+        if args.current:
+            with open(args.current) as file:
+                results = json.load(file)
+        else:
+            # same specs as the baseline was measured on
+            tiers = {name: SyntheticSpecOptions(**tier["options"]) for name, tier in baseline["tiers"].items()}
+            results = run_suite(tiers, args.repeat, not args.no_memory, args.format)
+    else:
+        results = run_suite(select_tiers(args.tiers, args.seed), args.repeat, not args.no_memory, args.format)
+        print_results(results)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.update_baseline:
+        tolerances = Tolerances()
+        if os.path.exists(args.update_baseline):
+            tolerances = load_baseline(args.update_baseline)[1]
+        write_baseline(args.update_baseline, results, tolerances)
+
+    if args.compare:
+        comparisons = compare(baseline, results, tolerances, normalize=not args.no_normalize)
+        print(f"baseline {baseline['meta'].get('commit')} ({baseline['meta'].get('created')}) vs current {results['meta'].get('commit')}")
+        if not args.no_normalize:
+            for tier, scale in calibration_scales(baseline, results).items():
+                print(f"{tier}: wall times scaled by {scale:.3f} (calibration workload, baseline / current)")
+        print(format_table(comparisons, only_changes=args.regressions_only))
+
+        regressions = [comparison for comparison in comparisons if comparison.regressed]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s)")
+            sys.exit(1)
+        print("\nno regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Load-to-validate time: legacy `dict -> json string -> prance re-parse` round trip vs handing the loaded dict over.
+
+    python -m benchmarks.bench_validation --factor 200
+"""
+
+import argparse
+import json
+import os
+import tempfile
+
+from openapi_pydantic import OpenAPI
+
+from api_scoring_app.infra.utils import LocalSpecLoader
+from api_scoring_app.infra.validators import PydanticValidator
+from benchmarks.utils import measure, load_public_sample, scale_spec
+
+
+def legacy_load_to_validate(spec_path: str) -> None:
+    """
+    Pipeline as it was before validator accepted loaded objects (prance for parsing and resolving).
+    """
+
+    from prance.util.resolver import RefResolver
+    from prance.util.formats import parse_spec
+    from prance import _PLACEHOLDER_URL as PLACEHOLDER_URL
+
+    spec_string = json.dumps(LocalSpecLoader(spec_path).load())
+
+    resolver = RefResolver(parse_spec(spec_string, PLACEHOLDER_URL), PLACEHOLDER_URL)
+    resolver.resolve_references()
+    OpenAPI.model_validate(resolver.specs)
+
+
+def string_load_to_validate(spec_path: str) -> None:
+    spec_string = json.dumps(LocalSpecLoader(spec_path).load())
+    assert PydanticValidator().validate(spec_string).is_valid()
+
+
+def dict_load_to_validate(spec_path: str) -> None:
+    spec_dict = LocalSpecLoader(spec_path).load()
+    assert PydanticValidator().validate(spec_dict).is_valid()
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--factor", type=int, default=100, help="How many times to replicate paths of public_sample.yaml")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    spec = scale_spec(load_public_sample(), args.factor)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        spec_path = os.path.join(tmp_dir, "spec.json")
+        with open(spec_path, "w") as file:
+            json.dump(spec, file)
+
+        print(f"spec size: {os.path.getsize(spec_path) / (1024 * 1024):.2f} MiB, {len(spec['paths'])} paths")
+
+        try:
+            print(measure("legacy (json round trip + prance)", lambda: legacy_load_to_validate(spec_path), args.repeat))
+        except ImportError:
+            print("prance is not installed, skipping legacy pipeline")
+        print(measure("validate(str)", lambda: string_load_to_validate(spec_path), args.repeat))
+        print(measure("validate(dict)", lambda: dict_load_to_validate(spec_path), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Performance regression gate: compares `bench_suite` results against a checked-in baseline.
+
+Tolerances live in the baseline file next to the measurements, so they survive `--update-baseline`:
+
+    "tolerances": {
+        "default": {"wall": 0.25, "peak_memory": 0.10},
+        "stages": {"score/subscorer:*": {"wall": 0.50}}
+    }
+
+Stage keys are `fnmatch` patterns, the first matching one wins. A stage regresses when a metric grows
+by more than its tolerance (relative) AND by more than the absolute floor, so that sub-millisecond
+stages don't fail the gate on timer noise.
+
+Wall times are medians of N runs, and by default scaled by the tier's calibration workload
+(baseline / current), so a machine that is slower or busier as a whole doesn't fail the gate.
+"""
+
+import json
+import fnmatch
+
+from typing import Any, Optional
+from dataclasses import dataclass, field
+
+METRICS = ("wall", "peak_memory")
+
+DEFAULT_TOLERANCES = {"wall": 0.25, "peak_memory": 0.10}
+
+# changes smaller than these are noise, whatever the ratio
+ABSOLUTE_FLOORS = {"wall": 0.005, "peak_memory": 256 * 1024}
+
+
+@dataclass
+class Tolerances:
+    """
+    Allowed relative growth per metric, default and per stage pattern.
+    """
+
+    default: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_TOLERANCES))
+    stages: dict[str, dict[str, float]] = field(default_factory=dict)
+    floors: dict[str, float] = field(default_factory=lambda: dict(ABSOLUTE_FLOORS))
+
+    @staticmethod
+    def from_dict(data: Optional[dict[str, Any]]) -> "Tolerances":
+        data = data or {}
+        return Tolerances(
+            default={**DEFAULT_TOLERANCES, **data.get("default", {})},
+            stages=data.get("stages", {}),
+            floors={**ABSOLUTE_FLOORS, **data.get("floors", {})},
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"default": self.default, "stages": self.stages, "floors": self.floors}
+
+    def allowed(self, stage: str, metric: str) -> float:
+        for pattern, tolerances in self.stages.items():
+            if fnmatch.fnmatchcase(stage, pattern) and metric in tolerances:
+                return tolerances[metric]
+        return self.default[metric]
+
+
+@dataclass
+class StageComparison:
+    tier: str
+    stage: str
+    metric: str
+    baseline: Optional[float]
+    current: Optional[float]
+    allowed: float
+    regressed: bool
+
+    @property
+    def change(self) -> Optional[float]:
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1
+
+
+def calibration_scales(baseline: dict[str, Any], current: dict[str, Any]) -> dict[str, float]:
+    """
+    Tier -> factor to scale current wall times by, for tiers with calibration on both sides.
+    """
+
+    scales = {}
+    for tier, baseline_tier in baseline["tiers"].items():
+        before = baseline_tier.get("calibration")
+        after = current["tiers"].get(tier, {}).get("calibration")
+        if before and after:
+            scales[tier] = before / after
+    return scales
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], tolerances: Tolerances, normalize: bool = True) -> list[StageComparison]:
+    """
+    Compare every tier/stage/metric present in the baseline. Stages missing on either side are
+    listed, but don't count as regressions.
+    """
+
+    scales = calibration_scales(baseline, current) if normalize else {}
+
+    comparisons = []
+    for tier, baseline_tier in baseline["tiers"].items():
+        current_stages = current["tiers"].get(tier, {}).get("stages", {})
+        baseline_stages = baseline_tier["stages"]
+        scale = scales.get(tier, 1.0)
+
+        for stage in list(baseline_stages) + [stage for stage in current_stages if stage not in baseline_stages]:
+            for metric in METRICS:
+                before = baseline_stages.get(stage, {}).get(metric)
+                after = current_stages.get(stage, {}).get(metric)
+                if metric == "wall" and after is not None:
+                    after *= scale
+                allowed = tolerances.allowed(stage, metric)
+
+                regressed = (
+                    before is not None and after is not None
+                    and after > before * (1 + allowed)
+                    and after - before > tolerances.floors[metric]
+                )
+                comparisons.append(StageComparison(tier, stage, metric, before, after, allowed, regressed))
+
+    return comparisons
+
+
+def format_table(comparisons: list[StageComparison], only_changes: bool = False) -> str:
+    """
+    Readable diff table, regressions are marked with `REGRESSED`.
+    """
+
+    lines = [f"{'tier':<8} {'stage':<52} {'metric':<12} {'baseline':>12} {'current':>12} {'change':>9} {'allowed':>8}"]
+    for comparison in comparisons:
+        if only_changes and not comparison.regressed:
+            continue
+
+        change = "-" if comparison.change is None else f"{comparison.change:+.1%}"
+        status = "REGRESSED" if comparison.regressed else ""
+        if comparison.baseline is None:
+            status = "new"
+        elif comparison.current is None:
+            status = "missing"
+
+        lines.append(
+            f"{comparison.tier:<8} {comparison.stage:<52} {comparison.metric:<12} "
+            f"{_format_value(comparison.metric, comparison.baseline):>12} {_format_value(comparison.metric, comparison.current):>12} "
+            f"{change:>9} {f'{comparison.allowed:.0%}':>8}  {status}".rstrip()
+        )
+
+    return "\n".join(lines)
+
+
+def _format_value(metric: str, value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if metric == "peak_memory":
+        return f"{value / (1024 * 1024):.2f} MiB"
+    return f"{value * 1000:.2f} ms"
+
+
+def load_baseline(path: str) -> tuple[dict[str, Any], Tolerances]:
+    with open(path) as file:
+        baseline = json.load(file)
+    return baseline, Tolerances.from_dict(baseline.get("tolerances"))
+
+
+def write_baseline(path: str, results: dict[str, Any], tolerances: Tolerances) -> None:
+    with open(path, "w") as file:
+        json.dump({**results, "tolerances": tolerances.to_dict()}, file, indent=2)
+        file.write("\n")
@@ -0,0 +1,214 @@
+"""
+Deterministic synthetic OpenAPI 3.1 specs for scaling benchmarks, same options and seed give the same spec.
+
+    python -m benchmarks.synthetic --paths 1000 --schema-depth 4 -o /tmp/synthetic.yaml
+"""
+
+import json
+import random
+import argparse
+
+from typing import Any, Optional
+from dataclasses import dataclass, asdict
+
+import yaml
+
+
+METHODS = ("get", "post", "put", "patch", "delete")
+# one camelCase resource among kebab/lowercase ones, for naming findings
+RESOURCES = ("users", "orders", "products", "invoices", "accounts", "payments", "shipping-labels", "orderItems")
+
+# security scheme types, cycled through in this order
+SECURITY_SCHEMES = (
+    {"type": "http", "scheme": "bearer", "bearerFormat": "JWT"},
+    {"type": "apiKey", "in": "header", "name": "X-API-Key"},
+    {"type": "oauth2", "flows": {"clientCredentials": {"tokenUrl": "https://auth.example.com/token", "scopes": {"read": "read access"}}}},
+    {"type": "openIdConnect", "openIdConnectUrl": "https://auth.example.com/.well-known/openid-configuration"},
+)
+
+WORDS = ("lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit", "sed", "do", "eiusmod", "tempor")
+
+
+@dataclass(frozen=True)
+class SyntheticSpecOptions:
+    """
+    Shape of the generated spec.
+
+    `component_reuse` is the share of request/response schemas that `$ref` a shared component
+    instead of being inlined, `description_size` is the length (characters) of every description.
+    A small, fixed share of descriptions, examples and error responses is left out, so every
+    subscorer has findings to report.
+    """
+
+    paths: int = 100
+    operations_per_path: int = 3
+    schema_depth: int = 3
+    component_reuse: float = 0.5
+    description_size: int = 40
+    security_schemes: int = 2
+    seed: int = 0
+
+    # shared component schemas, default: one per 5 paths
+    components: Optional[int] = None
+
+    def __post_init__(self):
+        if not 1 <= self.operations_per_path <= len(METHODS):
+            raise ValueError(f"operations_per_path should be between 1 and {len(METHODS)}")
+        if not 0.0 <= self.component_reuse <= 1.0:
+            raise ValueError("component_reuse should be between 0 and 1")
+
+    @property
+    def component_count(self) -> int:
+        return self.components if self.components is not None else max(1, self.paths // 5)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class _SpecGenerator:
+
+    def __init__(self, options: SyntheticSpecOptions):
+        self.options = options
+        self.rnd = random.Random(options.seed)
+
+    def generate(self) -> dict[str, Any]:
+        options = self.options
+
+        scheme_names = [f"scheme{i}" for i in range(options.security_schemes)]
+        spec: dict[str, Any] = {
+            "openapi": "3.1.0",
+            "info": {"title": "Synthetic API", "version": "1.0.0", "description": self._description()},
+            "servers": [{"url": "https://api.example.com", "description": self._description()}],
+            "tags": [{"name": resource, "description": self._description()} for resource in RESOURCES],
+            "paths": {},
+            "components": {
+                "schemas": {f"Component{i}": self._schema(options.schema_depth) for i in range(options.component_count)},
+                "securitySchemes": {
+                    name: {**SECURITY_SCHEMES[i % len(SECURITY_SCHEMES)], "description": self._description()}
+                    for i, name in enumerate(scheme_names)
+                },
+            },
+        }
+        if scheme_names:
+            spec["security"] = [{scheme_names[0]: []}]
+
+        for i in range(options.paths):
+            resource = RESOURCES[i % len(RESOURCES)]
+            path = f"/v1/{resource}{i}" if i % 2 == 0 else f"/v1/{resource}{i}/{{id}}"
+            spec["paths"][path] = {
+                method: self._operation(resource, method, i, scheme_names)
+                for method in METHODS[:options.operations_per_path]
+            }
+
+        return spec
+
+    def _operation(self, resource: str, method: str, index: int, scheme_names: list[str]) -> dict[str, Any]:
+        operation: dict[str, Any] = {
+            "operationId": f"{method}_{resource}{index}",
+            "tags": [resource],
+            "responses": {"200": self._response()},
+        }
+        if self.rnd.random() < 0.9:
+            operation["description"] = self._description()
+        if self.rnd.random() < 0.8:
+            operation["responses"]["404"] = self._response()
+        if scheme_names and self.rnd.random() < 0.5:
+            operation["security"] = [{self.rnd.choice(scheme_names): []}]
+
+        if method in ("post", "put", "patch"):
+            operation["requestBody"] = {
+                "required": True,
+                "description": self._description(),
+                "content": {"application/json": self._media_type()},
+            }
+
+        return operation
+
+    def _response(self) -> dict[str, Any]:
+        return {"description": self._description(), "content": {"application/json": self._media_type()}}
+
+    def _media_type(self) -> dict[str, Any]:
+        if self.rnd.random() < 0.05:
+            media_type = {"schema": {"type": "object"}} # free-form
+        elif self.rnd.random() < self.options.component_reuse:
+            media_type = {"schema": {"$ref": f"#/components/schemas/Component{self.rnd.randrange(self.options.component_count)}"}}
+        else:
+            media_type = {"schema": self._schema(self.options.schema_depth)}
+
+        if self.rnd.random() < 0.7:
+            media_type["example"] = {"id": self.rnd.randrange(1000)}
+        return media_type
+
+    def _schema(self, depth: int) -> dict[str, Any]:
+        """
+        Object schema nested `depth` levels deep, every level has a few scalar properties.
+        """
+
+        properties: dict[str, Any] = {
+            "id": {"type": "integer", "description": self._description()},
+            "name": {"type": "string", "description": self._description()},
+            "labels": {"type": "array", "items": {"type": "string"}},
+            "createdAt": {"type": "string", "format": "date-time"},
+        }
+        if depth > 1:
+            properties["child"] = self._schema(depth - 1)
+
+        return {"type": "object", "description": self._description(), "properties": properties, "required": ["id"]}
+
+    def _description(self) -> str:
+        size = self.options.description_size
+
+        words = []
+        length = 0
+        while length < size:
+            word = self.rnd.choice(WORDS)
+            words.append(word)
+            length += len(word) + 1
+
+        return " ".join(words)[:size]
+
+
+def generate_spec(options: SyntheticSpecOptions = SyntheticSpecOptions()) -> dict[str, Any]:
+    return _SpecGenerator(options).generate()
+
+
+def dump_spec(spec: dict[str, Any], path: str) -> None:
+    """
+    Write the spec as JSON or YAML, by file extension.
+    """
+
+    with open(path, "w") as file:
+        if path.endswith(".json"):
+            json.dump(spec, file)
+        else:
+            yaml.dump(spec, file, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper), sort_keys=False)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--paths", type=int, default=100)
+    arg_parser.add_argument("--operations-per-path", type=int, default=3)
+    arg_parser.add_argument("--schema-depth", type=int, default=3)
+    arg_parser.add_argument("--component-reuse", type=float, default=0.5)
+    arg_parser.add_argument("--components", type=int, default=None)
+    arg_parser.add_argument("--description-size", type=int, default=40)
+    arg_parser.add_argument("--security-schemes", type=int, default=2)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("-o", "--output", required=True, help="Output file, .json or .yaml")
+    args = arg_parser.parse_args()
+
+    options = SyntheticSpecOptions(
+        paths=args.paths,
+        operations_per_path=args.operations_per_path,
+        schema_depth=args.schema_depth,
+        component_reuse=args.component_reuse,
+        components=args.components,
+        description_size=args.description_size,
+        security_schemes=args.security_schemes,
+        seed=args.seed,
+    )
+    dump_spec(generate_spec(options), args.output)
+
+
+if __name__ == "__main__":
+    main()
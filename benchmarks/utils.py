@@ -0,0 +1,80 @@
+import copy
+import gc
+import os
+import statistics
+import time
+import tracemalloc
+
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import yaml
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PUBLIC_SAMPLE_PATH = os.path.join(ROOT_DIR, "public_sample.yaml")
+
+
+@dataclass
+class Measurement:
+    """
+    Result of the repeated measurement of single callable.
+    """
+
+    name: str
+    median: float
+    best: float
+    peak_memory: Optional[int] = None
+
+    def __str__(self) -> str:
+        output = f"{self.name:<40} median {self.median * 1000:>10.2f} ms   best {self.best * 1000:>10.2f} ms"
+        if self.peak_memory is not None:
+            output += f"   peak {self.peak_memory / (1024 * 1024):>8.2f} MiB"
+        return output
+
+
+def measure(name: str, fn: Callable[[], Any], repeat: int = 5, trace_memory: bool = True) -> Measurement:
+    """
+    Run `fn` `repeat` times, memory peak is measured on an extra, separate run (tracemalloc slows things down).
+    """
+
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    peak_memory = None
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return Measurement(name, statistics.median(timings), min(timings), peak_memory)
+
+
+def load_public_sample() -> dict[str, Any]:
+    with open(PUBLIC_SAMPLE_PATH, "r") as file:
+        return yaml.safe_load(file)
+
+
+def scale_spec(spec: dict[str, Any], factor: int) -> dict[str, Any]:
+    """
+    Replicate every path of the specification `factor` times, under distinct prefixes.
+    """
+
+    scaled = copy.deepcopy(spec)
+    paths = spec.get("paths") or {}
+
+    scaled["paths"] = {
+        f"/copy{i}{path}": copy.deepcopy(path_item)
+        for i in range(factor)
+        for path, path_item in paths.items()
+    }
+
+    return scaled
@@ -1,5 +1,10 @@
-
-from api_scoring_app.main import main
+import sys
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["client"]:
+        # forwards to a running server (`run.py serve`), scoring pipeline is never imported
+        from api_scoring_app.client import main as client_main
+        sys.exit(client_main(sys.argv[2:]))
+
+    from api_scoring_app.main import main
     main()
@@ -3,11 +3,10 @@ from setuptools import setup, find_packages
 setup(
     name="api_scoring_app",
     version="0.0.1",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks*", "tests*"]),
     install_requires=[
         "click",
         "openapi-pydantic",
-        "prance",
         "openapi-spec-validator",
         "pydantic",
         "pytest",
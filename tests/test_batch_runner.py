@@ -0,0 +1,119 @@
+import io
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from unittest.mock import patch
+from click.testing import CliRunner
+
+from api_scoring_app.main import main
+from api_scoring_app.runner import BatchRunner as batch_runner
+from api_scoring_app.runner.BatchRunner import BatchRunner, expand_spec_sources, read_spec_list
+
+SPECS_DIR = os.path.join(os.path.dirname(__file__), "specs")
+
+_score_spec = batch_runner.score_spec
+
+
+def _score_or_crash(spec_source: str):
+    """
+    Worker task killing its worker process on `crash` specs, like a segfault or OOM kill would.
+    """
+
+    if "crash" in os.path.basename(spec_source):
+        os._exit(1)
+    return _score_spec(spec_source)
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Test suite for batch scoring."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.specs_dir = os.path.join(self.tmp_dir.name, "specs")
+        os.makedirs(os.path.join(self.specs_dir, "nested"))
+
+        shutil.copy(os.path.join(SPECS_DIR, "test_known_issues.yaml"), os.path.join(self.specs_dir, "known.yaml"))
+        shutil.copy(os.path.join(SPECS_DIR, "spec_simplest.yaml"), os.path.join(self.specs_dir, "nested", "simplest.yml"))
+        with open(os.path.join(self.specs_dir, "invalid.json"), "w") as file:
+            json.dump({"openapi": "3.1.0"}, file)
+        with open(os.path.join(self.specs_dir, "notes.txt"), "w") as file:
+            file.write("not a spec")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+
+    def test_expand_spec_sources(self):
+        """Test that directories and globs are expanded, other sources are kept."""
+
+        sources = expand_spec_sources([
+            self.specs_dir,
+            os.path.join(self.specs_dir, "**", "*.yml"),
+            "missing.yaml"
+        ])
+
+        self.assertEqual(sources, [
+            os.path.join(self.specs_dir, "invalid.json"),
+            os.path.join(self.specs_dir, "known.yaml"),
+            os.path.join(self.specs_dir, "nested", "simplest.yml"),
+            "missing.yaml"
+        ])
+
+        self.assertEqual(read_spec_list(io.StringIO("a.yaml\n\n# comment\n  b.json  \n")), ["a.yaml", "b.json"])
+
+
+    def test_failures_are_isolated(self):
+        """Test that every spec gets its own record, failing ones don't stop the batch."""
+
+        output = io.StringIO()
+        sources = expand_spec_sources([self.specs_dir, "missing.yaml"])
+
+        summary = BatchRunner(workers=2).run(sources, output)
+
+        records = {record["spec"]: record for record in map(json.loads, output.getvalue().splitlines())}
+
+        self.assertEqual(set(records), set(sources))
+        self.assertEqual(records[os.path.join(self.specs_dir, "known.yaml")]["status"], "ok")
+        self.assertEqual(records[os.path.join(self.specs_dir, "nested", "simplest.yml")]["report"]["overall_grade"], "A")
+        self.assertEqual(records[os.path.join(self.specs_dir, "invalid.json")]["status"], "error")
+        self.assertIn("File not found", records["missing.yaml"]["error"])
+
+        self.assertEqual((summary.total, summary.succeeded, summary.failed), (4, 2, 2))
+        self.assertIsNotNone(summary.to_dict()["specs_per_second"])
+
+
+    def test_crashing_worker_is_isolated(self):
+        """Test that worker dying on one spec doesn't fail the specs in flight with it."""
+
+        shutil.copy(os.path.join(SPECS_DIR, "spec_simplest.yaml"), os.path.join(self.specs_dir, "crash.yaml"))
+        sources = [os.path.join(self.specs_dir, name) for name in ("known.yaml", "crash.yaml", os.path.join("nested", "simplest.yml"), "invalid.json")]
+
+        output = io.StringIO()
+        with patch.object(batch_runner, "score_spec", _score_or_crash):
+            summary = BatchRunner(workers=2).run(sources, output)
+
+        records = {record["spec"]: record for record in map(json.loads, output.getvalue().splitlines())}
+
+        self.assertEqual(len(output.getvalue().splitlines()), len(sources))
+        self.assertIn("Worker failed", records[os.path.join(self.specs_dir, "crash.yaml")]["error"])
+        self.assertEqual(records[os.path.join(self.specs_dir, "known.yaml")]["status"], "ok")
+        self.assertEqual(records[os.path.join(self.specs_dir, "nested", "simplest.yml")]["status"], "ok")
+        self.assertEqual(records[os.path.join(self.specs_dir, "invalid.json")]["status"], "error")
+        self.assertEqual((summary.total, summary.succeeded, summary.failed), (4, 2, 2))
+
+
+    def test_cli(self):
+        """Test batch subcommand, and that single spec scoring is still the default command."""
+
+        runner = CliRunner()
+
+        result = runner.invoke(main, ["batch", self.specs_dir, "--workers", "1"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(len([line for line in result.output.splitlines() if line.startswith("{")]), 3)
+
+        result = runner.invoke(main, [os.path.join(self.specs_dir, "known.yaml")])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("overall_grade", result.output)
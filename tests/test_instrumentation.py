@@ -0,0 +1,81 @@
+import os
+import json
+import unittest
+
+from click.testing import CliRunner
+
+from api_scoring_app.main import main
+from api_scoring_app.core.types import ExecutionMode
+from api_scoring_app.infra.instrumentation import Instrumentation, stage
+from api_scoring_app.runner.ProcessorFactory import ProcessorFactory
+
+SPEC_PATH = os.path.join(os.path.dirname(__file__), "specs", "test_known_issues.yaml")
+
+PIPELINE_STAGES = ["load", "validate", "validate/resolve", "validate/pydantic", "parse", "score"]
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test suite for per-stage instrumentation."""
+
+    def test_stages_and_hooks(self):
+        """Test that every pipeline stage and subscorer is measured, and passed to hooks."""
+
+        received = []
+        instrumentation = Instrumentation(trace_memory=True, hooks=[received.append])
+
+        processor = ProcessorFactory.create(instrumentation=instrumentation)
+        processor.process(SPEC_PATH)
+
+        names = [timing.name for timing in instrumentation.sorted_timings()]
+        self.assertEqual(names[:len(PIPELINE_STAGES)], PIPELINE_STAGES)
+        self.assertEqual(
+            names[len(PIPELINE_STAGES):],
+            [f"score/subscorer:{subscorer.name}" for subscorer in processor.scoring_engine.subscorers]
+        )
+
+        self.assertEqual(received, instrumentation.timings)
+        for timing in instrumentation.timings:
+            self.assertGreaterEqual(timing.wall, 0)
+            self.assertGreaterEqual(timing.cpu, 0)
+            self.assertIsInstance(timing.peak_memory, int)
+
+
+    def test_pool_timings_are_merged(self):
+        """Test that subscorers measured in process pool workers end up in caller's instrumentation."""
+
+        instrumentation = Instrumentation()
+        processor = ProcessorFactory.create(execution_mode=ExecutionMode.PROCESS, instrumentation=instrumentation)
+
+        processor.process(SPEC_PATH)
+
+        subscorer_stages = [timing.name for timing in instrumentation.timings if timing.name.startswith("score/")]
+        self.assertEqual(len(subscorer_stages), len(processor.scoring_engine.subscorers))
+
+
+    def test_disabled(self):
+        """Test that stages outside of active instrumentation are not recorded."""
+
+        instrumentation = Instrumentation()
+        with stage("outside"):
+            pass
+
+        with instrumentation.activate():
+            with stage("outer"):
+                with stage("inner"):
+                    pass
+
+        self.assertEqual([timing.name for timing in instrumentation.sorted_timings()], ["outer", "outer/inner"])
+
+
+    def test_cli_profile(self):
+        """Test that `--profile` adds timings section to the report."""
+
+        result = CliRunner().invoke(main, [SPEC_PATH, "--profile"])
+        self.assertEqual(result.exit_code, 0, result.output)
+
+        timings = json.loads(result.output)["timings"]
+        self.assertEqual([timing["stage"] for timing in timings][-1], "report")
+        self.assertIsNone(timings[0]["peak_memory"])
+
+        result = CliRunner().invoke(main, [SPEC_PATH])
+        self.assertNotIn("timings", json.loads(result.output))
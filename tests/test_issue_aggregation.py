@@ -0,0 +1,109 @@
+import os
+import unittest
+import tracemalloc
+
+from api_scoring_app.core import Config
+from api_scoring_app.core.parser import ParsedSpecification
+from api_scoring_app.core.subscorers import ScoringReport, ScoringContext, Issue, IssueSeverity
+from api_scoring_app.infra.subscorers import DescriptionSubscorer
+from api_scoring_app.infra.utils.reports import JsonReportGenerator
+from api_scoring_app.runner.ProcessorFactory import ProcessorFactory
+
+SPEC_PATH = os.path.join(os.path.dirname(__file__), "..", "public_sample.yaml")
+
+
+def issues(count: int, prefix: str = "/pets"):
+    return (Issue(f"Issue {i}", IssueSeverity.LOW, f"paths -> {prefix}{i % 3} -> get") for i in range(count))
+
+
+class TestIssueAggregation(unittest.TestCase):
+    """Test suite for per-rule issue caps."""
+
+    def test_cap(self):
+        """Test that only the first issues are kept, with exact count and path histogram."""
+
+        report = ScoringReport("Descriptions", 20, issue_cap=2)
+        report.bulk_add_issues(issues(10), IssueSeverity.MEDIUM, rule="missing_descriptions")
+
+        self.assertEqual([issue.message for issue in report.issues], ["Issue 0", "Issue 1"])
+        self.assertEqual(report.severity_counts[IssueSeverity.LOW], 10)
+
+        aggregate, = report.aggregates
+        self.assertEqual((aggregate.rule, aggregate.count, aggregate.omitted), ("missing_descriptions", 10, 8))
+        self.assertEqual(aggregate.path_histogram, {"paths -> /pets0": 4, "paths -> /pets1": 3, "paths -> /pets2": 3})
+
+
+    def test_scoring_unchanged(self):
+        """Test that scores and severity counts don't depend on the cap."""
+
+        full = ProcessorFactory.create().process(SPEC_PATH)
+        capped = ProcessorFactory.create(issue_cap=1).process(SPEC_PATH)
+
+        self.assertEqual([report.points for report in full], [report.points for report in capped])
+        self.assertEqual([report.severity_counts for report in full], [report.severity_counts for report in capped])
+        self.assertLess(sum(len(report.issues) for report in capped), sum(len(report.issues) for report in full))
+
+        # rules without issues don't show up, every rule keeps at most one issue
+        for report in capped:
+            self.assertTrue(all(aggregate.count > 0 and aggregate.kept <= 1 for aggregate in report.aggregates))
+
+
+    def test_memory_is_bounded_by_cap(self):
+        """Test that subscorers hand issues over lazily, capped issues are dropped as they are counted."""
+
+        parsed_spec = ParsedSpecification()
+        parsed_spec.descriptions.missing_descriptions = [("paths", f"/pets{i % 10}", f"parameters{i}") for i in range(20000)]
+
+        tracemalloc.start()
+        try:
+            report, = DescriptionSubscorer(points=20).score_spec(parsed_spec, ScoringContext(issue_cap=5))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(report.aggregates[0].count, 20000)
+        self.assertEqual(len(report.issues), 5)
+        # 20000 issues held at once would take megabytes
+        self.assertLess(peak, 256 * 1024)
+
+
+    def test_empty_rule(self):
+        """Test that rule without issues costs no points."""
+
+        report = ScoringReport("Descriptions", 20, issue_cap=5)
+        report.bulk_add_issues(issues(0), IssueSeverity.HIGH, rule="missing_descriptions")
+
+        self.assertEqual(report.points, 20)
+        self.assertEqual(report.aggregates, [])
+
+
+    def test_histogram_is_bounded(self):
+        """Test that histogram keeps the largest buckets, the rest are summed up."""
+
+        report = ScoringReport("Descriptions", 20, issue_cap=1)
+        report.bulk_add_issues(
+            (Issue("Issue", IssueSeverity.LOW, f"paths -> /pets{i}") for i in range(Config.AGGREGATE_HISTOGRAM_MAX_BUCKETS + 10)),
+            IssueSeverity.LOW
+        )
+
+        histogram = report.aggregates[0].path_histogram
+        self.assertEqual(len(histogram), Config.AGGREGATE_HISTOGRAM_MAX_BUCKETS + 1)
+        self.assertEqual(histogram["other"], 10)
+
+
+    def test_report_output(self):
+        """Test that aggregates are in the report only in aggregation mode."""
+
+        generator = JsonReportGenerator()
+
+        full = generator.build_report_data(ProcessorFactory.create().process(SPEC_PATH))
+        capped = generator.build_report_data(ProcessorFactory.create(issue_cap=1).process(SPEC_PATH))
+
+        self.assertTrue(all("aggregates" not in report for report in full["reports"]))
+        self.assertTrue(any("aggregates" in report for report in capped["reports"]))
+        self.assertEqual(full["severity_counts"], capped["severity_counts"])
+        self.assertEqual(full["total_score"], capped["total_score"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import pickle
+import unittest
+
+from dataclasses import FrozenInstanceError
+
+from api_scoring_app.core.subscorers import Issue, IssueSeverity, IssueTemplate, top_level_path
+from api_scoring_app.infra.subscorers.subscorer_paths import OVERLAPPING_PATHS
+
+
+class TestIssueModel(unittest.TestCase):
+    """Test suite for slotted, templated issues."""
+
+    def test_templated_issue_renders_message(self):
+        """Test that templated issue renders the same message and suggestion as a plain one."""
+
+        template = IssueTemplate("Missing description at: {path}", IssueSeverity.LOW, "Add a meaningful description.")
+        issue = template.issue("paths -> /pets/{petId}")
+
+        self.assertEqual(issue.message, "Missing description at: paths -> /pets/{petId}")
+        self.assertEqual(issue.suggestion, "Add a meaningful description.")
+        self.assertEqual(issue.severity, IssueSeverity.LOW)
+        self.assertEqual(issue, Issue(
+            "Missing description at: paths -> /pets/{petId}", IssueSeverity.LOW, "paths -> /pets/{petId}", "Add a meaningful description."
+        ))
+
+        overlapping = OVERLAPPING_PATHS.issue(None, "/pets/{id}", "/pets/mine")
+        self.assertEqual(overlapping.message, "Overlapping paths: '/pets/{id}' and '/pets/mine'")
+        self.assertIsNone(overlapping.path)
+
+    def test_issue_is_immutable_and_slotted(self):
+        """Test that issues can't be changed and have no instance dict."""
+
+        issue = Issue("message", IssueSeverity.MEDIUM, "a -> b")
+
+        with self.assertRaises(FrozenInstanceError):
+            issue.path = "c"
+        self.assertFalse(hasattr(issue, "__dict__"))
+        self.assertIsInstance(issue._severity, int)
+
+    def test_issue_pickle_round_trip(self):
+        """Test that issues survive pickling (process pool, report cache), templates are pickled once."""
+
+        template = IssueTemplate("Security scheme '{0}' is defined, but not referenced", IssueSeverity.HIGH, "Reference it")
+        issues = [template.issue(f"components -> securitySchemes -> scheme{i}", f"scheme{i}") for i in range(10)]
+        issues.append(Issue("plain", IssueSeverity.ZERO, suggestion="suggestion"))
+
+        data = pickle.dumps(issues)
+        restored = pickle.loads(data)
+
+        self.assertEqual(restored, issues)
+        self.assertEqual(restored[3].message, "Security scheme 'scheme3' is defined, but not referenced")
+        self.assertEqual(data.count(b"is defined, but not referenced"), 1)
+
+    def test_lazy_path(self):
+        """Test that path segments are joined only when the path is read."""
+
+        segments = ["paths", "/pets/{petId}", "get", "description"]
+        issue = Issue(IssueTemplate("Missing description at: {path}", IssueSeverity.LOW), IssueSeverity.LOW, segments)
+
+        self.assertIs(issue._path, segments)
+        self.assertEqual(issue.path, "paths -> /pets/{petId} -> get -> description")
+        self.assertEqual(issue.message, "Missing description at: paths -> /pets/{petId} -> get -> description")
+        self.assertEqual(top_level_path(issue._path), top_level_path(issue.path))
+        self.assertEqual(pickle.loads(pickle.dumps(issue)), issue)
+
+    def test_rendered(self):
+        """Test that `rendered` gives the same message and path as the properties."""
+
+        segments = ["paths", "/pets", "get"]
+        templated = IssueTemplate("Missing description at: {path}", IssueSeverity.LOW).issue(segments)
+        plain = Issue("plain", IssueSeverity.ZERO)
+
+        self.assertEqual(templated.rendered(), (templated.message, templated.path))
+        self.assertEqual(templated.rendered(), ("Missing description at: paths -> /pets -> get", "paths -> /pets -> get"))
+        self.assertEqual(plain.rendered(), ("plain", None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import io
+import os
+import json
+import tempfile
+import unittest
+
+from unittest.mock import patch
+from click.testing import CliRunner
+
+from api_scoring_app.main import main
+from api_scoring_app.runner import JobRunner as job_runner
+from api_scoring_app.runner.JobRunner import JobRunner, ResultOrder, prepare_resume
+
+SPECS_DIR = os.path.join(os.path.dirname(__file__), "specs")
+KNOWN_ISSUES_SPEC = os.path.join(SPECS_DIR, "test_known_issues.yaml")
+SIMPLEST_SPEC = os.path.join(SPECS_DIR, "spec_simplest.yaml")
+
+_run_job = job_runner.run_job
+
+
+def _run_or_crash(job):
+    """
+    Worker task killing its worker process on `crash` jobs, like a segfault or OOM kill would.
+    """
+
+    if job.id == "crash":
+        os._exit(1)
+    return _run_job(job)
+
+
+class TestJobRunner(unittest.TestCase):
+    """Test suite for job file runner."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.report_path = os.path.join(self.tmp_dir.name, "reports", "known.json")
+
+        self.jobs = "\n".join([
+            json.dumps({"spec": KNOWN_ISSUES_SPEC, "id": "known", "output": self.report_path}),
+            "",
+            json.dumps({"spec": SIMPLEST_SPEC, "profile": "schema_only"}),
+            "not json",
+            json.dumps({"spec": SIMPLEST_SPEC, "profile": "missing"}),
+            json.dumps({"spec": "missing.yaml"}),
+        ]) + "\n"
+
+        self.profiles = {"schema_only": {"schema": 100}}
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+
+    def _run(self, **kwargs) -> list[dict]:
+        output = io.StringIO()
+        JobRunner(profiles=self.profiles, **kwargs).run(io.StringIO(self.jobs), output)
+        return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+    def test_jobs(self):
+        """Test that every job gets its result line, failing ones don't stop the run."""
+
+        results = self._run(concurrency=2)
+
+        self.assertEqual([result["line"] for result in results], [1, 3, 4, 5, 6])
+        self.assertEqual([result["status"] for result in results], ["ok", "ok", "error", "error", "error"])
+
+        # report written to output target
+        self.assertEqual(results[0]["id"], "known")
+        self.assertEqual(results[0]["output"], self.report_path)
+        with open(self.report_path) as file:
+            self.assertEqual(json.load(file)["total_score"], results[0]["total_score"])
+
+        # profile selects subscorers and points
+        self.assertEqual([report["subscorer"] for report in results[1]["report"]["reports"]], ["Schema & Types"])
+        self.assertEqual(results[1]["report"]["total_score"], 100)
+
+        self.assertIn("Invalid JSON", results[2]["error"])
+        self.assertIn("Unknown profile", results[3]["error"])
+        self.assertIn("File not found", results[4]["error"])
+
+
+    def test_completion_order(self):
+        """Test that completion order writes the same results, in any order."""
+
+        in_order = self._run(concurrency=1)
+        by_completion = self._run(concurrency=3, order=ResultOrder.COMPLETION)
+
+        key = lambda result: result["line"]
+        strip = lambda result: {k: v for k, v in result.items() if k != "elapsed"}
+        self.assertEqual(
+            [strip(result) for result in sorted(by_completion, key=key)],
+            [strip(result) for result in in_order]
+        )
+
+
+    def test_resume(self):
+        """Test that resumed run skips recorded jobs and reruns the one cut off mid-line."""
+
+        results_path = os.path.join(self.tmp_dir.name, "results.jsonl")
+        jobs_path = os.path.join(self.tmp_dir.name, "jobs.jsonl")
+        with open(jobs_path, "w") as file:
+            file.write(self.jobs)
+
+        results = self._run()
+        with open(results_path, "w") as file:
+            file.write(json.dumps(results[0]) + "\n" + json.dumps(results[1])[:20])
+
+        self.assertEqual(prepare_resume(results_path), {1})
+        with open(results_path) as file:
+            self.assertEqual(file.read(), json.dumps(results[0]) + "\n")
+
+        result = CliRunner().invoke(main, ["jobs", jobs_path, "-o", results_path, "--resume", "-c", "1"])
+        self.assertEqual(result.exit_code, 0, result.output)
+
+        with open(results_path) as file:
+            lines = [json.loads(line)["line"] for line in file]
+        self.assertEqual(lines, [1, 3, 4, 5, 6])
+
+
+    def test_crashing_worker(self):
+        """Test that worker dying on one job gives it an error line, and the run goes on."""
+
+        self.jobs = "\n".join([
+            json.dumps({"spec": KNOWN_ISSUES_SPEC}),
+            json.dumps({"spec": SIMPLEST_SPEC, "id": "crash"}),
+            json.dumps({"spec": SIMPLEST_SPEC}),
+            json.dumps({"spec": KNOWN_ISSUES_SPEC, "profile": "schema_only"}),
+        ]) + "\n"
+
+        with patch.object(job_runner, "run_job", _run_or_crash):
+            results = self._run(concurrency=2)
+
+        self.assertEqual([result["line"] for result in results], [1, 2, 3, 4])
+        self.assertEqual([result["status"] for result in results], ["ok", "error", "ok", "ok"])
+        self.assertIn("Worker failed", results[1]["error"])
+        self.assertEqual(results[1]["id"], "crash")
@@ -0,0 +1,179 @@
+import unittest
+import dataclasses
+
+from pydantic import BaseModel
+from openapi_pydantic import OpenAPI, Schema, Tag
+
+from api_scoring_app.core.types import PathNode, ROOT_PATH
+from api_scoring_app.infra.parser import Parser
+
+
+class TestParser(unittest.TestCase):
+    """Test suite for Parser."""
+
+    def setUp(self):
+        self.spec = OpenAPI.model_validate({
+            "openapi": "3.1.0",
+            "info": {"title": "parser", "version": "1.0.0"},
+            "tags": [{"name": "users", "description": "users of the system"}],
+            "security": [{"apiKey": []}],
+            "paths": {
+                "/users": {
+                    "get": {
+                        "tags": ["users"],
+                        "security": [{"oauth": ["read"]}],
+                        "responses": {"200": {"description": "ok", "content": {"application/json": {}}}}
+                    },
+                    "post": {"tags": ["accounts"]}
+                }
+            },
+            "components": {
+                "securitySchemes": {"apiKey": {"type": "apiKey", "name": "key", "in": "header"}},
+                "schemas": {"User": {"type": "object", "properties": {"name": {"type": "string"}}}}
+            }
+        })
+
+
+    def test_collects_sections(self):
+        """Test that every collector is fed from a single traversal."""
+
+        parsed = Parser().parse(self.spec)
+
+        self.assertEqual(sorted(parsed.paths.path_to_operations["/users"]), ["get", "post"])
+        self.assertEqual(parsed.misc.paths_defined, ["users"])
+        self.assertEqual([tag.name for tag in parsed.misc.tags_defined], ["users"])
+        self.assertEqual([tag.name for tag in parsed.misc.tags_from_operations], ["users", "accounts"])
+
+        self.assertEqual(parsed.response_codes.missing_responses, [["paths", "/users", "post"]])
+        self.assertEqual([path for path, _ in parsed.response_codes.responses], [["paths", "/users", "get", "responses", "200"]])
+        self.assertEqual(parsed.schemas.missing_schemas, [["paths", "/users", "get", "responses", "200", "content", "application/json"]])
+
+        self.assertEqual([scheme.name for scheme in parsed.security.referenced_schemes], ["apiKey"])
+        self.assertEqual([scheme.name for scheme in parsed.security.operation_referenced_schemes], ["oauth"])
+        self.assertEqual([scheme.name for scheme in parsed.security.defined_schemes], ["apiKey"])
+
+
+    def test_empty_paths(self):
+        """Test that empty paths object doesn't break the traversal."""
+
+        spec = OpenAPI.model_validate({"openapi": "3.1.0", "info": {"title": "empty", "version": "1.0.0"}, "paths": {}})
+
+        parsed = Parser().parse(spec)
+
+        self.assertEqual(parsed.misc.paths_defined, [])
+        self.assertEqual(parsed.paths.path_to_operations, {})
+
+
+    def test_deep_nesting(self):
+        """Test that traversal depth isn't bound by the recursion limit."""
+
+        depth = 10000
+
+        root = node = {}
+        for i in range(depth):
+            node["nested"] = {}
+            node = node["nested"]
+        node["tags"] = [Tag(name="deep")]
+
+        parsed = Parser().parse(root)
+
+        self.assertEqual(len(parsed.misc.tags_defined), 1)
+        self.assertEqual(len(parsed.misc.tags_defined[0].path), depth + 2)
+
+
+    def test_findings_share_path_prefix(self):
+        """Test that findings reference shared path nodes instead of copies."""
+
+        parsed = Parser().parse(self.spec)
+
+        response_path, _ = parsed.response_codes.responses[0]
+        media_type_path = parsed.schemas.missing_schemas[0]
+
+        self.assertIsInstance(media_type_path, PathNode)
+        self.assertIs(media_type_path.parent.parent, response_path)
+
+
+    def test_keeps_no_models(self):
+        """Test that parsed specification holds projections only, so the model can be released after parsing."""
+
+        parsed = Parser().parse(self.spec)
+
+        def models(value):
+            if isinstance(value, BaseModel):
+                yield value
+            elif isinstance(value, (list, tuple)):
+                for item in value:
+                    yield from models(item)
+            elif isinstance(value, dict):
+                for item in value.values():
+                    yield from models(item)
+            elif dataclasses.is_dataclass(value):
+                for value_field in dataclasses.fields(value):
+                    yield from models(getattr(value, value_field.name))
+
+        self.assertEqual(list(models(parsed)), [])
+
+        (_, response), = parsed.response_codes.responses
+        self.assertEqual(response.content_types, ("application/json",))
+        self.assertFalse(response.has_example)
+
+        (_, scheme), = parsed.security.schemes
+        self.assertEqual((scheme.type, scheme.name, scheme.security_scheme_in), ("apiKey", "key", "header"))
+
+
+    def test_selected_sections(self):
+        """Test that only selected sections are collected, and subtrees none of their collectors match in aren't walked."""
+
+        parser = Parser()
+        full = parser.parse(self.spec)
+        parsed = parser.parse(self.spec, sections=["security", "misc"])
+
+        self.assertEqual(parsed.security, full.security)
+        self.assertEqual(parsed.misc, full.misc)
+        self.assertEqual(parsed.schemas, type(parsed.schemas)())
+        self.assertEqual(parsed.paths, type(parsed.paths)())
+
+        # dispatch table gets an entry for every visited node type
+        visited = parser._get_dispatch(["security", "misc"]).type_handlers
+        self.assertFalse(any(issubclass(node_type, Schema) for node_type in visited))
+        self.assertTrue(any(issubclass(node_type, Schema) for node_type in parser._get_dispatch(None).type_handlers))
+
+
+    def test_unknown_section(self):
+        """Test that unknown section names are rejected."""
+
+        with self.assertRaises(ValueError):
+            Parser().parse(self.spec, sections=["security", "schema"])
+
+
+class TestPathNode(unittest.TestCase):
+    """Test suite for PathNode."""
+
+    def test_sequence_behaviour(self):
+        path = PathNode.from_keys(["paths", "/users", "get"])
+
+        self.assertEqual(len(path), 3)
+        self.assertEqual(path[0], "paths")
+        self.assertEqual(path[-1], "get")
+        self.assertEqual(path[-2], "/users")
+        self.assertEqual(path[1:], ("/users", "get"))
+        self.assertEqual(list(path), ["paths", "/users", "get"])
+        self.assertEqual(" -> ".join(path), "paths -> /users -> get")
+        self.assertEqual(str(path), "paths -> /users -> get")
+
+        with self.assertRaises(IndexError):
+            path[3]
+
+    def test_extend(self):
+        path = PathNode.from_keys(["components", "securitySchemes", "oauth"])
+
+        extended = path + ["flows", "implicit"]
+
+        self.assertEqual(extended, ["components", "securitySchemes", "oauth", "flows", "implicit"])
+        self.assertIs(extended.parent.parent, path)
+        self.assertEqual(path.child("flows"), PathNode.from_keys(["components", "securitySchemes", "oauth", "flows"]))
+
+    def test_root(self):
+        self.assertEqual(len(ROOT_PATH), 0)
+        self.assertEqual(list(ROOT_PATH), [])
+        self.assertEqual(ROOT_PATH, [])
@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from api_scoring_app.infra.subscorers import PathsSubscorer
@@ -163,3 +164,68 @@ class TestPathsSubscorer(unittest.TestCase):
         self.assertEqual(crud_count, 2)
 
         self.assertEqual(len(report.issues), overlapping_count + naming_count + crud_count)
+
+
+    def test_overlapping_paths_match_pairwise_check(self):
+        """Test that trie-based detection finds the same pairs, in the same order, as pairwise check."""
+
+        rnd = random.Random(0)
+        segments = ["a", "b", "c", "{x}", "{y}", "v{z}"]
+
+        path_names = list(dict.fromkeys(
+            "/" + "/".join(rnd.choice(segments) for _ in range(rnd.randint(1, 4))) + rnd.choice(["", "/"])
+            for _ in range(300)
+        ))
+
+        expected = [
+            (path1, path2)
+            for i, path1 in enumerate(path_names)
+            for path2 in path_names[i+1:]
+            if self.subscorer._are_overlapping(path1, path2)
+        ]
+
+        self.assertTrue(expected)
+        self.assertEqual(self.subscorer._find_overlapping_paths(path_names), expected)
+
+
+    def test_inconsistent_naming_per_path(self):
+        """Test that inconsistent naming is reported once per offending path, against the majority convention."""
+
+        parsed_spec = ParsedSpecification()
+        parsed_spec.paths = ParsedPaths(
+            path_to_operations={
+                "/userAccounts": ["get"],
+                "/userAccounts/{accountId}/paymentMethods": ["get"],
+                "/orderItems": ["get"],
+                "/order_history": ["get"],
+                "/shipping-address/{id}": ["get"],
+                "/items": ["get"]
+            }
+        )
+
+        reports = self.subscorer.score_spec(parsed_spec)
+        naming_issues = [issue for issue in reports[0].issues if "inconsistent" in issue.message.lower()]
+
+        self.assertEqual([issue.path for issue in naming_issues], ["paths -> /order_history", "paths -> /shipping-address/{id}"])
+
+        for issue in naming_issues:
+            self.assertIn("camelCase", issue.suggestion)
+            self.assertIn("/userAccounts", issue.message)
+
+
+    def test_mixed_naming_in_single_path(self):
+        """Test that path mixing conventions is inconsistent by itself."""
+
+        parsed_spec = ParsedSpecification()
+        parsed_spec.paths = ParsedPaths(
+            path_to_operations={
+                "/user-accounts/{id}/payment_methods": ["get"]
+            }
+        )
+
+        reports = self.subscorer.score_spec(parsed_spec)
+        naming_issues = [issue for issue in reports[0].issues if "inconsistent" in issue.message.lower()]
+
+        self.assertEqual(len(naming_issues), 1)
+        self.assertIn("'kebab-case', 'snake_case'", naming_issues[0].message)
+
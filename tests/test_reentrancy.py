@@ -0,0 +1,75 @@
+import os
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from api_scoring_app.runner.ApiSpecProcessor import APISpecificationProcessor
+from api_scoring_app.infra.subscorers import (
+    SchemaSubscorer,
+    DescriptionSubscorer,
+    PathsSubscorer,
+    ResponseCodesSubscorer,
+    ExamplesSubscorer,
+    SecuritySubscorer,
+    MiscSubscorer
+)
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def create_processor() -> APISpecificationProcessor:
+    processor = APISpecificationProcessor()
+
+    processor.scoring_engine.add_subscorer(SchemaSubscorer(points=20))
+    processor.scoring_engine.add_subscorer(DescriptionSubscorer(points=20))
+    processor.scoring_engine.add_subscorer(PathsSubscorer(points=15))
+    processor.scoring_engine.add_subscorer(ResponseCodesSubscorer(points=15))
+    processor.scoring_engine.add_subscorer(ExamplesSubscorer(points=10))
+    processor.scoring_engine.add_subscorer(SecuritySubscorer(points=10))
+    processor.scoring_engine.add_subscorer(MiscSubscorer(points=10))
+
+    return processor
+
+
+def summarize(reports) -> list:
+    return [
+        (report.subscorer, report.points, [(issue.message, issue.severity, issue.path) for issue in report.issues])
+        for report in reports
+    ]
+
+
+class TestReentrancy(unittest.TestCase):
+    """One processor should score any number of specs, sequentially or from multiple threads."""
+
+    def setUp(self):
+        self.spec_paths = [
+            os.path.join(ROOT_DIR, "tests/specs/test_known_issues.yaml"),
+            os.path.join(ROOT_DIR, "public_sample.yaml"),
+            os.path.join(ROOT_DIR, "sample_spec.yaml"),
+        ]
+
+        # reference results, fresh processor per spec
+        self.expected = {path: summarize(create_processor().process(path)) for path in self.spec_paths}
+
+
+    def test_back_to_back(self):
+        """Test scoring different specs with the same processor, one after another."""
+
+        processor = create_processor()
+
+        for _ in range(2):
+            for path in self.spec_paths:
+                self.assertEqual(summarize(processor.process(path)), self.expected[path])
+
+
+    def test_concurrent(self):
+        """Test scoring different specs with the same processor from a thread pool."""
+
+        processor = create_processor()
+        paths = self.spec_paths * 4
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda path: summarize(processor.process(path)), paths))
+
+        for path, result in zip(paths, results):
+            self.assertEqual(result, self.expected[path])
@@ -0,0 +1,179 @@
+import os
+import json
+import tempfile
+import unittest
+
+from api_scoring_app.infra.validators import RefResolver, RefResolutionError, PydanticValidator
+
+
+class TestRefResolver(unittest.TestCase):
+    """Test suite for RefResolver."""
+
+    def test_shared_by_identity(self):
+        spec = {
+            "paths": {
+                "/a": {"schema": {"$ref": "#/components/schemas/Pet"}},
+                "/b": {"schema": {"$ref": "#/components/schemas/Pet"}},
+            },
+            "components": {"schemas": {"Pet": {"type": "object", "properties": {"id": {"type": "integer"}}}}}
+        }
+
+        resolved = RefResolver().resolve(spec)
+
+        pet = resolved["components"]["schemas"]["Pet"]
+        self.assertIs(resolved["paths"]["/a"]["schema"], pet)
+        self.assertIs(resolved["paths"]["/b"]["schema"], pet)
+
+    def test_reference_chain(self):
+        spec = {
+            "a": {"$ref": "#/b"},
+            "b": {"$ref": "#/c"},
+            "c": {"value": 1},
+        }
+
+        resolved = RefResolver().resolve(spec)
+
+        self.assertIs(resolved["a"], resolved["c"])
+        self.assertIs(resolved["b"], resolved["c"])
+
+    def test_escaped_pointer(self):
+        spec = {
+            "paths": {"/users/{id}": {"get": {"summary": "get"}}},
+            "ref": {"$ref": "#/paths/~1users~1{id}/get"},
+        }
+
+        resolved = RefResolver().resolve(spec)
+
+        self.assertEqual(resolved["ref"], {"summary": "get"})
+
+    def test_recursive_schema(self):
+        spec = {
+            "paths": {"/tree": {"schema": {"$ref": "#/components/schemas/Node"}}},
+            "components": {"schemas": {"Node": {
+                "type": "object",
+                "properties": {"children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}}}
+            }}}
+        }
+
+        resolved = RefResolver().resolve(spec)
+
+        node = resolved["components"]["schemas"]["Node"]
+        self.assertIs(resolved["paths"]["/tree"]["schema"], node)
+
+        # cycle is closed with plain reference
+        self.assertEqual(node["properties"]["children"]["items"], {"$ref": "#/components/schemas/Node"})
+
+        # resolved object is acyclic
+        json.dumps(resolved)
+
+    def test_reference_into_recursive_schema(self):
+        def sections():
+            return {
+                "paths": {"/children": {"schema": {"$ref": "#/components/schemas/Node/properties/children"}}},
+                "components": {"schemas": {"Node": {
+                    "type": "object",
+                    "properties": {"children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}}}
+                }}}
+            }
+
+        # with `paths` first, the cycle is entered through `children`, the search closes it by containment
+        for order in (["paths", "components"], ["components", "paths"]):
+            spec = {name: sections()[name] for name in order}
+
+            resolved = RefResolver().resolve(spec)
+
+            node = resolved["components"]["schemas"]["Node"]
+            self.assertIs(resolved["paths"]["/children"]["schema"], node["properties"]["children"])
+            self.assertEqual(node["properties"]["children"]["items"], {"$ref": "#/components/schemas/Node"})
+            json.dumps(resolved)
+
+    def test_long_reference_chain_does_not_recurse(self):
+        depth = 5000
+
+        schemas = {f"S{i}": {"type": "object", "properties": {"next": {"$ref": f"#/components/schemas/S{i + 1}"}}} for i in range(depth)}
+        schemas[f"S{depth}"] = {"type": "string"}
+        spec = {"root": {"$ref": "#/components/schemas/S0"}, "components": {"schemas": schemas}}
+
+        resolved = RefResolver().resolve(spec)
+
+        self.assertIs(resolved["root"], schemas["S0"])
+        self.assertIs(schemas[f"S{depth - 1}"]["properties"]["next"], schemas[f"S{depth}"])
+
+    def test_circular_reference_chain(self):
+        spec = {"a": {"$ref": "#/b"}, "b": {"$ref": "#/a"}}
+
+        with self.assertRaises(RefResolutionError):
+            RefResolver().resolve(spec)
+
+    def test_unresolvable_reference(self):
+        spec = {"a": {"$ref": "#/missing"}}
+
+        with self.assertRaises(RefResolutionError) as context:
+            RefResolver().resolve(spec)
+
+        self.assertIn("#/missing", str(context.exception))
+
+    def test_local_file_references(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.makedirs(os.path.join(tmp_dir, "schemas"))
+
+            with open(os.path.join(tmp_dir, "schemas", "common.json"), "w") as file:
+                json.dump({
+                    "Pet": {"type": "object", "properties": {"owner": {"$ref": "#/Owner"}}},
+                    "Owner": {"type": "object", "properties": {"name": {"type": "string"}}},
+                }, file)
+
+            spec = {
+                "a": {"$ref": "schemas/common.json#/Pet"},
+                "b": {"$ref": "./schemas/common.json#/Pet"},
+                "c": {"$ref": "schemas/common.json#/Owner"},
+            }
+
+            resolver = RefResolver(base_path=os.path.join(tmp_dir, "spec.yaml"))
+            resolved = resolver.resolve(spec)
+
+            # same file is loaded once, its objects are shared
+            self.assertIs(resolved["a"], resolved["b"])
+            self.assertIs(resolved["a"]["properties"]["owner"], resolved["c"])
+            self.assertEqual(len(resolver._documents), 2)
+
+    def test_file_references_can_be_disallowed(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, "secret.json"), "w") as file:
+                json.dump({"Pet": {"type": "object"}}, file)
+
+            for ref in (os.path.join(tmp_dir, "secret.json") + "#/Pet", os.path.join(tmp_dir, "missing.json") + "#/Pet", "secret.json"):
+                with self.subTest(ref=ref):
+                    resolver = RefResolver(base_path=os.path.join(tmp_dir, "spec.yaml"), allow_files=False)
+
+                    # same error whether the file exists or not
+                    with self.assertRaisesRegex(RefResolutionError, "^Only references within the document are allowed"):
+                        resolver.resolve({"a": {"$ref": ref}, "b": {"value": 1}})
+                    self.assertEqual(resolver.external_documents, [])
+
+        resolved = RefResolver(allow_files=False).resolve({"a": {"$ref": "#/b"}, "b": {"value": 1}})
+        self.assertIs(resolved["a"], resolved["b"])
+
+    def test_remote_references_are_rejected(self):
+        spec = {"a": {"$ref": "https://example.com/spec.yaml#/Pet"}}
+
+        with self.assertRaises(RefResolutionError):
+            RefResolver().resolve(spec)
+
+    def test_validate_recursive_spec(self):
+        spec = {
+            "openapi": "3.1.0",
+            "info": {"title": "recursive", "version": "1.0.0"},
+            "paths": {"/tree": {"get": {"responses": {"200": {
+                "description": "tree",
+                "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Node"}}}
+            }}}}},
+            "components": {"schemas": {"Node": {
+                "type": "object",
+                "properties": {"children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}}}
+            }}}
+        }
+
+        result = PydanticValidator().validate(spec)
+
+        self.assertTrue(result.is_valid(), result.errors)
@@ -0,0 +1,73 @@
+import unittest
+
+from benchmarks.regression import Tolerances, compare, format_table
+
+
+def results(calibration: float = 0.01, **stages: tuple[float, int]) -> dict:
+    return {
+        "meta": {},
+        "tiers": {"small": {
+            "calibration": calibration,
+            "stages": {name: {"wall": wall, "cpu": wall, "peak_memory": peak} for name, (wall, peak) in stages.items()},
+        }},
+    }
+
+
+def regressed(comparisons) -> set[tuple[str, str]]:
+    return {(comparison.stage, comparison.metric) for comparison in comparisons if comparison.regressed}
+
+
+class TestRegressionGate(unittest.TestCase):
+    """Test suite for benchmark regression gate."""
+
+    def test_regressions(self):
+        """Test that growth beyond tolerance is a regression, growth within it isn't."""
+
+        baseline = results(parse=(0.100, 10_000_000), validate=(0.100, 10_000_000))
+        current = results(parse=(0.140, 10_500_000), validate=(0.110, 12_000_000))
+
+        comparisons = compare(baseline, current, Tolerances())
+
+        self.assertEqual(regressed(comparisons), {("parse", "wall"), ("validate", "peak_memory")})
+
+        table = format_table(comparisons, only_changes=True)
+        self.assertIn("parse", table)
+        self.assertIn("REGRESSED", table)
+        self.assertNotIn("\nsmall    validate                                             wall", table)
+
+
+    def test_stage_tolerances_and_floors(self):
+        """Test that per-stage patterns override the default, and tiny absolute changes are ignored."""
+
+        baseline = results(**{"score/subscorer:Security": (0.020, 0), "report": (0.0001, 0)})
+        current = results(**{"score/subscorer:Security": (0.028, 0), "report": (0.0003, 0)})
+
+        self.assertEqual(regressed(compare(baseline, current, Tolerances())), {("score/subscorer:Security", "wall")})
+
+        tolerances = Tolerances.from_dict({"stages": {"score/subscorer:*": {"wall": 0.5}}})
+        self.assertEqual(regressed(compare(baseline, current, tolerances)), set())
+
+
+    def test_normalized_by_calibration(self):
+        """Test that a machine that is slower as a whole doesn't fail the gate."""
+
+        baseline = results(calibration=0.010, parse=(0.100, 0))
+        current = results(calibration=0.015, parse=(0.150, 0))
+
+        self.assertEqual(regressed(compare(baseline, current, Tolerances())), set())
+        self.assertEqual(regressed(compare(baseline, current, Tolerances(), normalize=False)), {("parse", "wall")})
+
+
+    def test_missing_and_new_stages(self):
+        """Test that stages present on one side only are listed but are not regressions."""
+
+        comparisons = compare(results(old=(0.1, 0)), results(new=(0.1, 0)), Tolerances())
+
+        self.assertEqual(regressed(comparisons), set())
+        table = format_table(comparisons)
+        self.assertIn("missing", table)
+        self.assertIn("new", table)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import io
+import json
+import unittest
+
+from api_scoring_app.core.instrumentation import StageTiming
+from api_scoring_app.core.subscorers import ScoringReport, Issue, IssueSeverity, IssueTemplate
+from api_scoring_app.infra.utils.reports import JsonReportGenerator, NdjsonReportGenerator, ReportUtils
+
+
+def sample_reports() -> list[ScoringReport]:
+    with_issues = ScoringReport("Descriptions & Documentation", 20)
+    with_issues.add_issue(Issue("Missing description at: paths -> /pets", IssueSeverity.LOW, "paths -> /pets", "Add a meaningful description."))
+    with_issues.add_issue(Issue("Description \"too\" short: café \U0001F600", IssueSeverity.HIGH))
+
+    return [ScoringReport("Schema & Types", 20), with_issues]
+
+
+class TestReports(unittest.TestCase):
+    """Test suite for streamed report writers."""
+
+    def test_streamed_json_matches_dumps(self):
+        """Test that streamed pretty and compact JSON are the same as dumps of the whole report data."""
+
+        reports = sample_reports()
+        data = JsonReportGenerator().build_report_data(reports)
+
+        for indent, separators in [(2, None), (4, None), (None, (",", ":"))]:
+            output = io.StringIO()
+            JsonReportGenerator(indent=indent).write_report(reports, output)
+            self.assertEqual(output.getvalue(), json.dumps(data, indent=indent, separators=separators) + "\n")
+
+        self.assertEqual(JsonReportGenerator().generate_report([]), json.dumps(JsonReportGenerator().build_report_data([]), indent=2))
+
+
+    def test_timings_section(self):
+        """Test that stage timings are written after the reports."""
+
+        timings = [StageTiming("parse", 0.2, 0.2, start=2.0), StageTiming("load", 0.1, 0.1, start=1.0)]
+
+        report = json.loads(JsonReportGenerator(indent=None).generate_report(sample_reports(), timings=timings))
+
+        self.assertEqual(list(report)[-1], "timings")
+        self.assertEqual([timing["stage"] for timing in report["timings"]], ["load", "parse"])
+
+
+    def test_ndjson(self):
+        """Test that NDJSON has summary line, then every report followed by its issues."""
+
+        reports = sample_reports()
+        lines = [json.loads(line) for line in NdjsonReportGenerator().generate_report(reports).splitlines()]
+
+        self.assertEqual([line["type"] for line in lines], ["summary", "report", "report", "issue", "issue"])
+        self.assertEqual(lines[0]["total_score"], ReportUtils.get_total_score(reports))
+        self.assertEqual(lines[2]["issue_count"], 2)
+        self.assertEqual(lines[4]["subscorer"], "Descriptions & Documentation")
+        self.assertEqual(lines[4]["path"], "N/A")
+
+
+    def test_summary(self):
+        """Test that one-pass summary agrees with separate report utils."""
+
+        reports = sample_reports()
+        summary = ReportUtils.get_summary(reports)
+
+        self.assertEqual(summary["total_score"], ReportUtils.get_total_score(reports))
+        self.assertEqual(summary["max_total_Score"], ReportUtils.get_max_possible_score(reports))
+        self.assertEqual(summary["overall_grade"], ReportUtils.get_overall_grade(reports))
+        self.assertEqual(summary["severity_counts"], ReportUtils.get_severity_counts(reports))
+
+
+    def test_summary_only(self):
+        """Test that summary-only reports leave issues out and never render them."""
+
+        reports = sample_reports()
+        # template that fails to render, so rendering any issue would fail the report
+        reports[1].bulk_add_issues([IssueTemplate("{missing}", IssueSeverity.LOW).issue(["paths", "/pets"])], IssueSeverity.LOW)
+
+        for generator in (JsonReportGenerator(summary_only=True), JsonReportGenerator(indent=None, summary_only=True)):
+            output = io.StringIO()
+            generator.write_report(reports, output)
+            data = json.loads(output.getvalue())
+
+            self.assertEqual(data, generator.build_report_data(reports))
+            self.assertEqual(data["severity_counts"]["LOW"], 2)
+            self.assertEqual(list(data["reports"][1]), ["subscorer", "score", "max_score"])
+
+        lines = [json.loads(line) for line in NdjsonReportGenerator(summary_only=True).generate_report(reports).splitlines()]
+        self.assertEqual([line["type"] for line in lines], ["summary", "report", "report"])
+        self.assertEqual(lines[2]["issue_count"], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+import os
+import time
+import unittest
+
+from dataclasses import dataclass
+
+from api_scoring_app.core import BaseScorer
+from api_scoring_app.core.types import ExecutionMode
+from api_scoring_app.core.parser import ParsedSpecification
+from api_scoring_app.core.subscorers import ScoringReport, ScoringContext, DEFAULT_CONTEXT
+from api_scoring_app.infra.engine import ScoringEngine
+from api_scoring_app.infra.parser import Parser
+from api_scoring_app.infra.utils import LocalSpecLoader
+from api_scoring_app.infra.validators import PydanticValidator
+from api_scoring_app.infra.subscorers import (
+    SchemaSubscorer,
+    DescriptionSubscorer,
+    PathsSubscorer,
+    ResponseCodesSubscorer,
+    ExamplesSubscorer,
+    SecuritySubscorer,
+    MiscSubscorer
+)
+
+
+@dataclass
+class FailingSubscorer(BaseScorer):
+    points: float
+
+    def score_spec(self, parsed_specification: ParsedSpecification, context: ScoringContext = DEFAULT_CONTEXT) -> list[ScoringReport]:
+        raise RuntimeError("boom")
+
+
+@dataclass
+class SlowSubscorer(BaseScorer):
+    points: float
+    delay: float
+
+    def score_spec(self, parsed_specification: ParsedSpecification, context: ScoringContext = DEFAULT_CONTEXT) -> list[ScoringReport]:
+        time.sleep(self.delay)
+        return [ScoringReport("Slow", self.points)]
+
+
+@dataclass
+class CrashingSubscorer(BaseScorer):
+    points: float
+
+    def score_spec(self, parsed_specification: ParsedSpecification, context: ScoringContext = DEFAULT_CONTEXT) -> list[ScoringReport]:
+        # worker process dies, e.g. killed by OOM
+        os._exit(1)
+
+
+def summarize(reports) -> list:
+    return [
+        (report.subscorer, report.points, report.error, [(issue.message, issue.severity, issue.path) for issue in report.issues])
+        for report in reports
+    ]
+
+
+class TestScoringEngine(unittest.TestCase):
+    """Test suite for ScoringEngine execution modes."""
+
+    def setUp(self):
+        spec_path = os.path.join(os.path.dirname(__file__), "specs/test_known_issues.yaml")
+        self.validation_result = PydanticValidator().validate(LocalSpecLoader(spec_path).load(), source=spec_path)
+        self.parsed_spec = Parser().parse(self.validation_result.specification)
+
+        self.subscorers = [
+            SchemaSubscorer(points=20),
+            DescriptionSubscorer(points=20),
+            PathsSubscorer(points=15),
+            ResponseCodesSubscorer(points=15),
+            ExamplesSubscorer(points=10),
+            SecuritySubscorer(points=10),
+            MiscSubscorer(points=10)
+        ]
+
+        self.expected = summarize(ScoringEngine(subscorers=self.subscorers).score_spec(self.parsed_spec))
+
+
+    def test_pool_modes_match_sequential(self):
+        """Test that thread and process pools produce the same reports, in the same order."""
+
+        for mode in (ExecutionMode.THREAD, ExecutionMode.PROCESS):
+            with self.subTest(mode=mode):
+                engine = ScoringEngine(subscorers=self.subscorers, execution_mode=mode)
+                self.assertEqual(summarize(engine.score_spec(self.parsed_spec)), self.expected)
+
+
+    def test_failing_subscorer_is_isolated(self):
+        """Test that exception in one subscorer results in zero-score report for it only."""
+
+        for mode in (ExecutionMode.SEQUENTIAL, ExecutionMode.THREAD):
+            with self.subTest(mode=mode):
+                engine = ScoringEngine(subscorers=[FailingSubscorer(points=5)] + self.subscorers, execution_mode=mode)
+
+                reports = engine.score_spec(self.parsed_spec)
+
+                self.assertEqual(reports[0].subscorer, "FailingSubscorer")
+                self.assertEqual(reports[0].points, 0)
+                self.assertEqual(reports[0].max_points, 5)
+                self.assertIn("boom", reports[0].error)
+                self.assertEqual(summarize(reports[1:]), self.expected)
+
+
+    def test_subscorer_timeout(self):
+        """Test that slow subscorer doesn't hold back the others."""
+
+        engine = ScoringEngine(
+            subscorers=[SlowSubscorer(points=5, delay=2)] + self.subscorers,
+            execution_mode=ExecutionMode.THREAD,
+            subscorer_timeout=0.5
+        )
+
+        start = time.monotonic()
+        reports = engine.score_spec(self.parsed_spec)
+
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertIn("timed out", reports[0].error)
+        self.assertEqual(reports[0].points, 0)
+        self.assertEqual(summarize(reports[1:]), self.expected)
+
+
+    def test_required_sections(self):
+        """Test that engine needs the sections of its subscorers, or all of them for an undeclared one."""
+
+        engine = ScoringEngine(subscorers=[SecuritySubscorer(points=10), MiscSubscorer(points=10)])
+        self.assertEqual(engine.required_sections(), {"security", "misc"})
+
+        engine.add_subscorer(FailingSubscorer(points=5))
+        self.assertIsNone(engine.required_sections())
+
+        # every subscorer declares its section, so all of them are collected
+        engine = ScoringEngine(subscorers=self.subscorers)
+        parsed_spec = Parser().parse(self.validation_result.specification, sections=engine.required_sections())
+        self.assertEqual(summarize(engine.score_spec(parsed_spec)), self.expected)
+
+
+    def test_issue_cap_leaves_subscorers_untouched(self):
+        """Test that engines sharing subscorer instances keep their own issue caps."""
+
+        capped = ScoringEngine(subscorers=self.subscorers, issue_cap=1)
+        uncapped = ScoringEngine(subscorers=self.subscorers)
+
+        capped_reports = capped.score_spec(self.parsed_spec)
+        self.assertEqual(summarize(uncapped.score_spec(self.parsed_spec)), self.expected)
+
+        self.assertTrue(all(report.issue_cap == 1 for report in capped_reports))
+        self.assertFalse(any(hasattr(subscorer, "issue_cap") for subscorer in self.subscorers))
+
+
+    def test_pool_is_kept_between_runs(self):
+        """Test that pool is created once per engine and released by `close`."""
+
+        with ScoringEngine(subscorers=self.subscorers, execution_mode=ExecutionMode.THREAD) as engine:
+            engine.score_spec(self.parsed_spec)
+            executor = engine._executor
+
+            self.assertEqual(summarize(engine.score_spec(self.parsed_spec)), self.expected)
+            self.assertIs(engine._executor, executor)
+
+        self.assertIsNone(engine._executor)
+
+
+    def test_broken_pool_is_replaced(self):
+        """Test that pool broken by a crashed worker is shut down and the next run gets a fresh one."""
+
+        with ScoringEngine(subscorers=[CrashingSubscorer(points=10), *self.subscorers], execution_mode=ExecutionMode.PROCESS) as engine:
+            reports = engine.score_spec(self.parsed_spec)
+            self.assertIn("BrokenProcessPool", reports[0].error)
+            self.assertIsNone(engine._executor)
+
+            engine.subscorers.pop(0)
+            self.assertEqual(summarize(engine.score_spec(self.parsed_spec)), self.expected)
@@ -0,0 +1,165 @@
+import os
+import gzip
+import json
+import time
+import tempfile
+import threading
+import unittest
+
+from unittest.mock import patch
+
+from api_scoring_app.client import ScoringClient
+from api_scoring_app.infra.utils.reports import JsonReportGenerator
+from api_scoring_app.runner import ScoringServer as scoring_server
+from api_scoring_app.runner.ProcessorFactory import ProcessorFactory
+from api_scoring_app.runner.ScoringServer import ScoringServer
+
+SPECS_DIR = os.path.join(os.path.dirname(__file__), "specs")
+
+
+def _slow_score_bytes(data: bytes, compressed: bool = False):
+    time.sleep(1)
+    return 200, {}
+
+
+_score_bytes = scoring_server.score_bytes
+
+
+def _score_or_crash(data: bytes, compressed: bool = False):
+    if data == b"crash":
+        # worker process dies, e.g. killed by OOM
+        os._exit(1)
+    return _score_bytes(data, compressed)
+
+
+class TestScoringServer(unittest.TestCase):
+    """Test suite for scoring server and its client."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.server = ScoringServer(socket_path=os.path.join(cls.tmp_dir.name, "scoring.sock"), workers=1, max_queue=0)
+        cls.server.start()
+
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+        cls.client = ScoringClient(cls.server.address)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.thread.join()
+        cls.server.close()
+        cls.tmp_dir.cleanup()
+
+
+    def test_same_report_as_cli(self):
+        """Test that server responds with the same report as local scoring, for plain and gzipped bodies."""
+
+        spec_path = os.path.join(SPECS_DIR, "test_known_issues.yaml")
+        expected = JsonReportGenerator().build_report_data(ProcessorFactory.create().process(spec_path))
+
+        with open(spec_path, "rb") as file:
+            data = file.read()
+
+        self.assertEqual(self.client.score(data), (200, expected))
+        self.assertEqual(self.client.score(gzip.compress(data), compressed=True), (200, expected))
+
+
+    def test_errors(self):
+        """Test that invalid specs and unknown routes get error responses, server keeps serving."""
+
+        status, payload = self.client.score(b"openapi: 3.1.0\n")
+        self.assertEqual(status, 422)
+        self.assertIn("Validation Errors", payload["error"])
+
+        status, payload = self.client.score(b"[not, an, object]")
+        self.assertEqual(status, 422)
+
+        status, _ = self.client._request("GET", "/missing")
+        self.assertEqual(status, 404)
+
+        self.assertEqual(self.client.health()["status"], "ok")
+
+
+    def test_busy(self):
+        """Test that requests above workers + max_queue are rejected right away."""
+
+        self.server.in_flight = self.server.workers
+        try:
+            status, payload = self.client.score(b"openapi: 3.1.0\n")
+        finally:
+            self.server.in_flight = 0
+
+        self.assertEqual(status, 503)
+
+
+    def test_file_references_are_rejected(self):
+        """Test that posted spec can't reference server's files, nor tell whether they exist."""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            secret_path = os.path.join(tmp_dir, "secret.yaml")
+            with open(secret_path, "w") as file:
+                file.write("Ok: {description: secret}\n")
+
+            for ref in (secret_path + "#/Ok", os.path.join(tmp_dir, "missing.json") + "#/Ok"):
+                with self.subTest(ref=ref):
+                    spec = {
+                        "openapi": "3.1.0",
+                        "info": {"title": "refs", "version": "1.0.0"},
+                        "paths": {"/pets": {"get": {"responses": {"200": {"$ref": ref}}}}}
+                    }
+
+                    status, payload = self.client.score(json.dumps(spec).encode())
+
+                    self.assertEqual(status, 422)
+                    self.assertIn("Only references within the document are allowed", payload["error"])
+                    self.assertNotIn("secret", payload["error"].replace(secret_path, ""))
+                    self.assertNotIn("not found", payload["error"])
+
+
+    def test_timed_out_request_holds_its_slot(self):
+        """Test that timed-out request counts as in flight until its job actually finishes."""
+
+        server = ScoringServer(socket_path=os.path.join(self.tmp_dir.name, "slow.sock"), workers=1, max_queue=0, request_timeout=0.2)
+        server.start()
+        try:
+            with patch.object(scoring_server, "score_bytes", _slow_score_bytes):
+                status, _ = server.score(b"{}")
+                self.assertEqual(status, 504)
+
+                # worker is still busy, so is the only slot
+                self.assertEqual(server.in_flight, 1)
+                self.assertEqual(server.score(b"{}")[0], 503)
+
+                deadline = time.monotonic() + 5
+                while server.in_flight and time.monotonic() < deadline:
+                    time.sleep(0.05)
+                self.assertEqual(server.in_flight, 0)
+        finally:
+            server.close()
+
+
+    def test_crashed_worker_pool_is_replaced(self):
+        """Test that a crashed worker fails its request only, and `close` leaves no worker behind."""
+
+        server = ScoringServer(socket_path=os.path.join(self.tmp_dir.name, "crash.sock"), workers=1, max_queue=0)
+        server.start()
+        try:
+            broken = server._executor
+            with patch.object(scoring_server, "score_bytes", _score_or_crash):
+                status, payload = server.score(b"crash")
+                self.assertEqual(status, 500)
+                self.assertIn("Worker failed", payload["error"])
+                self.assertIsNot(server._executor, broken)
+
+                with open(os.path.join(SPECS_DIR, "test_known_issues.yaml"), "rb") as file:
+                    self.assertEqual(server.score(file.read())[0], 200)
+
+            workers = list(server._executor._processes.values())
+        finally:
+            server.close()
+
+        self.assertFalse(any(worker.is_alive() for worker in workers))
+        self.assertEqual(server.in_flight, 0)
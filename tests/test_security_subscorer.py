@@ -4,7 +4,7 @@ from api_scoring_app.infra.subscorers import SecuritySubscorer
 from api_scoring_app.core.subscorers import IssueSeverity
 from api_scoring_app.core.parser import ParsedSpecification, ParsedSecurity
 from api_scoring_app.core import Config
-from api_scoring_app.core.parser import WrappedSecurityRequirement
+from api_scoring_app.core.parser import WrappedSecurityRequirement, SecuritySchemeProjection
 from openapi_pydantic import SecurityScheme, OAuthFlows, OAuthFlow
 
 class TestSecuritySubscorer(unittest.TestCase):
@@ -34,7 +34,7 @@ class TestSecuritySubscorer(unittest.TestCase):
             referenced_schemes=[basic_req],
             operation_referenced_schemes=[],
             schemes=[
-                (path, scheme)
+                (path, SecuritySchemeProjection.from_model(scheme))
             ]
         )
 
@@ -97,7 +97,7 @@ class TestSecuritySubscorer(unittest.TestCase):
             referenced_schemes=[oauth2_req],
             operation_referenced_schemes=[],
             schemes=[
-                (path, scheme)
+                (path, SecuritySchemeProjection.from_model(scheme))
             ]
         )
 
@@ -135,7 +135,7 @@ class TestSecuritySubscorer(unittest.TestCase):
             referenced_schemes=[], # not referenced
             operation_referenced_schemes=[],
             schemes=[
-                (path, scheme)
+                (path, SecuritySchemeProjection.from_model(scheme))
             ]
         )
 
@@ -211,7 +211,7 @@ class TestSecuritySubscorer(unittest.TestCase):
             referenced_schemes=[basic_req], # 3. referenced, but not defined
             operation_referenced_schemes=[],
             schemes=[
-                (path_oauth2, oauth2_scheme)
+                (path_oauth2, SecuritySchemeProjection.from_model(oauth2_scheme))
             ]
         )
 
@@ -230,3 +230,17 @@ class TestSecuritySubscorer(unittest.TestCase):
         self.assertEqual(missing_fields_count, 1)
         self.assertEqual(undefined_count, 1)
         self.assertEqual(unreferenced_count, 1)
+
+
+    def test_requirements_compare_by_name(self):
+        """Test that wrapped requirements are immutable and hashed/compared by name only."""
+
+        operation_req = WrappedSecurityRequirement("basic", ["paths", "/a", "get", "security", "basic"])
+        root_req = WrappedSecurityRequirement("basic", ["security", "basic"])
+
+        self.assertEqual(operation_req, root_req)
+        self.assertEqual(len({operation_req, root_req}), 1)
+        self.assertNotEqual(operation_req, WrappedSecurityRequirement("oauth2", ["security", "oauth2"]))
+
+        with self.assertRaises(AttributeError):
+            operation_req.name = "oauth2"
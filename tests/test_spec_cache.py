@@ -0,0 +1,171 @@
+import os
+import time
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from api_scoring_app.core.cache import CacheEntry
+from api_scoring_app.core.types import ExecutionMode
+from api_scoring_app.core.subscorers import ScoringReport, Issue, IssueSeverity
+from api_scoring_app.infra.engine import ScoringEngine
+from api_scoring_app.infra.cache import DiskSpecCache, cache_key
+from api_scoring_app.infra.subscorers import DescriptionSubscorer, SchemaSubscorer, SecuritySubscorer
+from api_scoring_app.infra.validators import PydanticValidator
+from api_scoring_app.runner.ApiSpecProcessor import APISpecificationProcessor
+
+
+class TestDiskSpecCache(unittest.TestCase):
+    """Test suite for DiskSpecCache."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = self.tmp_dir.name
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _reports(self) -> CacheEntry:
+        report = ScoringReport("subscorer", 10)
+        report.add_issue(Issue(message="message", severity=IssueSeverity.LOW, path="a -> b"))
+        return CacheEntry([report])
+
+    def test_round_trip(self):
+        cache = DiskSpecCache(self.cache_dir)
+
+        self.assertIsNone(cache.get("key"))
+        cache.put("key", self._reports())
+
+        reports = cache.get("key").reports
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(reports[0].subscorer, "subscorer")
+        self.assertEqual(reports[0].issues[0].path, "a -> b")
+
+        self.assertEqual(cache.stats.hits, 1)
+        self.assertEqual(cache.stats.misses, 1)
+
+    def test_corrupted_entry_is_a_miss(self):
+        cache = DiskSpecCache(self.cache_dir)
+        with open(os.path.join(self.cache_dir, "key" + DiskSpecCache.SUFFIX), "wb") as file:
+            file.write(b"not a pickle")
+
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.stats.misses, 1)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_lru_eviction(self):
+        cache = DiskSpecCache(self.cache_dir)
+        cache.put("first", self._reports())
+        entry_size = os.path.getsize(os.path.join(self.cache_dir, "first" + DiskSpecCache.SUFFIX))
+
+        # room for two entries only
+        cache.max_bytes = 2 * entry_size
+        past = time.time() - 100
+        os.utime(os.path.join(self.cache_dir, "first" + DiskSpecCache.SUFFIX), (past, past))
+
+        cache.put("second", self._reports())
+        os.utime(os.path.join(self.cache_dir, "second" + DiskSpecCache.SUFFIX), (past + 1, past + 1))
+
+        # hit refreshes "first", so "second" is least recently used now
+        self.assertIsNotNone(cache.get("first"))
+        cache.put("third", self._reports())
+
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertIsNone(cache.get("second"))
+        self.assertIsNotNone(cache.get("first"))
+        self.assertIsNotNone(cache.get("third"))
+
+
+class TestProcessorCache(unittest.TestCase):
+    """Test suite for caching in APISpecificationProcessor."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.spec_path = os.path.join(os.path.dirname(__file__), "specs/test_known_issues.yaml")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _processor(self, *subscorers) -> APISpecificationProcessor:
+        processor = APISpecificationProcessor(cache=DiskSpecCache(self.tmp_dir.name))
+        for subscorer in subscorers:
+            processor.scoring_engine.add_subscorer(subscorer)
+        return processor
+
+    def test_hit_skips_pipeline(self):
+        first = self._processor(SchemaSubscorer(points=10)).process(self.spec_path)
+
+        processor = self._processor(SchemaSubscorer(points=10))
+        with patch.object(PydanticValidator, "validate") as mock_validate:
+            second = processor.process(self.spec_path)
+
+        mock_validate.assert_not_called()
+        self.assertEqual(processor.cache.stats.hits, 1)
+        self.assertEqual([report.points for report in first], [report.points for report in second])
+
+    def test_key_depends_on_scoring_setup(self):
+        digest = "digest"
+
+        self.assertEqual(
+            cache_key(digest, [SchemaSubscorer(points=10)]),
+            cache_key(digest, [SchemaSubscorer(points=10)])
+        )
+        self.assertNotEqual(
+            cache_key(digest, [SchemaSubscorer(points=10)]),
+            cache_key(digest, [SchemaSubscorer(points=20)])
+        )
+        self.assertNotEqual(
+            cache_key(digest, [SchemaSubscorer(points=10)]),
+            cache_key(digest, [SchemaSubscorer(points=10), SecuritySubscorer(points=10)])
+        )
+
+        # execution settings don't affect results
+        self.assertEqual(
+            cache_key(digest, ScoringEngine(subscorers=[SchemaSubscorer(points=10)])),
+            cache_key(digest, ScoringEngine(subscorers=[SchemaSubscorer(points=10)], execution_mode=ExecutionMode.THREAD, subscorer_timeout=5))
+        )
+
+        # different subscorer set, different entry
+        self._processor(SchemaSubscorer(points=10)).process(self.spec_path)
+        processor = self._processor(SecuritySubscorer(points=10))
+        processor.process(self.spec_path)
+        self.assertEqual(processor.cache.stats.misses, 1)
+
+    def test_referenced_file_change_is_a_miss(self):
+        spec_dir = os.path.join(self.tmp_dir.name, "spec")
+        os.makedirs(spec_dir)
+        spec_path = os.path.join(spec_dir, "spec.yaml")
+        with open(spec_path, "w") as file:
+            file.write(
+                "openapi: 3.1.0\n"
+                "info: {title: refs, version: 1.0.0}\n"
+                "paths:\n"
+                "  /pets:\n"
+                "    get:\n"
+                "      responses:\n"
+                "        '200': {$ref: 'responses.yaml#/Ok'}\n"
+            )
+
+        responses_path = os.path.join(spec_dir, "responses.yaml")
+        with open(responses_path, "w") as file:
+            file.write("Ok: {description: ok}\n")
+
+        first = self._processor(DescriptionSubscorer(points=10)).process(spec_path)
+
+        # unchanged referenced file, cached reports
+        processor = self._processor(DescriptionSubscorer(points=10))
+        processor.process(spec_path)
+        self.assertEqual(processor.cache.stats.hits, 1)
+
+        with open(responses_path, "w") as file:
+            file.write("Ok: {description: Pets of the store, with their owners and tags.}\n")
+
+        processor = self._processor(DescriptionSubscorer(points=10))
+        second = processor.process(spec_path)
+
+        self.assertEqual(processor.cache.stats.misses, 1)
+        self.assertNotEqual([report.points for report in first], [report.points for report in second])
+        self.assertEqual(
+            [report.points for report in second],
+            [report.points for report in APISpecificationProcessor(scoring_engine=ScoringEngine(subscorers=[DescriptionSubscorer(points=10)])).process(spec_path)]
+        )
@@ -1,6 +1,9 @@
 import unittest
 import os
+import gzip
 import json
+import shutil
+import tempfile
 import requests
 
 from unittest.mock import patch, Mock, mock_open
@@ -73,10 +76,37 @@ class TestLocalSpecLoader(unittest.TestCase):
         self.assertEqual(result["info"]["description"], "test description")
         self.assertTrue("paths" in result)
 
+    def test_load_yml_and_compressed_files(self):
+        specs_dir = os.path.join(os.path.dirname(__file__), "specs")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            yml_path = os.path.join(tmp_dir, "test_spec.yml")
+            shutil.copy(os.path.join(specs_dir, "test_spec.yaml"), yml_path)
+
+            for name in ("test_spec.yaml", "test_spec.json"):
+                with open(os.path.join(specs_dir, name), "rb") as src, gzip.open(os.path.join(tmp_dir, name + ".gz"), "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+
+            for name in ("test_spec.yml", "test_spec.yaml.gz", "test_spec.json.gz"):
+                result = LocalSpecLoader(os.path.join(tmp_dir, name)).load()
+
+                self.assertEqual(result["openapi"], "3.0.0")
+                self.assertEqual(result["info"]["title"], "test")
+                self.assertTrue("paths" in result)
+
+    def test_load_yaml_keys_as_strings(self):
+        # response codes are written as plain integers in yaml
+        test_spec_path = os.path.join(os.path.dirname(__file__), "specs/test_known_issues.yaml")
+        loader = LocalSpecLoader(test_spec_path)
+        result = loader.load()
+
+        responses = result["paths"]["/users"]["get"]["responses"]
+        self.assertEqual(list(responses.keys()), ["200"])
+
     @patch('api_scoring_app.infra.utils.spec_loader.os.path.exists')
     @patch('api_scoring_app.infra.utils.spec_loader.os.path.splitext')
     @patch('api_scoring_app.infra.utils.spec_loader.open', new_callable=mock_open, read_data='invalid yaml content')
-    @patch('api_scoring_app.infra.utils.spec_loader.yaml.safe_load')
+    @patch('api_scoring_app.infra.utils.spec_loader.yaml.load')
     def test_load_invalid_yaml_file(self, mock_safe_load: Mock, _: Mock, mock_splitext: Mock, mock_os_path_exists: Mock):
         # setup
         mock_safe_load.side_effect = Exception("Syntax error")
@@ -95,7 +125,7 @@ class TestLocalSpecLoader(unittest.TestCase):
     @patch('api_scoring_app.infra.utils.spec_loader.os.path.exists')
     @patch('api_scoring_app.infra.utils.spec_loader.os.path.splitext')
     @patch('api_scoring_app.infra.utils.spec_loader.open', new_callable=mock_open, read_data='{"invalid": json')
-    @patch('api_scoring_app.infra.utils.spec_loader.json.load')
+    @patch('api_scoring_app.infra.utils.spec_loader.json.loads')
     def test_load_invalid_json_file(self, mock_json_load: Mock, _: Mock, mock_splitext: Mock, mock_os_path_exists: Mock):
         # setup
         mock_json_load.side_effect = Exception("Syntax error")
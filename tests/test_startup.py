@@ -0,0 +1,33 @@
+import unittest
+
+from benchmarks.bench_startup import RUN_PY, SIMPLEST_SPEC_PATH, HEAVY_MODULES, import_profile, imported_modules
+
+# cumulative import time of `api_scoring_app.main`, ~0.1s when heavy modules are left out, ~0.9s otherwise
+MAIN_IMPORT_BUDGET = 0.4
+
+
+class TestStartup(unittest.TestCase):
+    """Test suite for CLI startup cost."""
+
+    def test_help_skips_heavy_imports(self):
+        """Test that `--help` and client mode don't import the scoring pipeline dependencies."""
+
+        for args in ([RUN_PY, "--help"], [RUN_PY, "batch", "--help"], [RUN_PY, "client", "--help"]):
+            self.assertEqual(imported_modules(args) & set(HEAVY_MODULES), set(), args)
+
+
+    def test_local_spec_skips_requests(self):
+        """Test that `requests` is imported only for URL sources."""
+
+        modules = imported_modules([RUN_PY, SIMPLEST_SPEC_PATH])
+
+        self.assertIn("openapi_pydantic", modules)
+        self.assertNotIn("requests", modules)
+
+
+    def test_main_import_budget(self):
+        """Test that importing the CLI entry point stays within its time budget."""
+
+        profile = import_profile(["-c", "import api_scoring_app.main"])
+
+        self.assertLess(profile["api_scoring_app.main"] / 1_000_000, MAIN_IMPORT_BUDGET)
@@ -0,0 +1,65 @@
+import json
+import unittest
+
+from api_scoring_app.infra.utils import BytesSpecLoader
+from api_scoring_app.runner.ProcessorFactory import ProcessorFactory
+from benchmarks.bench_suite import TOTAL_STAGE, run_tier
+from benchmarks.synthetic import SyntheticSpecOptions, generate_spec
+
+
+class TestSyntheticSpec(unittest.TestCase):
+    """Test suite for synthetic spec generator and stage benchmark suite."""
+
+    def test_deterministic(self):
+        """Test that the same options and seed give the same spec, and another seed a different one."""
+
+        options = SyntheticSpecOptions(paths=20)
+
+        self.assertEqual(json.dumps(generate_spec(options)), json.dumps(generate_spec(options)))
+        self.assertNotEqual(
+            json.dumps(generate_spec(options)),
+            json.dumps(generate_spec(SyntheticSpecOptions(paths=20, seed=1)))
+        )
+
+
+    def test_shape(self):
+        """Test that the spec follows the options."""
+
+        spec = generate_spec(SyntheticSpecOptions(paths=12, operations_per_path=4, security_schemes=3, components=5, description_size=25))
+
+        self.assertEqual(len(spec["paths"]), 12)
+        self.assertTrue(all(len(path_item) == 4 for path_item in spec["paths"].values()))
+        self.assertEqual(len(spec["components"]["securitySchemes"]), 3)
+        self.assertEqual(len(spec["components"]["schemas"]), 5)
+        self.assertEqual(len(spec["info"]["description"]), 25)
+
+        inlined = json.dumps(generate_spec(SyntheticSpecOptions(paths=12, component_reuse=0.0))["paths"])
+        self.assertNotIn("$ref", inlined)
+
+
+    def test_scorable(self):
+        """Test that the spec passes validation and every subscorer has findings."""
+
+        data = json.dumps(generate_spec(SyntheticSpecOptions(paths=50))).encode()
+        reports = ProcessorFactory.create().process_loader(BytesSpecLoader(data))
+
+        self.assertEqual(len(reports), 7)
+        for report in reports:
+            self.assertGreater(len(report.issues), 0, report.subscorer)
+
+
+    def test_run_tier(self):
+        """Test that the suite reports every stage and subscorer."""
+
+        results = run_tier(SyntheticSpecOptions(paths=5), repeat=1)
+
+        stages = results["stages"]
+        for name in ["load", "validate", "parse", "score", "report", TOTAL_STAGE]:
+            self.assertIn(name, stages)
+        self.assertEqual(len([name for name in stages if name.startswith("score/subscorer:")]), 7)
+        self.assertIsInstance(stages["parse"]["peak_memory"], int)
+        self.assertGreater(results["spec_bytes"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import json
+import tempfile
+import unittest
+
+from click.testing import CliRunner
+
+from api_scoring_app.main import main
+from api_scoring_app.core.types import ExecutionMode
+from api_scoring_app.infra.instrumentation import Tracer, span, stage
+from api_scoring_app.runner.ProcessorFactory import ProcessorFactory
+
+SPEC_PATH = os.path.join(os.path.dirname(__file__), "specs", "test_known_issues.yaml")
+
+
+class TestTracer(unittest.TestCase):
+    """Test suite for Chrome trace span export."""
+
+    def _names(self, tracer: Tracer, category: str) -> list[str]:
+        return [event["name"] for event in tracer.events if event["ph"] == "X" and event["cat"] == category]
+
+    def test_pipeline_is_traced(self):
+        """Test that stages, parser collectors and subscorer rules are traced."""
+
+        tracer = Tracer()
+        processor = ProcessorFactory.create()
+        with tracer.activate():
+            processor.process(SPEC_PATH)
+
+        stages = self._names(tracer, "stage")
+        for name in ["load", "validate", "resolve", "pydantic", "parse", "score"]:
+            self.assertIn(name, stages)
+        for subscorer in processor.scoring_engine.subscorers:
+            self.assertIn(f"subscorer:{subscorer.name}", stages)
+
+        self.assertEqual(
+            sorted(self._names(tracer, "collector")),
+            sorted(f"collector:{collector.section}" for collector in processor.parser.collectors)
+        )
+        self.assertIn("paths: overlapping", self._names(tracer, "rule"))
+        self.assertIn("load local file", self._names(tracer, "loader"))
+
+        for event in tracer.events:
+            if event["ph"] == "X":
+                self.assertGreaterEqual(event["dur"], 0)
+
+
+    def test_process_pool_events_are_merged(self):
+        """Test that spans recorded by process pool workers end up in caller's trace."""
+
+        tracer = Tracer()
+        processor = ProcessorFactory.create(execution_mode=ExecutionMode.PROCESS)
+        with tracer.activate():
+            processor.process(SPEC_PATH)
+
+        subscorer_events = [event for event in tracer.events if event["name"].startswith("subscorer:")]
+        self.assertEqual(len(subscorer_events), len(processor.scoring_engine.subscorers))
+        self.assertTrue(all(event["pid"] != os.getpid() for event in subscorer_events))
+
+
+    def test_disabled(self):
+        """Test that nothing is recorded outside of active tracer."""
+
+        tracer = Tracer()
+        with span("outside"), stage("outside"):
+            pass
+        ProcessorFactory.create().process(SPEC_PATH)
+
+        self.assertEqual(tracer.events, [])
+
+
+    def test_cli_trace_file(self):
+        """Test that `--trace` writes trace-event JSON next to the regular report."""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            trace_path = os.path.join(tmp_dir, "trace.json")
+            result = CliRunner().invoke(main, [SPEC_PATH, "--trace", trace_path])
+
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn('"total_score"', result.stdout)
+
+            with open(trace_path) as file:
+                trace = json.load(file)
+
+        names = {event["name"] for event in trace["traceEvents"]}
+        self.assertIn("parse", names)
+        self.assertIn("report", names)
+        self.assertIn("misc: tags", names)
+
+
+if __name__ == '__main__':
+    unittest.main()